@@ -1,13 +1,29 @@
 from __future__ import annotations
 
+import codecs
+import contextlib
+import errno
 import hashlib
+import io
 import json
 import os
+import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows: usage is wall time only and rlimits are unavailable.
+    resource = None  # type: ignore[assignment]
+
+STREAM_CHUNK_BYTES = 64 * 1024
+DEFAULT_TAIL_BYTES = 64 * 1024
 
 
 @dataclass(frozen=True)
@@ -55,6 +71,9 @@ class ExecResult:
     returncode: int
     stdout: str
     stderr: str
+    # Set when output was hashed while streaming; stdout/stderr may then hold only a tail.
+    stdout_sha256: str | None = None
+    stderr_sha256: str | None = None
 
     def as_dict(self) -> dict[str, Any]:
         stdout_b = self.stdout.encode("utf-8", errors="replace")
@@ -65,11 +84,203 @@ class ExecResult:
             "returncode": self.returncode,
             "stdout": self.stdout,
             "stderr": self.stderr,
-            "stdout_sha256": hashlib.sha256(stdout_b).hexdigest(),
-            "stderr_sha256": hashlib.sha256(stderr_b).hexdigest(),
+            "stdout_sha256": self.stdout_sha256 or hashlib.sha256(stdout_b).hexdigest(),
+            "stderr_sha256": self.stderr_sha256 or hashlib.sha256(stderr_b).hexdigest(),
+        }
+
+
+@dataclass(frozen=True)
+class StreamDigest:
+    sha256: str
+    size: int
+    tail: bytes
+
+    @property
+    def truncated(self) -> bool:
+        return self.size > len(self.tail)
+
+
+def _drain_pipe(pipe: IO[bytes], sink: IO[bytes] | None, tail_bytes: int | None, text: bool, out: list[StreamDigest]) -> None:
+    # text=True reproduces subprocess text mode (utf-8 with replacement, universal
+    # newlines) incrementally, so digests match hashing the fully captured str.
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True) if text else None
+    h = hashlib.sha256()
+    tail = bytearray()
+    size = 0
+    while True:
+        raw = pipe.read1(STREAM_CHUNK_BYTES)
+        data = decoder.decode(raw, final=not raw).encode("utf-8") if decoder is not None else raw
+        if data:
+            h.update(data)
+            size += len(data)
+            if sink is not None:
+                sink.write(data)
+            tail += data
+            if tail_bytes is not None and len(tail) > tail_bytes:
+                del tail[: len(tail) - tail_bytes]
+        if not raw:
+            break
+    pipe.close()
+    out.append(StreamDigest(sha256=h.hexdigest(), size=size, tail=bytes(tail)))
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Hard limits for one child process; None leaves that resource unlimited.
+
+    cpu_seconds and address_space_bytes become RLIMIT_CPU / RLIMIT_AS on the child
+    (inherited by anything it spawns); wall_seconds kills the child's process group."""
+
+    cpu_seconds: int | None = None
+    address_space_bytes: int | None = None
+    wall_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class ResourceUsage:
+    """Measured cost of one child process, including descendants it waited for."""
+
+    wall_seconds: float
+    cpu_seconds: float | None
+    max_rss_kb: int | None
+    timed_out: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "wall_seconds": round(self.wall_seconds, 3),
+            "cpu_seconds": None if self.cpu_seconds is None else round(self.cpu_seconds, 3),
+            "max_rss_kb": self.max_rss_kb,
+            "timed_out": self.timed_out,
         }
 
 
+def _rlimit_pairs(limits: ResourceLimits | None) -> list[tuple[int, int]]:
+    if limits is None or resource is None:
+        return []
+    pairs = []
+    if limits.cpu_seconds is not None:
+        pairs.append((resource.RLIMIT_CPU, int(limits.cpu_seconds)))
+    if limits.address_space_bytes is not None:
+        pairs.append((resource.RLIMIT_AS, int(limits.address_space_bytes)))
+    return pairs
+
+
+# Sets the limits and then execs the real command in the same process. preexec_fn
+# would do the same between fork and exec, but it is unsafe while other threads
+# run (the scheduler's pool, our own drain and timer threads): the forked child
+# can deadlock on a lock held by a thread that no longer exists.
+_RLIMIT_SHIM = (
+    "import os, resource, sys\n"
+    "for spec in sys.argv[1].split(','):\n"
+    "    which, value = map(int, spec.split(':'))\n"
+    "    resource.setrlimit(which, (value, value))\n"
+    "try:\n"
+    "    os.execv(sys.argv[2], sys.argv[3:])\n"
+    "except OSError as exc:\n"
+    "    sys.stderr.write(f'rlimit shim: cannot exec {sys.argv[2]}: {exc}\\n')\n"
+    "    sys.exit(126)\n"
+)
+
+
+def _limited_argv(argv: Sequence[str], pairs: list[tuple[int, int]], cwd: Path, env: dict[str, str]) -> list[str]:
+    """argv wrapped in the rlimit shim; the binary is resolved here so a missing one
+    still raises FileNotFoundError from Popen's caller, as for an unlimited command."""
+    argv = list(argv)
+    if not pairs:
+        return argv
+    binary = argv[0] if os.sep in argv[0] else shutil.which(argv[0], path=env.get("PATH", os.defpath))
+    if binary is None or not os.path.exists(os.path.join(cwd, binary)):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), argv[0])
+    spec = ",".join(f"{which}:{value}" for which, value in pairs)
+    return [sys.executable, "-I", "-S", "-c", _RLIMIT_SHIM, spec, binary, *argv]
+
+
+def _reap(proc: subprocess.Popen[bytes]) -> tuple[int, float | None, int | None]:
+    """Wait for proc; returns (returncode, cpu seconds, max RSS in KiB) from its rusage."""
+    if not hasattr(os, "wait4"):
+        return proc.wait(), None, None
+    _, status, ru = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux but bytes on macOS.
+    max_rss = ru.ru_maxrss // 1024 if sys.platform == "darwin" else ru.ru_maxrss
+    return proc.returncode, ru.ru_utime + ru.ru_stime, int(max_rss)
+
+
+def stream_process(
+    argv: Sequence[str],
+    *,
+    cwd: Path,
+    env: dict[str, str],
+    stdout_sink: IO[bytes] | None = None,
+    stderr_sink: IO[bytes] | None = None,
+    tail_bytes: int | None = DEFAULT_TAIL_BYTES,
+    text: bool = False,
+    limits: ResourceLimits | None = None,
+) -> tuple[int, StreamDigest, StreamDigest, ResourceUsage]:
+    """Run argv and drain both pipes concurrently into their sinks.
+
+    Output is hashed as it streams; only the last ``tail_bytes`` of each pipe stay in
+    memory (``None`` keeps everything). The child is reaped with wait4 so its rusage
+    is exact even while other commands run in parallel. Raises OSError if the binary
+    cannot be started."""
+    pairs = _rlimit_pairs(limits)
+    wall_limit = limits.wall_seconds if limits is not None else None
+    new_session = wall_limit is not None and os.name == "posix"
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        _limited_argv(argv, pairs, cwd, env),
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=new_session,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        try:
+            if new_session:
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except OSError:
+            pass
+
+    def _expire() -> None:
+        timed_out.set()
+        _kill()
+
+    timer: threading.Timer | None = None
+    if wall_limit is not None:
+        timer = threading.Timer(wall_limit, _expire)
+        timer.daemon = True
+        timer.start()
+    out_digest: list[StreamDigest] = []
+    err_digest: list[StreamDigest] = []
+    err_thread = threading.Thread(target=_drain_pipe, args=(proc.stderr, stderr_sink, tail_bytes, text, err_digest), daemon=True)
+    err_thread.start()
+    try:
+        _drain_pipe(proc.stdout, stdout_sink, tail_bytes, text, out_digest)
+    except BaseException:
+        # Nothing reads stdout any more: a child blocked on the full pipe would
+        # never exit, and the join and reap below would hang.
+        _kill()
+        raise
+    finally:
+        err_thread.join()
+        returncode, cpu_seconds, max_rss_kb = _reap(proc)
+        if timer is not None:
+            timer.cancel()
+    usage = ResourceUsage(
+        wall_seconds=time.monotonic() - started,
+        cpu_seconds=cpu_seconds,
+        max_rss_kb=max_rss_kb,
+        timed_out=timed_out.is_set(),
+    )
+    return returncode, out_digest[0], err_digest[0], usage
+
+
 def build_env(extra_env: dict[str, str] | None = None, policy: EnvPolicy = DEFAULT_ENV_POLICY) -> dict[str, str]:
     env: dict[str, str] = {}
     for key in sorted(policy.allowlist_keys):
@@ -91,20 +302,37 @@ def build_env(extra_env: dict[str, str] | None = None, policy: EnvPolicy = DEFAU
     return env
 
 
-def run_command(name: str, command: list[str], cwd: Path, env: dict[str, str] | None = None, policy: EnvPolicy = DEFAULT_ENV_POLICY) -> ExecResult:
+def run_command(
+    name: str,
+    command: list[str],
+    cwd: Path,
+    env: dict[str, str] | None = None,
+    policy: EnvPolicy = DEFAULT_ENV_POLICY,
+    *,
+    stdout_path: Path | None = None,
+    stderr_path: Path | None = None,
+    tail_bytes: int | None = None,
+) -> ExecResult:
+    """Run a command under the env policy.
+
+    By default the full decoded output is kept on the result. Pass stdout_path/stderr_path
+    to tee output to log files and tail_bytes to bound what is retained in memory; the
+    recorded sha256 always covers the complete stream."""
     run_env = build_env(extra_env=env, policy=policy)
     try:
-        proc = subprocess.run(
-            command,
-            cwd=cwd,
-            env=run_env,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=False,
+        with _open_sink(stdout_path) as out_sink, _open_sink(stderr_path) as err_sink:
+            returncode, out, err, _ = stream_process(
+                command, cwd=cwd, env=run_env, stdout_sink=out_sink, stderr_sink=err_sink, tail_bytes=tail_bytes, text=True
+            )
+        return ExecResult(
+            name=name,
+            command=command,
+            returncode=returncode,
+            stdout=out.tail.decode("utf-8", errors="replace"),
+            stderr=err.tail.decode("utf-8", errors="replace"),
+            stdout_sha256=out.sha256,
+            stderr_sha256=err.sha256,
         )
-        return ExecResult(name=name, command=command, returncode=proc.returncode, stdout=proc.stdout, stderr=proc.stderr)
     except FileNotFoundError:
         binary = command[0] if command else "<empty>"
         return ExecResult(name=name, command=command, returncode=127, stdout="", stderr=f"ENOENT:{binary}")
@@ -113,6 +341,13 @@ def run_command(name: str, command: list[str], cwd: Path, env: dict[str, str] |
         return ExecResult(name=name, command=command, returncode=127, stdout="", stderr=f"OSERROR:{binary}:{exc}")
 
 
+def _open_sink(path: Path | None) -> Any:
+    if path is None:
+        return contextlib.nullcontext()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.open("wb")
+
+
 def python_module_cmd(module: str, *args: str) -> list[str]:
     return [sys.executable, "-m", module, *args]
 
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from ._exec import ResourceLimits, ResourceUsage
+
+MIB = 1024 * 1024
+# Keys in sg.config.json "budgets" that set the default budget of every baseline command.
+DEFAULT_BUDGET_KEYS = {
+    "wall_seconds": "command_wall_seconds",
+    "cpu_seconds": "command_cpu_seconds",
+    "max_rss_mb": "command_max_rss_mb",
+}
+
+
+@dataclass(frozen=True)
+class CommandBudget:
+    """Soft per-command budget: measured usage above it is a VR blocker, not a kill."""
+
+    wall_seconds: float | None = None
+    cpu_seconds: float | None = None
+    max_rss_mb: int | None = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any] | None) -> "CommandBudget":
+        raw = raw or {}
+        return cls(
+            wall_seconds=raw.get("wall_seconds"),
+            cpu_seconds=raw.get("cpu_seconds"),
+            max_rss_mb=raw.get("max_rss_mb"),
+        )
+
+    @classmethod
+    def from_config_budgets(cls, budgets: Mapping[str, int]) -> "CommandBudget":
+        return cls.from_mapping({field: budgets[key] for field, key in DEFAULT_BUDGET_KEYS.items() if key in budgets})
+
+    def over(self, default: "CommandBudget") -> "CommandBudget":
+        """This budget with unset fields taken from default."""
+        return CommandBudget(
+            wall_seconds=self.wall_seconds if self.wall_seconds is not None else default.wall_seconds,
+            cpu_seconds=self.cpu_seconds if self.cpu_seconds is not None else default.cpu_seconds,
+            max_rss_mb=self.max_rss_mb if self.max_rss_mb is not None else default.max_rss_mb,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"wall_seconds": self.wall_seconds, "cpu_seconds": self.cpu_seconds, "max_rss_mb": self.max_rss_mb}
+
+    def violations(self, usage: ResourceUsage | None) -> list[str]:
+        if usage is None:
+            return []
+        out: list[str] = []
+        if usage.timed_out:
+            out.append("wall_limit_killed")
+        if self.wall_seconds is not None and usage.wall_seconds > self.wall_seconds:
+            out.append("wall_seconds")
+        if self.cpu_seconds is not None and usage.cpu_seconds is not None and usage.cpu_seconds > self.cpu_seconds:
+            out.append("cpu_seconds")
+        if self.max_rss_mb is not None and usage.max_rss_kb is not None and usage.max_rss_kb > self.max_rss_mb * 1024:
+            out.append("max_rss_mb")
+        return out
+
+
+def limits_from_mapping(raw: Mapping[str, Any] | None) -> ResourceLimits | None:
+    """Hard limits from a command's "limits" object; None when nothing is limited."""
+    if not raw:
+        return None
+    as_mb = raw.get("address_space_mb")
+    return ResourceLimits(
+        cpu_seconds=raw.get("cpu_seconds"),
+        address_space_bytes=None if as_mb is None else int(as_mb) * MIB,
+        wall_seconds=raw.get("wall_seconds"),
+    )
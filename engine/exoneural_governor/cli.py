@@ -5,14 +5,9 @@ import json
 import sys
 from pathlib import Path
 
-from .config import load_config
-from .inventory import inventory
-from .catalog import validate_catalog
-from .vr import run_vr
-from .release import build_release
-from .util import ensure_dir
-from .repo_model import cli as repo_model_cli
-from .contract_eval import cli as contract_eval_cli
+# Subcommand modules (and jsonschema/yaml behind them) are imported inside the
+# command that needs them: `sg --help` or `sg inventory` must not pay for the
+# VR, release, repo-model and contract-eval import graphs.
 
 
 def _default_config_path() -> Path:
@@ -41,6 +36,10 @@ def _normalize_global_flags(argv: list[str]) -> list[str]:
 
 
 def cmd_inventory(cfg_path: Path) -> int:
+    from .config import load_config
+    from .inventory import inventory
+    from .util import ensure_dir
+
     cfg = load_config(cfg_path)
     out_dir = cfg.repo_root / "artifacts" / "reports" / "inventory"
     ensure_dir(out_dir)
@@ -50,6 +49,9 @@ def cmd_inventory(cfg_path: Path) -> int:
 
 
 def cmd_validate(cfg_path: Path) -> int:
+    from .catalog import validate_catalog
+    from .config import load_config
+
     cfg = load_config(cfg_path)
     rep = validate_catalog(cfg.repo_root)
     print(json.dumps(rep, indent=2, sort_keys=True))
@@ -57,6 +59,9 @@ def cmd_validate(cfg_path: Path) -> int:
 
 
 def cmd_vr(cfg_path: Path, out_path: Path, write_back: bool) -> int:
+    from .config import load_config
+    from .vr import run_vr
+
     cfg = load_config(cfg_path)
     try:
         vr = run_vr(cfg, write_back=False)
@@ -73,14 +78,22 @@ def cmd_vr(cfg_path: Path, out_path: Path, write_back: bool) -> int:
     return 0 if vr.get("status") == "RUN" else 3
 
 
-def cmd_release(cfg_path: Path, vr_path: Path, output_dir: Path) -> int:
+def cmd_release(cfg_path: Path, vr_path: Path, output_dir: Path, *, member_store: bool = False) -> int:
+    from .config import load_config
+    from .release import build_release
+    from .zipwriter import default_member_store
+
     cfg = load_config(cfg_path)
-    rep = build_release(cfg, vr_path=vr_path, output_dir=output_dir)
+    store = default_member_store() if member_store else None
+    rep = build_release(cfg, vr_path=vr_path, output_dir=output_dir, member_store=store)
     print(json.dumps(rep, indent=2, sort_keys=True))
     return 0
 
 
 def cmd_selftest(cfg_path: Path) -> int:
+    from .catalog import validate_catalog
+    from .config import load_config
+
     cfg = load_config(cfg_path)
     rep = validate_catalog(cfg.repo_root)
     if not rep.get("ok"):
@@ -123,6 +136,11 @@ def main(argv: list[str] | None = None) -> None:
         default="artifacts/release",
         help="Directory for release bundle outputs.",
     )
+    rel.add_argument(
+        "--member-store",
+        action="store_true",
+        help="Reuse unchanged compressed members from the member store (AXL_ZIP_STORE or the user cache).",
+    )
     sub.add_parser("selftest", help="Lightweight CI self-test (catalog validation).")
 
     rm = sub.add_parser("repo-model", help="Generate repository architecture model artifact.")
@@ -158,6 +176,7 @@ def main(argv: list[str] | None = None) -> None:
             cfg_path,
             vr_path=Path(args.vr),
             output_dir=Path(args.output),
+            member_store=args.member_store,
         )
     elif args.cmd == "selftest":
         rc = cmd_selftest(cfg_path)
@@ -174,6 +193,8 @@ def main(argv: list[str] | None = None) -> None:
             rm_args.extend(["--exclude-glob", str(g)])
         if args.stdout:
             rm_args.append("--stdout")
+        from .repo_model import cli as repo_model_cli
+
         rc = repo_model_cli(rm_args)
     elif args.cmd == "contract-eval":
         ce_args: list[str] = []
@@ -187,6 +208,8 @@ def main(argv: list[str] | None = None) -> None:
             ce_args.append("--allow-write")
         if args.strict_no_write:
             ce_args.append("--strict-no-write")
+        from .contract_eval import cli as contract_eval_cli
+
         rc = contract_eval_cli(ce_args)
     else:
         raise RuntimeError("unreachable")
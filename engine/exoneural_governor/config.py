@@ -3,8 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-import jsonschema
-
+from .scheduler import CommandSpec, parse_plan
 from .util import read_json
 
 SCHEMA_PATH = Path(__file__).resolve().parents[1] / "configs" / "sg.config.schema.json"
@@ -20,12 +19,16 @@ class Config:
     budgets: dict[str, int]
     redaction_policy_path: Path
     evidence_root_base: Path
+    # Scheduling for baseline_commands; an empty plan runs them one after another.
+    baseline_plan: tuple[CommandSpec, ...] = ()
+    baseline_jobs: int = 1
 
 
 def load_config(path: Path) -> Config:
+    from . import schema_cache  # deferred: jsonschema's ~100 ms import cost is only needed here
+
     raw = read_json(path)
-    schema = read_json(SCHEMA_PATH)
-    jsonschema.validate(instance=raw, schema=schema)
+    schema_cache.validate(raw, SCHEMA_PATH)
 
     # Deterministic path resolution:
     # - repo_root is resolved relative to the config file's directory
@@ -43,11 +46,13 @@ def load_config(path: Path) -> Config:
         q = Path(str(p))
         return (repo_root / q).resolve() if not q.is_absolute() else q.resolve()
 
+    plan = parse_plan(raw["baseline_commands"])
+
     return Config(
         repo_root=repo_root,
         base_branch=str(raw.get("base_branch", "main")),
         allowlist_globs=list(raw["allowlist_globs"]),
-        baseline_commands=[list(cmd) for cmd in raw["baseline_commands"]],
+        baseline_commands=[list(spec.argv) for spec in plan],
         artifact_name=str(raw["artifact_name"]),
         budgets=dict(raw["budgets"]),
         redaction_policy_path=_rel_to_repo(
@@ -56,4 +61,6 @@ def load_config(path: Path) -> Config:
         evidence_root_base=_rel_to_repo(
             str(raw.get("evidence_root_base", "artifacts/evidence"))
         ),
+        baseline_plan=plan,
+        baseline_jobs=int(raw.get("baseline_jobs", 1)),
     )
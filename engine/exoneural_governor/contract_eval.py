@@ -315,21 +315,24 @@ def evaluate_contracts(strict: bool, out_path: Path | None, json_mode: bool, no_
             _gate_put(gates, "GATE_C02_NAME_RECONSTRUCTION_NON_NULL", "PASS" if not missing_names else "FAIL", {"missing": _bounded(missing_names)})
 
             iface_fail: list[str] = []
+            missing_facts: list[str] = []
             for a in agents:
                 p = a.get("path")
                 if not isinstance(p, str):
                     continue
-                fp = repo_root / p
-                if not fp.exists() or not fp.is_file():
-                    continue
-                text = fp.read_text(encoding="utf-8", errors="replace")
-                inputs = a.get("interface", {}).get("inputs", []) if isinstance(a.get("interface"), dict) else []
-                has_parser = fp.suffix in {".py", ".js", ".mjs", ".ts", ".sh", ".bash"} and (
-                    "argparse.ArgumentParser(" in text or "@click.option(" in text or "yargs" in text
-                )
-                if has_parser and not inputs:
+                iface = a.get("interface")
+                detected = iface.get("cli_parser_detected") if isinstance(iface, dict) else None
+                if not isinstance(detected, bool):
+                    # Fail-closed: without the repo-model fact the gate cannot be decided.
+                    missing_facts.append(p)
+                elif detected and not iface.get("inputs"):
                     iface_fail.append(p)
-            _gate_put(gates, "GATE_C03_ZERO_SHOT_INTERFACE_EXTRACTION_MINIMUM", "PASS" if not iface_fail else "FAIL", {"missing_inputs": _bounded(iface_fail)})
+            _gate_put(
+                gates,
+                "GATE_C03_ZERO_SHOT_INTERFACE_EXTRACTION_MINIMUM",
+                "PASS" if not iface_fail and not missing_facts else "FAIL",
+                {"missing_inputs": _bounded(iface_fail), "missing_parser_fact": _bounded(missing_facts)},
+            )
 
             policy_fail = bool(strict and (dangling or parse_failures))
             _gate_put(gates, "GATE_D01_POLICY_TIERS_ENFORCED", "FAIL" if policy_fail else "PASS", {"strict": strict})
@@ -0,0 +1,125 @@
+"""Content-addressed object store that deduplicates evidence trees with hardlinks.
+
+Every evidence file is linked into ``<evidence_root_base>/.objects/<sha[:2]>/<sha>``.
+A file whose bytes already exist there is replaced by a hardlink to the stored
+object, so identical logs and reports from repeated ``sg vr`` runs occupy disk
+once. Run directories stay ordinary trees (same paths, bytes and sizes), which
+keeps manifests and release archives unchanged.
+
+Because linked files share an inode with the store, a run directory must be
+detached before it is written again; ``detach_tree`` unlinks shared files and
+leaves the store copy to the other runs that reference it.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+from . import hashcache
+
+OBJECTS_DIRNAME = ".objects"
+STORE_ENV = "AXL_EVIDENCE_STORE"
+
+
+@dataclass(frozen=True)
+class DedupReport:
+    files: int
+    stored: int
+    linked: int
+    bytes_shared: int
+
+    def as_dict(self) -> dict:
+        return {"files": self.files, "stored": self.stored, "linked": self.linked, "bytes_shared": self.bytes_shared}
+
+
+def store_enabled() -> bool:
+    return os.environ.get(STORE_ENV, "").strip().lower() not in {"0", "off", "false", "no"}
+
+
+class EvidenceStore:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @classmethod
+    def for_base(cls, evidence_root_base: Path) -> "EvidenceStore":
+        return cls(evidence_root_base / OBJECTS_DIRNAME)
+
+    def object_path(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256
+
+    def adopt(self, path: Path, sha256: str) -> str:
+        """Share path's inode with the store. Returns "stored", "linked", "shared" or "kept"."""
+        obj = self.object_path(sha256)
+        try:
+            st = path.stat()
+            try:
+                ost = obj.stat()
+            except FileNotFoundError:
+                ost = None
+            if ost is not None:
+                if (ost.st_dev, ost.st_ino) == (st.st_dev, st.st_ino):
+                    return "shared"
+                if ost.st_size != st.st_size or hashcache.sha256_file(obj) != sha256:
+                    # Someone edited a linked copy in place; drop the damaged object.
+                    obj.unlink()
+                    ost = None
+            if ost is None:
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.link(path, obj)
+                    return "stored"
+                except FileExistsError:
+                    pass  # a concurrent run stored the same bytes first
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.link")
+            os.link(obj, tmp)
+            os.replace(tmp, path)
+            return "linked"
+        except OSError:
+            # No hardlinks here (cross-device, unsupported filesystem): keep the private copy.
+            return "kept"
+
+    def dedup_tree(self, tree: Path, digests: Mapping[str, str] | None = None) -> DedupReport:
+        """Adopt every file under tree; digests maps posix relative paths to known sha256s."""
+        digests = digests or {}
+        counts = {"stored": 0, "linked": 0, "shared": 0, "kept": 0}
+        shared_bytes = 0
+        files = sorted((p for p in tree.rglob("*") if p.is_file()), key=lambda p: p.as_posix())
+        for p in files:
+            rel = p.relative_to(tree).as_posix()
+            outcome = self.adopt(p, digests.get(rel) or hashcache.sha256_file(p))
+            counts[outcome] += 1
+            if outcome in {"linked", "shared"}:
+                shared_bytes += p.stat().st_size
+        return DedupReport(files=len(files), stored=counts["stored"], linked=counts["linked"] + counts["shared"], bytes_shared=shared_bytes)
+
+    def prune(self) -> int:
+        """Remove objects no run directory links to any more; returns the number removed."""
+        removed = 0
+        if not self.root.exists():
+            return 0
+        for obj in self.root.glob("*/*"):
+            try:
+                if obj.is_file() and obj.stat().st_nlink == 1:
+                    obj.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+def detach_tree(tree: Path) -> int:
+    """Unlink files under tree that share an inode with other paths; returns the count."""
+    detached = 0
+    if not tree.exists():
+        return 0
+    for p in tree.rglob("*"):
+        try:
+            if p.is_file() and p.stat().st_nlink > 1:
+                p.unlink()
+                detached += 1
+        except OSError:
+            continue
+    return detached
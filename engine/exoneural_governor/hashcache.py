@@ -0,0 +1,192 @@
+"""Stat-keyed sha256 cache shared by the engine's hashing tools.
+
+A file's digest is stored in a local SQLite database under the key
+(st_dev, st_ino, st_size, st_mtime_ns, st_ctime_ns). Any write, rename-over or
+chmod changes at least one of those fields, so a hit means the bytes have not
+changed since they were hashed. The cache is an optimisation only: if it cannot
+be opened or written, hashing falls back to reading the file.
+
+Stdlib-only on purpose; the standalone engine scripts import it. ``udgs_core``
+does not depend on the engine and does not use this cache: its QA8 loop keeps
+per-root stat snapshots instead (``udgs_core.anchors.StatState``).
+
+Environment:
+    AXL_HASH_CACHE   path of the SQLite file, or ``off`` to disable caching
+    AXL_HASH_VERIFY  ``1`` rehashes every file and refreshes its cache entry
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+CACHE_ENV = "AXL_HASH_CACHE"
+VERIFY_ENV = "AXL_HASH_VERIFY"
+CHUNK_BYTES = 1024 * 1024
+# Files at least this large are hashed straight from a read-only mapping: one
+# update call, no buffer copies, and the GIL is released for the whole file.
+MMAP_MIN_BYTES = 8 * 1024 * 1024
+# A file modified this close to the hash may be written again within the same
+# timestamp tick; such digests are returned but never cached.
+RACY_WINDOW_NS = 2_000_000_000
+
+_DISABLED = {"", "0", "off", "false", "no"}
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS file_hash ("
+    " dev INTEGER NOT NULL, ino INTEGER NOT NULL, size INTEGER NOT NULL,"
+    " mtime_ns INTEGER NOT NULL, ctime_ns INTEGER NOT NULL, sha256 TEXT NOT NULL,"
+    " PRIMARY KEY (dev, ino))"
+)
+
+
+def hash_file(path: str | os.PathLike[str], *, chunk_size: int = CHUNK_BYTES) -> str:
+    """Uncached sha256 of the file's bytes."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+                return h.hexdigest()
+            except (OSError, ValueError):
+                # Not mappable (special file, exotic filesystem): stream it instead.
+                h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_home() -> Path:
+    """Per-user cache directory shared by the repo's local caches."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "agentx-lab"
+
+
+def default_cache_path() -> Path | None:
+    raw = os.environ.get(CACHE_ENV)
+    if raw is not None:
+        return None if raw.strip().lower() in _DISABLED else Path(raw).expanduser()
+    return cache_home() / "hashcache.sqlite3"
+
+
+def _verify_from_env() -> bool:
+    return os.environ.get(VERIFY_ENV, "").strip().lower() not in _DISABLED
+
+
+class HashCache:
+    """sha256 digests memoised by file identity and stat fingerprint.
+
+    Safe to share between threads; a forked child reopens its own connection.
+    ``db_path=None`` gives a pass-through cache that always hashes."""
+
+    def __init__(self, db_path: Path | None, *, verify: bool = False) -> None:
+        self.db_path = db_path
+        self.verify = verify
+        self.hits = 0
+        self.misses = 0
+        self.bytes_hashed = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = -1
+        self._broken = db_path is None
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._broken:
+            return None
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        assert self.db_path is not None
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+        except (OSError, sqlite3.Error):
+            self._broken = True
+            return None
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def _lookup(self, st: os.stat_result) -> str | None:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT sha256 FROM file_hash WHERE dev=? AND ino=? AND size=? AND mtime_ns=? AND ctime_ns=?",
+                    (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+
+    def _store(self, st: os.stat_result, digest: str) -> None:
+        if time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) < RACY_WINDOW_NS:
+            return
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO file_hash (dev, ino, size, mtime_ns, ctime_ns, sha256) VALUES (?, ?, ?, ?, ?, ?)",
+                    (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns, digest),
+                )
+            except sqlite3.Error:
+                pass
+
+    def sha256_file(self, path: str | os.PathLike[str], *, verify: bool | None = None, chunk_size: int = CHUNK_BYTES) -> str:
+        st = os.stat(path)
+        if not (self.verify if verify is None else verify):
+            cached = self._lookup(st)
+            if cached is not None:
+                with self._lock:
+                    self.hits += 1
+                return cached
+        with self._lock:
+            self.misses += 1
+            self.bytes_hashed += st.st_size
+        digest = hash_file(path, chunk_size=chunk_size)
+        # Only trust the digest if the file did not change while it was read.
+        after = os.stat(path)
+        if (after.st_size, after.st_mtime_ns, after.st_ctime_ns) == (st.st_size, st.st_mtime_ns, st.st_ctime_ns):
+            self._store(st, digest)
+        return digest
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+_DEFAULT: HashCache | None = None
+_DEFAULT_KEY: tuple[str | None, ...] | None = None
+_DEFAULT_LOCK = threading.Lock()
+# The environment that decides the default cache; the path itself is only
+# resolved when one of these changes (Path.home() is too slow to call per file).
+_ENV_KEYS = (CACHE_ENV, VERIFY_ENV, "XDG_CACHE_HOME", "HOME")
+
+
+def default_cache() -> HashCache:
+    """Process-wide cache configured from the environment (re-read on change)."""
+    global _DEFAULT, _DEFAULT_KEY
+    key = tuple(os.environ.get(k) for k in _ENV_KEYS)
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None or _DEFAULT_KEY != key:
+            if _DEFAULT is not None:
+                _DEFAULT.close()
+            _DEFAULT, _DEFAULT_KEY = HashCache(default_cache_path(), verify=_verify_from_env()), key
+        return _DEFAULT
+
+
+def sha256_file(path: str | os.PathLike[str], *, verify: bool | None = None, chunk_size: int = CHUNK_BYTES) -> str:
+    """sha256 of the file's bytes, served from the shared cache when the stat key matches."""
+    return default_cache().sha256_file(path, verify=verify, chunk_size=chunk_size)
@@ -21,7 +21,7 @@ def inventory(repo_root: Path, out_dir: Path) -> dict:
             stdout_path=out_dir / f"cmd{i}.stdout.txt",
             stderr_path=out_dir / f"cmd{i}.stderr.txt",
         )
-        results.append(res.__dict__)
+        results.append(res.as_dict())
 
     inv = {
         "utc": utc_now_iso(),
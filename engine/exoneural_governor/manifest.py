@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
@@ -14,16 +16,25 @@ class ManifestEntry:
     size_bytes: int
 
 
-def build_manifest(root: Path, *, include_globs: Iterable[str] | None = None) -> dict:
-    """Create a sha256 manifest for all files under root (deterministic order)."""
-    entries: list[ManifestEntry] = []
-    for p in sorted(
+def _entry(root: Path, p: Path) -> ManifestEntry:
+    size = p.stat().st_size
+    return ManifestEntry(path=p.relative_to(root).as_posix(), sha256=sha256_file(p), size_bytes=size)
+
+
+def build_manifest(root: Path, *, include_globs: Iterable[str] | None = None, workers: int | None = None) -> dict:
+    """Create a sha256 manifest for all files under root (deterministic order).
+
+    Files are hashed on ``workers`` threads (default: CPU count); sha256 releases
+    the GIL, so several files are in flight at once. Entries keep sorted path order."""
+    files = sorted(
         [x for x in root.rglob("*") if x.is_file()], key=lambda x: x.as_posix()
-    ):
-        rel = p.relative_to(root).as_posix()
-        entries.append(
-            ManifestEntry(path=rel, sha256=sha256_file(p), size_bytes=p.stat().st_size)
-        )
+    )
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or len(files) <= 1:
+        entries = [_entry(root, p) for p in files]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            entries = list(pool.map(lambda p: _entry(root, p), files))
 
     obj = {
         "utc": utc_now_iso(),
@@ -0,0 +1,162 @@
+"""Input-hash memoization of VR baseline commands.
+
+A command that declares ``inputs`` in sg.config.json gets an input digest over:
+the argv, the sha256 of every declared input file (plus any argv element that is
+a file in the repo), the environment produced by ``_exec.build_env`` and a
+toolchain stamp (the resolved executable and its sha256, the interpreter running
+the engine, the distributions installed for it and the repo's dependency
+lockfiles). When a previous run with the same digest succeeded within the
+current budget, its redacted logs are restored from the evidence object store
+and its record is reused, marked as a cache hit that points at the original run.
+Commands without declared inputs always run.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.metadata
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Sequence
+
+from . import hashcache
+from ._exec import build_env
+from .evidence_store import EvidenceStore
+from .util import read_json, sha256_bytes, utc_now_iso, write_json
+
+MEMO_SCHEMA = "vr-memo/1"
+MEMO_DIRNAME = ".memo"
+MEMO_ENV = "AXL_VR_MEMO"
+_GLOB_CHARS = set("*?[")
+# Dependency pins at the repo root that go into the toolchain stamp.
+LOCKFILE_GLOBS = (
+    "requirements*.txt",
+    "requirements*.lock",
+    "poetry.lock",
+    "uv.lock",
+    "Pipfile.lock",
+    "package-lock.json",
+)
+
+
+def memo_enabled() -> bool:
+    return os.environ.get(MEMO_ENV, "").strip().lower() not in {"0", "off", "false", "no"}
+
+
+def expand_inputs(repo_root: Path, patterns: Sequence[str]) -> list[Path]:
+    """Files named by input patterns (paths, directories or globs relative to repo_root)."""
+    found: set[Path] = set()
+    for pat in patterns:
+        if _GLOB_CHARS & set(pat):
+            matches = list(repo_root.glob(pat))
+        else:
+            matches = [repo_root / pat]
+        for m in matches:
+            if m.is_dir():
+                found.update(p for p in m.rglob("*") if p.is_file())
+            elif m.is_file():
+                found.add(m)
+    return sorted(found, key=lambda p: p.as_posix())
+
+
+@functools.cache
+def installed_packages_digest() -> str:
+    """Digest of the (name, version) of every distribution the engine's interpreter can import."""
+    dists = sorted({((d.metadata["Name"] or "").lower(), d.version or "") for d in importlib.metadata.distributions()})
+    return sha256_bytes(json.dumps(dists, separators=(",", ":")).encode("utf-8"))
+
+
+def lockfile_digests(repo_root: Path) -> dict[str, str]:
+    found = {p for pat in LOCKFILE_GLOBS for p in repo_root.glob(pat) if p.is_file()}
+    return {p.name: hashcache.sha256_file(p) for p in sorted(found)}
+
+
+def toolchain_stamp(argv: Sequence[str], env: dict[str, str], repo_root: Path) -> dict[str, Any]:
+    resolved = shutil.which(argv[0], path=env.get("PATH")) if argv else None
+    real = os.path.realpath(resolved) if resolved else None
+    return {
+        "argv0": argv[0] if argv else None,
+        "resolved": real,
+        "sha256": hashcache.sha256_file(real) if real and os.path.isfile(real) else None,
+        "engine_python": sys.version,
+        "packages": installed_packages_digest(),
+        "lockfiles": lockfile_digests(repo_root),
+    }
+
+
+def input_digest(repo_root: Path, argv: Sequence[str], inputs: Sequence[str]) -> str | None:
+    """Digest of everything the command is declared to depend on; None if it declares nothing."""
+    if not inputs:
+        return None
+    files = expand_inputs(repo_root, inputs)
+    for arg in argv[1:]:
+        candidate = repo_root / arg
+        if not os.path.isabs(arg) and candidate.is_file():
+            files.append(candidate)
+    env = build_env()
+    payload = {
+        "schema": MEMO_SCHEMA,
+        "argv": list(argv),
+        "inputs": {p.relative_to(repo_root).as_posix(): hashcache.sha256_file(p) for p in sorted(set(files))},
+        "env": env,
+        "toolchain": toolchain_stamp(argv, env, repo_root),
+    }
+    return sha256_bytes(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+class MemoStore:
+    def __init__(self, root: Path, objects: EvidenceStore | None) -> None:
+        self.root = root
+        self.objects = objects
+
+    @classmethod
+    def for_base(cls, evidence_root_base: Path, objects: EvidenceStore | None) -> "MemoStore":
+        return cls(evidence_root_base / MEMO_DIRNAME, objects)
+
+    def _path(self, digest: str) -> Path:
+        return self.root / f"{digest}.json"
+
+    def lookup(self, digest: str) -> dict[str, Any] | None:
+        path = self._path(digest)
+        if not path.exists():
+            return None
+        try:
+            entry = read_json(path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("schema") != MEMO_SCHEMA or entry.get("input_digest") != digest:
+            return None
+        return entry
+
+    def save(self, digest: str, *, record: dict[str, Any], work_id: str, evidence_root: Path, log_sha256: dict[str, str]) -> None:
+        write_json(
+            self._path(digest),
+            {
+                "schema": MEMO_SCHEMA,
+                "input_digest": digest,
+                "utc": utc_now_iso(),
+                "work_id": work_id,
+                "evidence_root": str(evidence_root),
+                "record": record,
+                "logs": log_sha256,
+            },
+        )
+
+    def restore_log(self, sha256: str, source: Path, dest: Path) -> bool:
+        """Put the bytes with this digest at dest, from the object store or the original run."""
+        candidates = [source]
+        if self.objects is not None:
+            candidates.insert(0, self.objects.object_path(sha256))
+        for cand in candidates:
+            try:
+                if cand.is_file() and hashcache.sha256_file(cand) == sha256:
+                    if not (dest.exists() and os.path.samefile(cand, dest)):
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        shutil.copyfile(cand, dest)
+                    return True
+            except OSError:
+                continue
+        return False
@@ -1,11 +1,34 @@
 from __future__ import annotations
 
+import codecs
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
 import yaml
 
-from .util import redact_bytes
+from .util import read_json, sha256_bytes, sha256_file, write_json
+
+REDACTION_MARKER = "[REDACTED]"
+REDACTION_STATE_SCHEMA = "redaction-state/1"
+# Below this many files a process pool costs more to start than it saves.
+PARALLEL_MIN_FILES = 64
+SCAN_CHUNK_BYTES = 4 * 1024 * 1024
+# Matches spanning a chunk boundary are found as long as they fit in this window.
+# A longer match that straddles a boundary is missed by the screen and may be cut
+# by the substitution pass; no shipped rule comes close to this length.
+SCAN_OVERLAP_CHARS = 1024 * 1024
+
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+_LEADING_GROUP = re.compile(r"\((?:\?:|\?P<\w+>)?")
+_LITERAL_RUN = re.compile(r"[A-Za-z0-9_]+")
+# Constructs whose meaning depends on where the searched text starts or ends,
+# or on text beyond the match (lookarounds).
+_POSITIONAL = re.compile(r"(?<!\[)\^|\$|\\[AZG]|\(\?<?[=!]")
 
 
 def load_redaction_patterns(path: Path) -> list[str]:
@@ -21,14 +44,281 @@ def load_redaction_patterns(path: Path) -> list[str]:
     return list(pats)
 
 
-def redact_file_inplace(path: Path, patterns: Iterable[str]) -> None:
-    path.write_bytes(redact_bytes(path.read_bytes(), patterns))
+def _group_spans(body: str) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """(open, close) index pairs of groups and (position, depth) of top-level-ish '|'."""
+    groups: list[tuple[int, int]] = []
+    bars: list[tuple[int, int]] = []
+    stack: list[int] = []
+    i = 0
+    in_class = False
+    while i < len(body):
+        ch = body[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+            if body[i + 1 : i + 2] == "]":
+                i += 1
+        elif ch == "(":
+            stack.append(i)
+        elif ch == ")" and stack:
+            groups.append((stack.pop(), i))
+        elif ch == "|":
+            bars.append((i, len(stack)))
+        i += 1
+    return groups, bars
+
+
+def _required_literal(pattern: str) -> tuple[str, bool] | None:
+    """A literal every match of pattern must contain, and whether it is case-insensitive.
+
+    Deliberately conservative: anything that is not a plain leading literal (possibly
+    inside unquantified leading groups, with no alternation around it) yields None."""
+    m = _LEADING_FLAGS.match(pattern)
+    flags = m.group(1) if m else ""
+    body = pattern[m.end() :] if m else pattern
+    pos = 0
+    opened: list[int] = []
+    while (g := _LEADING_GROUP.match(body, pos)) is not None:
+        opened.append(pos)
+        pos = g.end()
+    run = _LITERAL_RUN.match(body, pos)
+    if run is None:
+        return None
+    literal = run.group(0)
+    if body[run.end() : run.end() + 1] in {"?", "*", "{"}:
+        literal = literal[:-1]
+    groups, bars = _group_spans(body)
+    if not literal or any(depth <= len(opened) for _, depth in bars):
+        return None
+    closes = {o: c for o, c in groups}
+    for o in opened:
+        c = closes.get(o)
+        if c is None or body[c + 1 : c + 2] in {"?", "*", "{"}:
+            return None
+    return (literal.lower(), True) if "i" in flags else (literal, False)
+
+
+class _Rule:
+    __slots__ = ("regex", "literal", "ignorecase", "positional")
+
+    def __init__(self, pattern: str) -> None:
+        try:
+            self.regex = re.compile(pattern)
+        except re.error:
+            # Fail-closed: invalid regex is a configuration defect.
+            raise ValueError(f"Invalid redaction regex: {pattern!r}")
+        req = _required_literal(pattern)
+        self.literal, self.ignorecase = req if req is not None else (None, False)
+        self.positional = _POSITIONAL.search(pattern) is not None
+
+    def may_match(self, text: str, lowered: str | None) -> bool:
+        """False only when the rule's required literal is provably absent from text."""
+        if self.literal is None:
+            return True
+        if not self.ignorecase:
+            return self.literal in text
+        # Non-ASCII text (lowered None) skips this shortcut: IGNORECASE also folds
+        # characters such as U+0131 and U+017F onto ASCII letters.
+        return lowered is None or self.literal in lowered
+
+
+class RedactionEngine:
+    """Redaction rules compiled once and applied in a single streaming pass per file.
+
+    Each rule carries the literal that every one of its matches must contain, so a
+    window of text is screened with C-level substring checks and a rule's regex only
+    runs where its literal shows up. Texts where no rule fires are left untouched;
+    texts with hits replay the rules in policy order, which keeps the output
+    byte-for-byte equal to ``util.redact_bytes`` even when rules overlap.
+
+    Files with hits are rewritten segment by segment. Segments end at a newline at
+    least ``SCAN_OVERLAP_CHARS`` before the end of the decoded window, moved back
+    whenever a rule match found in that window would straddle the cut. Limits: a
+    match longer than the overlap window can still be split, a single line is held
+    in memory whole, and policies with anchors or lookarounds (whose meaning changes
+    at a segment edge) fall back to redacting the whole file in memory."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = tuple(patterns)
+        self._rules = [_Rule(p) for p in self.patterns]
+        self._needs_lower = any(r.ignorecase for r in self._rules)
+        self._segmentable = not any(r.positional for r in self._rules)
+
+    def _lowered(self, text: str) -> str | None:
+        return text.lower() if self._needs_lower and text.isascii() else None
+
+    def fires(self, text: str) -> bool:
+        """True when at least one rule matches somewhere in text."""
+        lowered = self._lowered(text)
+        return any(rule.may_match(text, lowered) and rule.regex.search(text) is not None for rule in self._rules)
+
+    def redact_text(self, text: str) -> str:
+        if not self.fires(text):
+            return text
+        lowered = self._lowered(text)
+        for rule in self._rules:
+            # Checked against the text as rewritten so far: a rule whose literal is
+            # absent there would substitute nothing.
+            if not rule.may_match(text, lowered):
+                continue
+            redacted = rule.regex.sub(REDACTION_MARKER, text)
+            if redacted is not text:
+                text = redacted
+                lowered = self._lowered(text)
+        return text
+
+    def redact_bytes(self, data: bytes) -> bytes:
+        return self.redact_text(data.decode("utf-8", errors="replace")).encode("utf-8")
+
+    def _scan_clean(self, path: Path) -> str | None:
+        """sha256 of path when redaction would be a no-op (valid UTF-8, no rule fires)."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
+        digest = hashlib.sha256()
+        carry = ""
+        with path.open("rb") as f:
+            while True:
+                raw = f.read(SCAN_CHUNK_BYTES)
+                digest.update(raw)
+                try:
+                    window = carry + decoder.decode(raw, final=not raw)
+                except UnicodeDecodeError:
+                    return None
+                if self.fires(window):
+                    return None
+                if not raw:
+                    return digest.hexdigest()
+                carry = window[-SCAN_OVERLAP_CHARS:]
+
+    def _safe_cut(self, text: str) -> int:
+        """End of the next segment of text that can be redacted on its own (0: none yet)."""
+        limit = len(text) - SCAN_OVERLAP_CHARS
+        cut = text.rfind("\n", 0, limit) + 1 if limit > 0 else 0
+        if cut == 0:
+            return 0
+        base = max(0, cut - SCAN_OVERLAP_CHARS)
+        window = text[base:]
+        lowered = self._lowered(window)
+        rules = [rule for rule in self._rules if rule.may_match(window, lowered)]
+        moved = True
+        while moved and cut > base:
+            moved = False
+            for rule in rules:
+                for m in rule.regex.finditer(window):
+                    if base + m.start() < cut < base + m.end():
+                        cut = text.rfind("\n", 0, base + m.start()) + 1
+                        moved = True
+                        break
+        return cut if cut > base or base == 0 else 0
+
+    def _redact_segments(self, path: Path) -> tuple[bool, str]:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        before = hashlib.sha256()
+        after = hashlib.sha256()
+        tmp = path.with_name(f".{path.name}.redact.tmp")
+        pending = ""
+        try:
+            with path.open("rb") as src, tmp.open("wb") as out:
+                while True:
+                    raw = src.read(SCAN_CHUNK_BYTES)
+                    before.update(raw)
+                    pending += decoder.decode(raw, final=not raw)
+                    cut = self._safe_cut(pending) if raw else len(pending)
+                    if cut:
+                        data = self.redact_text(pending[:cut]).encode("utf-8")
+                        after.update(data)
+                        out.write(data)
+                        pending = pending[cut:]
+                    if not raw:
+                        break
+            changed = before.digest() != after.digest()
+            if changed:
+                os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return changed, after.hexdigest()
+
+    def redact_file_digest(self, path: Path) -> tuple[bool, str]:
+        """Redact path in place; returns (changed, sha256 of the resulting bytes)."""
+        clean = self._scan_clean(path)
+        if clean is not None:
+            return False, clean
+        if self._segmentable:
+            return self._redact_segments(path)
+        before = path.read_bytes()
+        after = self.redact_bytes(before)
+        if after != before:
+            path.write_bytes(after)
+        return after != before, sha256_bytes(after)
+
+    def redact_file(self, path: Path) -> bool:
+        """Redact path in place; returns True when its bytes changed."""
+        return self.redact_file_digest(path)[0]
+
+
+def rules_digest(patterns: Iterable[str]) -> str:
+    return sha256_bytes(json.dumps(list(patterns), ensure_ascii=False).encode("utf-8"))
+
+
+_WORKER_ENGINE: RedactionEngine | None = None
+
+
+def _init_worker(patterns: tuple[str, ...]) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = RedactionEngine(patterns)
+
+
+def _redact_job(job: tuple[str, str | None]) -> tuple[bool, str]:
+    path, known_sha = job
+    assert _WORKER_ENGINE is not None
+    return _process_file(_WORKER_ENGINE, Path(path), known_sha)
+
+
+def _process_file(engine: RedactionEngine, path: Path, known_sha: str | None) -> tuple[bool, str]:
+    if known_sha is not None:
+        # Already redacted under these rules and untouched since: skip the scan.
+        current = sha256_file(path)
+        if current == known_sha:
+            return False, current
+    return engine.redact_file_digest(path)
+
+
+def _load_state(state_path: Path | None, rules_sha256: str) -> dict[str, str]:
+    if state_path is None or not state_path.exists():
+        return {}
+    try:
+        state = read_json(state_path)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict) or state.get("schema") != REDACTION_STATE_SCHEMA or state.get("rules_sha256") != rules_sha256:
+        return {}
+    files = state.get("files")
+    return {k: v for k, v in files.items() if isinstance(k, str) and isinstance(v, str)} if isinstance(files, dict) else {}
+
+
+def redact_file_inplace(path: Path, patterns: Iterable[str] | RedactionEngine) -> None:
+    engine = patterns if isinstance(patterns, RedactionEngine) else RedactionEngine(patterns)
+    engine.redact_file(path)
 
 
 def redact_tree(
-    root: Path, patterns: Iterable[str], *, include_exts: set[str] | None = None
+    root: Path,
+    patterns: Iterable[str] | RedactionEngine,
+    *,
+    include_exts: set[str] | None = None,
+    workers: int | None = None,
+    state_path: Path | None = None,
 ) -> list[str]:
-    changed: list[str] = []
+    """Redact matching files under root in place; returns changed paths in sorted order.
+
+    Files are spread over ``workers`` processes (default: CPU count). With
+    ``state_path`` a sidecar records each file's sha256 after redaction together with
+    the rules digest, and files still matching that record are skipped next time. Keep
+    the sidecar outside root so it never lands in the evidence manifest."""
+    engine = patterns if isinstance(patterns, RedactionEngine) else RedactionEngine(patterns)
     include_exts = include_exts or {
         ".txt",
         ".log",
@@ -39,11 +329,30 @@ def redact_tree(
         ".yml",
         ".yaml",
     }
-    for p in sorted(root.rglob("*"), key=lambda x: x.as_posix()):
-        if p.is_file() and p.suffix.lower() in include_exts:
-            before = p.read_bytes()
-            after = redact_bytes(before, patterns)
-            if after != before:
-                p.write_bytes(after)
-                changed.append(str(p))
-    return changed
+    files = [
+        p
+        for p in sorted(root.rglob("*"), key=lambda x: x.as_posix())
+        if p.is_file() and p.suffix.lower() in include_exts
+    ]
+    rels = [p.relative_to(root).as_posix() for p in files]
+    rules_sha256 = rules_digest(engine.patterns)
+    known = _load_state(state_path, rules_sha256)
+    jobs = [(str(p), known.get(rel)) for p, rel in zip(files, rels)]
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers <= 1 or len(jobs) < PARALLEL_MIN_FILES:
+        results = [_process_file(engine, Path(path), sha) for path, sha in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(engine.patterns,)) as pool:
+            results = list(pool.map(_redact_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+    if state_path is not None:
+        write_json(
+            state_path,
+            {
+                "schema": REDACTION_STATE_SCHEMA,
+                "rules_sha256": rules_sha256,
+                "files": {rel: sha for rel, (_, sha) in zip(rels, results)},
+            },
+        )
+    return [str(p) for p, (changed, _) in zip(files, results) if changed]
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import json
-import zipfile
 from pathlib import Path
 
 from .config import Config
 from .manifest import write_manifest
 from .util import ensure_dir, utc_now_iso
+from .zipwriter import MemberStore, write_zip
 
 
 INCLUDE_DEFAULT = [
@@ -24,7 +24,12 @@ INCLUDE_DEFAULT = [
 
 
 def build_release(
-    cfg: Config, *, vr_path: Path | None = None, output_dir: Path | None = None
+    cfg: Config,
+    *,
+    vr_path: Path | None = None,
+    output_dir: Path | None = None,
+    workers: int | None = None,
+    member_store: MemberStore | None = None,
 ) -> dict:
     repo_root = cfg.repo_root.resolve()
     ts = utc_now_iso().replace(":", "").replace("Z", "Z")
@@ -59,34 +64,38 @@ def build_release(
     zip_name = f"{cfg.artifact_name}-{ts}.zip"
     zip_path = release_dir / zip_name
 
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        for item in INCLUDE_DEFAULT:
-            src = repo_root / item
-            if src.is_dir():
-                for p in sorted(
-                    [x for x in src.rglob("*") if x.is_file()],
-                    key=lambda x: x.as_posix(),
-                ):
-                    z.write(p, arcname=p.relative_to(repo_root).as_posix())
-            elif src.is_file():
-                z.write(src, arcname=src.relative_to(repo_root).as_posix())
+    members: list[tuple[str, Path]] = []
+    for item in INCLUDE_DEFAULT:
+        src = repo_root / item
+        if src.is_dir():
+            for p in sorted(
+                [x for x in src.rglob("*") if x.is_file()],
+                key=lambda x: x.as_posix(),
+            ):
+                members.append((p.relative_to(repo_root).as_posix(), p))
+        elif src.is_file():
+            members.append((src.relative_to(repo_root).as_posix(), src))
 
-        if evidence_root_path is not None:
-            epath = evidence_root_path
-            if epath.exists() and epath.is_dir():
-                for p in sorted(
-                    [x for x in epath.rglob("*") if x.is_file()],
-                    key=lambda x: x.as_posix(),
-                ):
-                    if not p.resolve().is_relative_to(
-                        epath
-                    ) or not p.resolve().is_relative_to(repo_root):
-                        raise ValueError(
-                            "E_EVIDENCE_PATH_OUTSIDE_REPO: evidence file escaped allowed roots"
-                        )
-                    # include under evidence/ to keep release small and explicit
-                    z.write(p, arcname=("evidence/" + p.relative_to(epath).as_posix()))
-                    evidence_files_included += 1
+    if evidence_root_path is not None:
+        epath = evidence_root_path
+        if epath.exists() and epath.is_dir():
+            for p in sorted(
+                [x for x in epath.rglob("*") if x.is_file()],
+                key=lambda x: x.as_posix(),
+            ):
+                if not p.resolve().is_relative_to(
+                    epath
+                ) or not p.resolve().is_relative_to(repo_root):
+                    raise ValueError(
+                        "E_EVIDENCE_PATH_OUTSIDE_REPO: evidence file escaped allowed roots"
+                    )
+                # include under evidence/ to keep release small and explicit
+                members.append(("evidence/" + p.relative_to(epath).as_posix(), p))
+                evidence_files_included += 1
+
+    # Members are deflated in parallel (or, with a member_store, spliced from it
+    # when unchanged); fixed timestamps and modes keep the bytes reproducible.
+    write_zip(zip_path, members, workers=workers, store=member_store)
 
     write_manifest(release_dir, release_dir / "MANIFEST.release.json")
     report = {
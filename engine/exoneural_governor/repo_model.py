@@ -41,6 +41,7 @@ IGNORED_DIRS = {
 SCRIPT_SUFFIXES = {".py", ".mjs", ".js", ".ts", ".sh", ".bash"}
 YAML_SUFFIXES = {".yml", ".yaml"}
 EXECUTABLES = {"python", "python3", "node", "bash", "sh"}
+CLI_PARSER_MARKERS = ("argparse.ArgumentParser(", "@click.option(", "yargs")
 MAX_AGENT_INPUTS = 200
 MAX_INVOCATION_EXAMPLES = 20
 MAX_GIT_LOG_LINES = 2000
@@ -439,8 +440,8 @@ def _value_literal(node: ast.AST) -> Any:
     return None
 
 
-def _extract_python_interface(path: Path) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    text = _read_text(path)
+def _extract_python_interface(path: Path, text: str | None = None) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    text = _read_text(path) if text is None else text
     try:
         tree = ast.parse(text)
     except Exception:
@@ -509,8 +510,8 @@ def _extract_python_interface(path: Path) -> tuple[list[dict[str, Any]], list[di
     return inputs, sorted(outputs, key=lambda x: x["name"])
 
 
-def _extract_node_interface(path: Path) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    text = _read_text(path)
+def _extract_node_interface(path: Path, text: str | None = None) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    text = _read_text(path) if text is None else text
     inputs: list[dict[str, Any]] = []
     for m in re.finditer(r"yargs\.option\((['\"])([^'\"]+)\1", text):
         nm = m.group(2)
@@ -529,8 +530,8 @@ def _extract_node_interface(path: Path) -> tuple[list[dict[str, Any]], list[dict
     return inputs, sorted(outputs, key=lambda x: x["name"])
 
 
-def _extract_shell_interface(path: Path) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    text = _read_text(path)
+def _extract_shell_interface(path: Path, text: str | None = None) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    text = _read_text(path) if text is None else text
     m = re.search(r"getopts\s+['\"]([^'\"]+)['\"]", text)
     if not m:
         return [], []
@@ -543,6 +544,10 @@ def _extract_shell_interface(path: Path) -> tuple[list[dict[str, Any]], list[dic
     return sorted(inputs, key=lambda x: x["name"])[:MAX_AGENT_INPUTS], []
 
 
+def _has_cli_parser(text: str | None) -> bool:
+    return text is not None and any(marker in text for marker in CLI_PARSER_MARKERS)
+
+
 def _extract_yaml_interface(kind: str, path: Path, data: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
     inputs: list[dict[str, Any]] = []
     outputs: list[dict[str, Any]] = []
@@ -1165,23 +1170,26 @@ def _populate_interfaces_and_deps(repo_root: Path, agents: list[dict[str, Any]],
         rel = agent["path"]
         path = repo_root / rel
         kind = agent["kind"]
-        iface = {"inputs": [], "outputs": [], "invocation": []}
+        iface: dict[str, Any] = {"inputs": [], "outputs": [], "invocation": []}
+        text = _read_text(path) if path.suffix in SCRIPT_SUFFIXES else None
         if path.suffix in YAML_SUFFIXES:
             data = _safe_load_yaml(repo_root, path, unknowns.setdefault("parse_failures", []))
             if isinstance(data, dict):
                 iface = _extract_yaml_interface(kind, path, data)
         elif path.suffix == ".py":
-            ins, outs = _extract_python_interface(path)
+            ins, outs = _extract_python_interface(path, text)
             iface = {"inputs": ins, "outputs": outs, "invocation": []}
             module = _python_module_name(rel)
             if module:
                 iface["invocation"].append({"pattern": f"python -m {module}", "source": "python:module"})
         elif path.suffix in {".js", ".mjs", ".ts"}:
-            ins, outs = _extract_node_interface(path)
+            ins, outs = _extract_node_interface(path, text)
             iface = {"inputs": ins, "outputs": outs, "invocation": []}
         elif path.suffix in {".sh", ".bash"}:
-            ins, outs = _extract_shell_interface(path)
+            ins, outs = _extract_shell_interface(path, text)
             iface = {"inputs": ins, "outputs": outs, "invocation": []}
+        # Recorded here so contract-eval gates never have to re-read the source tree.
+        iface["cli_parser_detected"] = _has_cli_parser(text)
         agent["interface"] = iface
 
         deps = set(depends_from_edges.get(rel, set()))
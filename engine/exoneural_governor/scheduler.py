@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence, TypeVar
+
+from ._exec import ResourceLimits
+from .budget import CommandBudget, limits_from_mapping
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """One baseline command, its ordering constraints and its resource budget.
+
+    ``needs`` lists ids of earlier commands that must finish first (finish, not
+    pass: every declared command always runs). An ``exclusive`` command waits for
+    everything declared before it and blocks everything declared after it until
+    it finishes; plain argv entries in sg.config.json are exclusive, which keeps
+    the historical strictly sequential behaviour. ``budget`` is compared against
+    measured usage after the run; ``limits`` are enforced while it runs.
+    ``inputs`` are repo-relative paths, directories or globs the command reads;
+    declaring them makes the command eligible for input-hash memoization."""
+
+    id: str
+    argv: tuple[str, ...]
+    needs: tuple[str, ...] = ()
+    exclusive: bool = True
+    budget: CommandBudget = CommandBudget()
+    limits: ResourceLimits | None = None
+    inputs: tuple[str, ...] = ()
+
+
+def parse_plan(raw: Sequence[Any]) -> tuple[CommandSpec, ...]:
+    """Build command specs from the ``baseline_commands`` config value (fail-closed)."""
+    specs: list[CommandSpec] = []
+    seen: set[str] = set()
+    for i, item in enumerate(raw):
+        if isinstance(item, dict):
+            spec = CommandSpec(
+                id=str(item.get("id", f"cmd-{i:03d}")),
+                argv=tuple(str(x) for x in item["argv"]),
+                needs=tuple(str(x) for x in item.get("needs", [])),
+                exclusive=bool(item.get("exclusive", False)),
+                budget=CommandBudget.from_mapping(item.get("budget")),
+                limits=limits_from_mapping(item.get("limits")),
+                inputs=tuple(str(x) for x in item.get("inputs", [])),
+            )
+        else:
+            spec = CommandSpec(id=f"cmd-{i:03d}", argv=tuple(str(x) for x in item))
+        if spec.id in seen:
+            raise ValueError(f"E_BASELINE_PLAN: duplicate command id {spec.id!r}")
+        unknown = [d for d in spec.needs if d not in seen]
+        if unknown:
+            raise ValueError(f"E_BASELINE_PLAN: {spec.id!r} needs {unknown} which are not declared before it")
+        seen.add(spec.id)
+        specs.append(spec)
+    return tuple(specs)
+
+
+def plan_from_argv(commands: Sequence[Sequence[str]]) -> tuple[CommandSpec, ...]:
+    return parse_plan([list(argv) for argv in commands])
+
+
+def _prerequisites(plan: Sequence[CommandSpec]) -> list[set[int]]:
+    index = {spec.id: i for i, spec in enumerate(plan)}
+    prereqs: list[set[int]] = []
+    barrier: int | None = None
+    for i, spec in enumerate(plan):
+        deps = {index[d] for d in spec.needs}
+        if spec.exclusive:
+            deps |= set(range(i))
+        elif barrier is not None:
+            deps.add(barrier)
+        prereqs.append(deps)
+        if spec.exclusive:
+            barrier = i
+    return prereqs
+
+
+def run_plan(plan: Sequence[CommandSpec], run_one: Callable[[int, CommandSpec], R], *, jobs: int = 1) -> list[R]:
+    """Run run_one(index, spec) for every spec, at most ``jobs`` at a time.
+
+    A command starts once its prerequisites have finished; ready commands start in
+    declaration order. Results come back in declaration order regardless of which
+    command finished first. Prerequisites always point at earlier commands, so the
+    first pending command is runnable whenever nothing is running."""
+    prereqs = _prerequisites(plan)
+    results: dict[int, R] = {}
+    pending = list(range(len(plan)))
+    running: dict[Future[R], int] = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            done_ids = set(results)
+            for i in list(pending):
+                if len(running) >= max(1, jobs):
+                    break
+                if prereqs[i] <= done_ids:
+                    running[pool.submit(run_one, i, plan[i])] = i
+                    pending.remove(i)
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                results[running.pop(fut)] = fut.result()
+    return [results[i] for i in range(len(plan))]
@@ -0,0 +1,88 @@
+"""Process-wide cache of compiled JSON Schema validators.
+
+Validators are keyed by the sha256 of the schema file's bytes, so an edited
+schema is recompiled and an unchanged one is built once per process whatever
+path it is reached by. Meta-validating a schema (``check_schema``) costs far
+more than validating a typical instance; a schema that passed it is remembered
+across processes by an empty stamp file named after the schema digest, the
+validator class and the jsonschema version.
+
+Environment:
+    AXL_SCHEMA_CACHE  directory for the stamps, or ``off`` to meta-validate in every process
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import jsonschema
+from jsonschema.validators import validator_for
+
+from .hashcache import cache_home
+
+CACHE_ENV = "AXL_SCHEMA_CACHE"
+DEFAULT_VALIDATOR = jsonschema.Draft202012Validator
+
+_DISABLED = {"0", "off", "false", "no"}
+_lock = threading.Lock()
+_validators: dict[str, Any] = {}
+
+
+def _stamp_dir() -> Path | None:
+    raw = os.environ.get(CACHE_ENV, "").strip()
+    if raw.lower() in _DISABLED:
+        return None
+    return Path(raw) if raw else cache_home() / "schema-checked"
+
+
+def _stamp_name(digest: str, cls: type) -> str:
+    return f"{digest}.{cls.__name__}.{importlib.metadata.version('jsonschema')}"
+
+
+def _check_schema(cls: Any, schema: Any, digest: str) -> None:
+    """Meta-validate schema unless an earlier process already did (raises SchemaError)."""
+    stamps = _stamp_dir()
+    stamp = stamps / _stamp_name(digest, cls) if stamps is not None else None
+    if stamp is not None and stamp.exists():
+        return
+    cls.check_schema(schema)
+    if stamp is not None:
+        try:
+            stamps.mkdir(parents=True, exist_ok=True)
+            stamp.touch()
+        except OSError:
+            pass
+
+
+def load_validator(schema_path: str | os.PathLike[str]) -> Any:
+    """Compiled validator for the schema file (its ``$schema`` picks the draft; default 2020-12)."""
+    raw = Path(schema_path).read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    with _lock:
+        cached = _validators.get(digest)
+    if cached is not None:
+        return cached
+    schema = json.loads(raw.decode("utf-8"))
+    cls = validator_for(schema, default=DEFAULT_VALIDATOR)
+    _check_schema(cls, schema, digest)
+    validator = cls(schema)
+    with _lock:
+        return _validators.setdefault(digest, validator)
+
+
+def validate(instance: Any, schema_path: str | os.PathLike[str]) -> None:
+    """Same contract as ``jsonschema.validate``: raise the best-matching ValidationError."""
+    error = jsonschema.exceptions.best_match(load_validator(schema_path).iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+def clear() -> None:
+    with _lock:
+        _validators.clear()
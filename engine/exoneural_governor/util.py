@@ -4,12 +4,14 @@ import hashlib
 import json
 import os
 import re
-import subprocess
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, Mapping, Sequence
 
+from . import hashcache
+from ._exec import DEFAULT_TAIL_BYTES, ResourceLimits, ResourceUsage, stream_process
+
 
 def utc_now_iso() -> str:
     return (
@@ -27,11 +29,7 @@ def sha256_bytes(data: bytes) -> str:
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return hashcache.sha256_file(path)
 
 
 def ensure_dir(path: Path) -> None:
@@ -45,6 +43,21 @@ class CmdResult:
     exit_code: int
     stdout_path: str
     stderr_path: str
+    stdout_sha256: str = ""
+    stderr_sha256: str = ""
+    stdout_tail: bytes = b""
+    stderr_tail: bytes = b""
+    usage: ResourceUsage | None = None
+
+    def as_dict(self) -> dict:
+        """Evidence record; digests and tails stay out so report shapes are unchanged."""
+        return {
+            "argv": self.argv,
+            "cwd": self.cwd,
+            "exit_code": self.exit_code,
+            "stdout_path": self.stdout_path,
+            "stderr_path": self.stderr_path,
+        }
 
 
 def run_cmd(
@@ -54,29 +67,37 @@ def run_cmd(
     stdout_path: Path,
     stderr_path: Path,
     env: Mapping[str, str] | None = None,
+    tail_bytes: int = DEFAULT_TAIL_BYTES,
+    limits: ResourceLimits | None = None,
 ) -> CmdResult:
-    """Run a command deterministically: no shell, explicit argv, captured stdout/stderr.
+    """Run a command deterministically: no shell, explicit argv, stdout/stderr streamed to files.
+    Only the last tail_bytes of each stream are kept in memory; resource usage is
+    measured and optional hard limits applied.
     Caller decides policy on non-zero exit codes."""
     ensure_dir(stdout_path.parent)
     ensure_dir(stderr_path.parent)
 
-    proc = subprocess.run(
-        list(argv),
-        cwd=str(cwd),
-        env=dict(os.environ, **(env or {})),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=False,
-        check=False,
-    )
-    stdout_path.write_bytes(proc.stdout or b"")
-    stderr_path.write_bytes(proc.stderr or b"")
+    with stdout_path.open("wb") as out_f, stderr_path.open("wb") as err_f:
+        exit_code, out, err, usage = stream_process(
+            argv,
+            cwd=cwd,
+            env=dict(os.environ, **(env or {})),
+            stdout_sink=out_f,
+            stderr_sink=err_f,
+            tail_bytes=tail_bytes,
+            limits=limits,
+        )
     return CmdResult(
         argv=list(argv),
         cwd=str(cwd),
-        exit_code=int(proc.returncode),
+        exit_code=int(exit_code),
         stdout_path=str(stdout_path),
         stderr_path=str(stderr_path),
+        stdout_sha256=out.sha256,
+        stderr_sha256=err.sha256,
+        stdout_tail=out.tail,
+        stderr_tail=err.tail,
+        usage=usage,
     )
 
 
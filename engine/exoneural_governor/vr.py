@@ -6,11 +6,16 @@ import re
 from pathlib import Path
 from typing import Any, Dict
 
+from ._exec import ResourceUsage
+from .budget import CommandBudget
 from .catalog import validate_catalog
 from .config import Config
+from .evidence_store import EvidenceStore, detach_tree, store_enabled
 from .inventory import inventory
 from .manifest import write_manifest
+from .memo import MemoStore, input_digest, memo_enabled
 from .redaction import load_redaction_patterns, redact_tree
+from .scheduler import CommandSpec, plan_from_argv, run_plan
 from .util import ensure_dir, run_cmd, sha256_bytes, utc_now_iso, write_json
 
 
@@ -55,11 +60,7 @@ def _work_id(repo_root: Path, cfg: Config) -> str:
         stderr_path=tmp_dir / "head.stderr",
     )
     if head.exit_code == 0:
-        git_commit = (
-            (tmp_dir / "head.stdout")
-            .read_text(encoding="utf-8", errors="replace")
-            .strip()
-        )
+        git_commit = head.stdout_tail.decode("utf-8", errors="replace").strip()
         if git_commit:
             return git_commit
 
@@ -93,6 +94,11 @@ def run_vr(cfg: Config, *, write_back: bool = True) -> dict:
     evidence_root = cfg.evidence_root_base / _evidence_tag(work_id) / work_id
     reports_dir = evidence_root / "REPORTS"
     cmds_dir = evidence_root / "COMMANDS"
+    store = EvidenceStore.for_base(cfg.evidence_root_base) if store_enabled() else None
+    if store is not None:
+        # A rerun rewrites files in place; stop sharing inodes with the object store first.
+        detach_tree(evidence_root)
+    memo = MemoStore.for_base(cfg.evidence_root_base, store) if memo_enabled() else None
     ensure_dir(reports_dir)
     ensure_dir(cmds_dir)
 
@@ -101,29 +107,90 @@ def run_vr(cfg: Config, *, write_back: bool = True) -> dict:
     inventory(repo_root, reports_dir / "inventory")
     cat = validate_catalog(repo_root)
 
-    # Baseline commands (default: pytest)
-    cmd_results = []
-    for i, argv in enumerate(cfg.baseline_commands):
+    # Baseline commands (default: pytest), scheduled per the config plan; logs
+    # and results keep declaration order whatever order commands finish in.
+    default_budget = CommandBudget.from_config_budgets(cfg.budgets)
+
+    def _replay(i: int, digest: str, budget: CommandBudget) -> dict | None:
+        """The record of an earlier successful run with identical inputs, logs restored here."""
+        entry = memo.lookup(digest) if memo is not None else None
+        if entry is None:
+            return None
+        rec = dict(entry["record"])
+        # The run was within the budget in force then; a tightened budget reruns it.
+        usage = rec.get("usage")
+        if budget.violations(ResourceUsage(**usage) if usage else None):
+            return None
+        rec["budget"] = budget.as_dict()
+        rec["budget_violations"] = []
+        for stream in ("stdout", "stderr"):
+            dest = cmds_dir / f"{i:03d}.{stream}.txt"
+            if not memo.restore_log(entry["logs"][stream], Path(rec[f"{stream}_path"]), dest):
+                return None
+            rec[f"{stream}_path"] = str(dest)
+        rec["cache"] = {
+            "hit": True,
+            "input_digest": digest,
+            "source_work_id": entry["work_id"],
+            "source_evidence_root": entry["evidence_root"],
+            "source_utc": entry["utc"],
+        }
+        return rec
+
+    def _run_baseline(i: int, spec: CommandSpec) -> dict:
+        budget = spec.budget.over(default_budget)
+        digest = input_digest(repo_root, spec.argv, spec.inputs) if memo is not None else None
+        replayed = _replay(i, digest, budget) if digest is not None else None
+        if replayed is not None:
+            return replayed
         res = run_cmd(
-            argv,
+            list(spec.argv),
             cwd=repo_root,
             stdout_path=cmds_dir / f"{i:03d}.stdout.txt",
             stderr_path=cmds_dir / f"{i:03d}.stderr.txt",
+            limits=spec.limits,
         )
-        cmd_results.append(res.__dict__)
+        rec = res.as_dict()
+        rec["usage"] = res.usage.as_dict() if res.usage is not None else None
+        rec["budget"] = budget.as_dict()
+        rec["budget_violations"] = budget.violations(res.usage)
+        rec["cache"] = {"hit": False, "input_digest": digest}
+        return rec
+
+    plan = cfg.baseline_plan or plan_from_argv(cfg.baseline_commands)
+    cmd_results = run_plan(plan, _run_baseline, jobs=cfg.baseline_jobs)
 
     # Redact captured evidence
-    redaction_changed = redact_tree(evidence_root, patterns)
+    redaction_changed = redact_tree(
+        evidence_root,
+        patterns,
+        state_path=evidence_root.parent / f"{evidence_root.name}.redaction.json",
+    )
     write_json(
         reports_dir / "redaction.changed.json",
         {"changed": redaction_changed, "count": len(redaction_changed)},
     )
 
     man = write_manifest(evidence_root, reports_dir / "MANIFEST.json")
+    if store is not None:
+        store.dedup_tree(evidence_root, {e["path"]: e["sha256"] for e in man["entries"]})
+    if memo is not None:
+        # Only commands that really ran, passed and stayed within budget are reusable.
+        digests = {e["path"]: e["sha256"] for e in man["entries"]}
+        for i, rec in enumerate(cmd_results):
+            cache = rec["cache"]
+            if cache["hit"] or cache["input_digest"] is None or rec["exit_code"] != 0 or rec["budget_violations"]:
+                continue
+            logs = {stream: digests.get(f"COMMANDS/{i:03d}.{stream}.txt") for stream in ("stdout", "stderr")}
+            if None in logs.values():
+                continue
+            record = {k: v for k, v in rec.items() if k != "cache"}
+            memo.save(cache["input_digest"], record=record, work_id=work_id, evidence_root=evidence_root, log_sha256=logs)
 
     # Compute metrics (deterministic, local)
     all_exit_codes = [int(r["exit_code"]) for r in cmd_results]
     pass_rate = 1.0 if all(x == 0 for x in all_exit_codes) else 0.0
+    budgets_ok = not any(r["budget_violations"] for r in cmd_results)
 
     vr: Dict[str, Any] = {
         "schema": "VR-2026.1",
@@ -136,6 +203,7 @@ def run_vr(cfg: Config, *, write_back: bool = True) -> dict:
             "catalog_ok": bool(cat["ok"]),
             "baseline_pass": all(x == 0 for x in all_exit_codes),
             "pass_rate": pass_rate,
+            "budgets_ok": budgets_ok,
             "evidence_manifest_entries": int(man["count"]),
         },
         "artifacts": {
@@ -153,13 +221,15 @@ def run_vr(cfg: Config, *, write_back: bool = True) -> dict:
         "blockers": [],
     }
 
-    # Fail-closed: if catalog invalid or baseline fails, set CALIBRATION_REQUIRED
-    if not vr["metrics"]["catalog_ok"] or not vr["metrics"]["baseline_pass"]:
+    # Fail-closed: if catalog invalid, baseline fails or a command blows its budget, set CALIBRATION_REQUIRED
+    if not vr["metrics"]["catalog_ok"] or not vr["metrics"]["baseline_pass"] or not budgets_ok:
         vr["status"] = "CALIBRATION_REQUIRED"
         if not vr["metrics"]["catalog_ok"]:
             vr["blockers"].append("catalog_validation_failed")
         if not vr["metrics"]["baseline_pass"]:
             vr["blockers"].append("baseline_commands_failed")
+        if not budgets_ok:
+            vr["blockers"].append("command_budget_exceeded")
 
     if write_back:
         (repo_root / "VR.json").write_text(
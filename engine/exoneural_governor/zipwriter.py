@@ -0,0 +1,405 @@
+"""Bit-reproducible ZIP archives from members compressed in parallel.
+
+``zipfile`` compresses each member inline as it is written, so an archive is
+built on one core. Here members are deflated ahead of time by a thread pool
+(zlib and crc32 release the GIL) and the finished streams are copied into the
+archive in caller order. Every member gets the same timestamp (the ZIP epoch,
+1980-01-01 00:00:00) and mode 0644, so identical inputs give identical bytes.
+ZIP64 records are emitted only when sizes, offsets or the entry count need them.
+
+A ``MemberStore`` keeps compressed streams keyed by source content, so members
+that did not change since an earlier build are spliced in without recompressing.
+Every store hit is checked against the source before it is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterable
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
+from . import hashcache
+
+DEFLATE_LEVEL = 6
+READ_CHUNK_BYTES = 1024 * 1024
+# Compressed streams stay in memory up to this size, then spill to a temp file.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+FILE_MODE = 0o100644
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_COUNT_LIMIT = 0xFFFF
+STORE_ENV = "AXL_ZIP_STORE"
+_MAX32 = 0xFFFFFFFF
+_MAX16 = 0xFFFF
+
+_DOS_TIME = 0
+_DOS_DATE = (1 << 5) | 1  # 1980-01-01
+_VERSION_DEFAULT = 20
+_VERSION_ZIP64 = 45
+_SYSTEM_UNIX = 3
+_FLAG_UTF8 = 0x800
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_ARCHIVE = struct.Struct("<4s4H2LH")
+_END_ARCHIVE64 = struct.Struct("<4sQ2H2L4Q")
+_END_ARCHIVE64_LOCATOR = struct.Struct("<4sLQL")
+
+
+@dataclass
+class CompressedMember:
+    """A member stream ready to be copied into an archive.
+
+    ``payload`` is positioned at the start of the stream: raw deflate data for
+    ZIP_DEFLATED, the file bytes themselves for ZIP_STORED."""
+
+    crc32: int
+    size: int
+    compressed_size: int
+    payload: BinaryIO
+    method: int = ZIP_DEFLATED
+    sha256: str = ""
+
+    def close(self) -> None:
+        self.payload.close()
+
+
+def _digest_file(src: Path) -> tuple[str, int, int]:
+    """(sha256, crc32, size) of the file's bytes, read once."""
+    digest = hashlib.sha256()
+    crc = 0
+    size = 0
+    with src.open("rb") as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
+            crc = zlib.crc32(chunk, crc)
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), crc, size
+
+
+def _inflated_sha256(f: BinaryIO) -> str:
+    """sha256 of a raw deflate stream's output; ValueError unless it is exactly one complete stream."""
+    inflater = zlib.decompressobj(-15)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
+        while chunk:
+            digest.update(inflater.decompress(chunk, READ_CHUNK_BYTES))
+            chunk = inflater.unconsumed_tail
+    digest.update(inflater.flush())
+    if not inflater.eof or inflater.unused_data:
+        raise ValueError("truncated or trailing deflate data")
+    return digest.hexdigest()
+
+
+def compress_file(src: Path, *, method: int = ZIP_DEFLATED, level: int = DEFLATE_LEVEL) -> CompressedMember:
+    if method not in (ZIP_DEFLATED, ZIP_STORED):
+        raise ValueError(f"unsupported zip method: {method}")
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15) if method == ZIP_DEFLATED else None
+    payload = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    digest = hashlib.sha256()
+    crc = 0
+    size = 0
+    with src.open("rb") as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
+            crc = zlib.crc32(chunk, crc)
+            digest.update(chunk)
+            size += len(chunk)
+            payload.write(compressor.compress(chunk) if compressor is not None else chunk)
+    if compressor is not None:
+        payload.write(compressor.flush())
+    compressed_size = payload.tell()
+    payload.seek(0)
+    return CompressedMember(crc, size, compressed_size, payload, method, digest.hexdigest())
+
+
+class MemberStore:
+    """Content-addressed compressed member streams shared between archive builds.
+
+    Entries are keyed by the source sha256, method, level and the runtime zlib
+    version, since another zlib build may emit different bytes. Each entry holds a
+    small header (crc32, uncompressed size) and the raw deflate stream; stored
+    members keep only the header and are read from the source. Entries are written
+    atomically and the directory can be deleted at any time.
+
+    The store lives outside the build and is not trusted: on every lookup the
+    source is read (sha256, crc32, size) and the entry must match it, with deflate
+    streams inflated and compared by sha256. An entry that does not match is
+    deleted and the member recompressed."""
+
+    _HEADER = struct.Struct("<4sLQ")
+    _MAGIC = b"AXZ1"
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, sha256: str, method: int, level: int) -> Path:
+        if method == ZIP_DEFLATED:
+            return self.root / f"{method}-{level}-zlib{zlib.ZLIB_RUNTIME_VERSION}" / sha256[:2] / sha256
+        return self.root / f"{method}-0" / sha256[:2] / sha256
+
+    def load(self, src: Path, *, method: int, level: int) -> CompressedMember | None:
+        """The stored stream for src, verified against it; None on a miss or a bad entry."""
+        try:
+            sha256, crc, size = _digest_file(src)
+            path = self._path(sha256, method, level)
+            f = path.open("rb")
+        except OSError:
+            self.misses += 1
+            return None
+        try:
+            magic, entry_crc, entry_size = self._HEADER.unpack(f.read(self._HEADER.size))
+            if magic != self._MAGIC or (entry_crc, entry_size) != (crc, size):
+                raise ValueError("member store entry does not match its source")
+            if method == ZIP_STORED:
+                f.close()
+                f = src.open("rb")
+                compressed_size = size
+            else:
+                compressed_size = os.fstat(f.fileno()).st_size - self._HEADER.size
+                if _inflated_sha256(f) != sha256:
+                    raise ValueError("member store entry does not match its source")
+                f.seek(self._HEADER.size)
+        except (OSError, ValueError, struct.error, zlib.error):
+            f.close()
+            self._drop(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CompressedMember(crc, size, compressed_size, f, method, sha256)
+
+    @staticmethod
+    def _drop(path: Path) -> None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def save(self, member: CompressedMember, *, level: int) -> None:
+        path = self._path(member.sha256, member.method, level)
+        if path.exists():
+            return
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        start = member.payload.tell()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as out:
+                out.write(self._HEADER.pack(self._MAGIC, member.crc32, member.size))
+                if member.method != ZIP_STORED:
+                    shutil.copyfileobj(member.payload, out, READ_CHUNK_BYTES)
+            os.replace(tmp, path)
+        except OSError:
+            # The store is an optimisation; a failed write only costs a recompress later.
+            tmp.unlink(missing_ok=True)
+        finally:
+            member.payload.seek(start)
+
+
+def default_member_store() -> MemberStore | None:
+    """Store configured from AXL_ZIP_STORE (a directory, or ``off``), else the user cache."""
+    raw = os.environ.get(STORE_ENV)
+    if raw is not None:
+        return None if raw.strip().lower() in {"", "0", "off", "false", "no"} else MemberStore(Path(raw).expanduser())
+    return MemberStore(hashcache.cache_home() / "zip-members")
+
+
+def load_member(
+    src: Path, *, method: int = ZIP_DEFLATED, level: int = DEFLATE_LEVEL, store: MemberStore | None = None
+) -> CompressedMember:
+    if store is not None:
+        hit = store.load(src, method=method, level=level)
+        if hit is not None:
+            return hit
+    member = compress_file(src, method=method, level=level)
+    if store is not None:
+        store.save(member, level=level)
+    return member
+
+
+def _copy_exact(src: BinaryIO, dst: BinaryIO, length: int) -> None:
+    remaining = length
+    while remaining:
+        chunk = src.read(min(READ_CHUNK_BYTES, remaining))
+        if not chunk:
+            raise ValueError("zip member stream ended early (source changed while packaging?)")
+        dst.write(chunk)
+        remaining -= len(chunk)
+
+
+@dataclass(frozen=True)
+class _CentralRecord:
+    name: bytes
+    flags: int
+    crc32: int
+    size: int
+    compressed_size: int
+    offset: int
+    method: int
+
+
+class DeterministicZipWriter:
+    """Append-only writer for pre-compressed members; call ``close`` to finish."""
+
+    def __init__(self, fileobj: BinaryIO) -> None:
+        self._out = fileobj
+        self._offset = 0
+        self._records: list[_CentralRecord] = []
+        self._names: set[str] = set()
+
+    def _write(self, data: bytes) -> None:
+        self._out.write(data)
+        self._offset += len(data)
+
+    def add(self, arcname: str, member: CompressedMember) -> None:
+        if arcname in self._names:
+            raise ValueError(f"duplicate zip member: {arcname}")
+        self._names.add(arcname)
+        name = arcname.encode("utf-8")
+        flags = 0 if arcname.isascii() else _FLAG_UTF8
+        zip64 = member.size >= ZIP64_LIMIT or member.compressed_size >= ZIP64_LIMIT
+        extra = struct.pack("<2H2Q", 0x0001, 16, member.size, member.compressed_size) if zip64 else b""
+        record = _CentralRecord(name, flags, member.crc32, member.size, member.compressed_size, self._offset, member.method)
+        self._write(
+            _LOCAL_HEADER.pack(
+                b"PK\003\004",
+                _VERSION_ZIP64 if zip64 else _VERSION_DEFAULT,
+                0,
+                flags,
+                member.method,
+                _DOS_TIME,
+                _DOS_DATE,
+                member.crc32,
+                _MAX32 if zip64 else member.compressed_size,
+                _MAX32 if zip64 else member.size,
+                len(name),
+                len(extra),
+            )
+            + name
+            + extra
+        )
+        _copy_exact(member.payload, self._out, member.compressed_size)
+        self._offset += member.compressed_size
+        self._records.append(record)
+
+    def close(self) -> None:
+        cd_start = self._offset
+        for rec in self._records:
+            fields: list[int] = []
+            size, csize, offset = rec.size, rec.compressed_size, rec.offset
+            if size >= ZIP64_LIMIT:
+                fields.append(size)
+                size = _MAX32
+            if csize >= ZIP64_LIMIT:
+                fields.append(csize)
+                csize = _MAX32
+            if offset >= ZIP64_LIMIT:
+                fields.append(offset)
+                offset = _MAX32
+            extra = struct.pack(f"<2H{len(fields)}Q", 0x0001, 8 * len(fields), *fields) if fields else b""
+            version = _VERSION_ZIP64 if fields else _VERSION_DEFAULT
+            self._write(
+                _CENTRAL_HEADER.pack(
+                    b"PK\001\002",
+                    version,
+                    _SYSTEM_UNIX,
+                    version,
+                    0,
+                    rec.flags,
+                    rec.method,
+                    _DOS_TIME,
+                    _DOS_DATE,
+                    rec.crc32,
+                    csize,
+                    size,
+                    len(rec.name),
+                    len(extra),
+                    0,
+                    0,
+                    0,
+                    FILE_MODE << 16,
+                    offset,
+                )
+                + rec.name
+                + extra
+            )
+        cd_size = self._offset - cd_start
+        count = len(self._records)
+        zip64 = count >= ZIP64_COUNT_LIMIT or cd_size >= ZIP64_LIMIT or cd_start >= ZIP64_LIMIT
+        if zip64:
+            end64_offset = self._offset
+            self._write(
+                _END_ARCHIVE64.pack(
+                    b"PK\006\006", _END_ARCHIVE64.size - 12, _VERSION_ZIP64, _VERSION_ZIP64, 0, 0, count, count, cd_size, cd_start
+                )
+            )
+            self._write(_END_ARCHIVE64_LOCATOR.pack(b"PK\006\007", 0, end64_offset, 1))
+        self._write(
+            _END_ARCHIVE.pack(
+                b"PK\005\006",
+                0,
+                0,
+                _MAX16 if zip64 else count,
+                _MAX16 if zip64 else count,
+                _MAX32 if zip64 else cd_size,
+                _MAX32 if zip64 else cd_start,
+                0,
+            )
+        )
+        self._out.flush()
+
+
+def write_zip(
+    zip_path: Path,
+    members: Iterable[tuple[str, Path]],
+    *,
+    workers: int | None = None,
+    method: int = ZIP_DEFLATED,
+    level: int = DEFLATE_LEVEL,
+    store: MemberStore | None = None,
+) -> int:
+    """Write (arcname, source) pairs to zip_path in the given order; returns the member count.
+
+    Up to ``2 * workers`` members are prepared ahead of the writer, which bounds
+    memory to that many spooled streams regardless of archive size. With a
+    ``store``, unchanged members are spliced from it instead of recompressed.
+    The archive is written to a sibling temp file and renamed over zip_path
+    only once complete, so a failed build never leaves a truncated zip behind."""
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    window = max(1, 2 * workers)
+    todo = iter(members)
+    count = 0
+    tmp = zip_path.with_name(f".{zip_path.name}.{os.getpid()}.tmp")
+
+    def submit(src: Path):
+        return pool.submit(load_member, src, method=method, level=level, store=store)
+
+    try:
+        with tmp.open("wb") as out, ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            writer = DeterministicZipWriter(out)
+            pending = deque((name, submit(src)) for name, src in islice(todo, window))
+            while pending:
+                name, future = pending.popleft()
+                for nxt_name, nxt_src in islice(todo, 1):
+                    pending.append((nxt_name, submit(nxt_src)))
+                member = future.result()
+                try:
+                    writer.add(name, member)
+                finally:
+                    member.close()
+                count += 1
+            writer.close()
+        os.replace(tmp, zip_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return count
@@ -4,16 +4,12 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+from exoneural_governor.hashcache import sha256_file
 
 
 def main() -> int:
@@ -32,6 +32,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from exoneural_governor.hashcache import sha256_file
+
 # ── Colour output (no deps) ───────────────────────────────────────────────────
 RESET = "\033[0m"
 RED   = "\033[91m"
@@ -70,13 +74,6 @@ class GateReport:
     blockers: list[str] = field(default_factory=list)
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
 def load_json(path: Path) -> dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
@@ -91,29 +88,48 @@ def _skip(assertion_id: str, detail: str = "") -> AssertionResult:
     return AssertionResult(id=assertion_id, status="SKIP", detail=detail)
 
 # ── JSON Schema validation (stdlib only; jsonschema optional) ─────────────────
+@dataclass(frozen=True)
+class _CompiledSchema:
+    required: tuple[str, ...]
+    # (field, enum or None, pattern source or None, compiled pattern or None)
+    props: tuple[tuple[str, Any, str | None, re.Pattern[str] | None], ...]
+
+# Keyed by sha256 of the schema file: G2 validates every bundle against one schema.
+_COMPILED_SCHEMAS: dict[str, _CompiledSchema] = {}
+
+def _compile_schema(schema_path: Path) -> _CompiledSchema:
+    raw = schema_path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    compiled = _COMPILED_SCHEMAS.get(digest)
+    if compiled is None:
+        schema = json.loads(raw.decode("utf-8"))
+        props = []
+        for field_name, field_schema in schema.get("properties", {}).items():
+            pattern = field_schema.get("pattern")
+            props.append((field_name, field_schema.get("enum"), pattern, re.compile(pattern) if pattern is not None else None))
+        compiled = _COMPILED_SCHEMAS[digest] = _CompiledSchema(tuple(schema.get("required", [])), tuple(props))
+    return compiled
+
 def schema_validate(data: dict, schema_path: Path) -> tuple[bool, str]:
     """Lightweight structural validation without jsonschema dep."""
     try:
-        schema = load_json(schema_path)
+        schema = _compile_schema(schema_path)
     except Exception as e:
         return False, f"Cannot load schema: {e}"
 
-    required = schema.get("required", [])
-    for field_name in required:
+    for field_name in schema.required:
         if field_name not in data:
             return False, f"Missing required field: {field_name}"
 
     # Check enum fields
-    props = schema.get("properties", {})
-    for field_name, field_schema in props.items():
-        if field_name in data and "enum" in field_schema:
-            if data[field_name] not in field_schema["enum"]:
-                return False, f"Field {field_name}={data[field_name]!r} not in allowed enum {field_schema['enum']}"
-
-        if field_name in data and "pattern" in field_schema:
-            pattern = field_schema["pattern"]
+    for field_name, enum, pattern, regex in schema.props:
+        if field_name in data and enum is not None:
+            if data[field_name] not in enum:
+                return False, f"Field {field_name}={data[field_name]!r} not in allowed enum {enum}"
+
+        if field_name in data and regex is not None:
             value = str(data[field_name])
-            if not re.match(pattern, value):
+            if not regex.match(value):
                 return False, f"Field {field_name}={value!r} does not match pattern {pattern}"
 
     return True, "ok"
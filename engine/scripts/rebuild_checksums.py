@@ -14,12 +14,16 @@ Fail-closed:
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import subprocess
+import sys
 from pathlib import Path
 from typing import Dict, Iterable, List, Set
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from exoneural_governor.hashcache import sha256_file
+
 
 EXCLUDE_DIRS: Set[str] = {
     ".git",
@@ -58,14 +62,6 @@ ALLOWED_ARTIFACT_PATTERNS: tuple[str, ...] = (
 )
 
 
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def _allowed_artifact_path(rel: str) -> bool:
     rel_path = Path(rel)
     return any(rel_path.match(pattern) for pattern in ALLOWED_ARTIFACT_PATTERNS)
@@ -15,9 +15,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 from typing import Any, Dict, Iterable, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
 
 def sha256_hex(s: str) -> bool:
     if len(s) != 64:
@@ -65,21 +68,28 @@ def main() -> int:
         return 1
 
     try:
-        import jsonschema  # type: ignore
+        from jsonschema import SchemaError
+        from exoneural_governor.schema_cache import load_validator
     except Exception as e:  # pragma: no cover
         print(f"FAIL: jsonschema not available: {e!r}")
         return 1
 
-    root_schema = load_json(schemas_dir / "root_manifest.schema.json")
-    obj_schema = load_json(schemas_dir / "object_manifest.schema.json")
-    eval_schema = load_json(schemas_dir / "eval_report.schema.json")
-
     root_manifest = load_json(repo_root / "MANIFEST.json")
 
-    Draft = getattr(jsonschema, "Draft202012Validator", jsonschema.Draft7Validator)
-    root_validator = Draft(root_schema)
-    obj_validator = Draft(obj_schema)
-    eval_validator = Draft(eval_schema)
+    # Each schema's $schema picks the draft and the schema itself is checked
+    # against that draft's metaschema; compiled once per schema content, and
+    # meta-validation is skipped when an earlier run already checked the same bytes.
+    validators = {}
+    for name in ("root_manifest", "object_manifest", "eval_report"):
+        schema_path = schemas_dir / f"{name}.schema.json"
+        try:
+            validators[name] = load_validator(schema_path)
+        except SchemaError as e:
+            print(f"FAIL: invalid schema {schema_path}: {e.message}")
+            return 1
+    root_validator = validators["root_manifest"]
+    obj_validator = validators["object_manifest"]
+    eval_validator = validators["eval_report"]
 
     ok, msg = validate_one(
         root_validator, root_manifest, "root_manifest", repo_root / "MANIFEST.json"
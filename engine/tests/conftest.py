@@ -76,3 +76,19 @@ def enforce_hermetic_artifact_roots(
     root = tmp_path_factory.mktemp("axl-hermetic")
     monkeypatch.setenv("AXL_TEST_OUTPUT_DIR", str((root / "test-output").resolve()))
     monkeypatch.setenv("AXL_ARTIFACTS_ROOT", str((root / "artifacts").resolve()))
+
+
+@pytest.fixture(autouse=True)
+def isolate_user_caches(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keep the per-user caches (hashcache.cache_home) out of the developer's ~/.cache."""
+    if "test_isolation_fixture.py" in request.node.nodeid:
+        return
+    root = tmp_path_factory.mktemp("axl-cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(root.resolve()))
+    monkeypatch.setenv("AXL_HASH_CACHE", str((root / "hashcache.sqlite3").resolve()))
+    monkeypatch.setenv("AXL_ZIP_STORE", str((root / "zip-members").resolve()))
+    monkeypatch.setenv("AXL_SCHEMA_CACHE", str((root / "schema-checked").resolve()))
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ENGINE_ROOT = Path(__file__).resolve().parents[1]
+# `sg` runs hundreds of times per pipeline; its own import graph must stay small.
+# Pinned as module sets rather than a wall-clock budget, which flakes on loaded runners.
+HEAVY_MODULES = {
+    "jsonschema",
+    "yaml",
+    "exoneural_governor.config",
+    "exoneural_governor.vr",
+    "exoneural_governor.release",
+    "exoneural_governor.repo_model",
+    "exoneural_governor.contract_eval",
+}
+# `-m exoneural_governor.cli` runs the CLI as __main__, so it is not listed itself.
+INVENTORY_MODULES = {
+    "exoneural_governor",
+    "exoneural_governor._exec",
+    "exoneural_governor.budget",
+    "exoneural_governor.config",
+    "exoneural_governor.hashcache",
+    "exoneural_governor.inventory",
+    "exoneural_governor.scheduler",
+    "exoneural_governor.schema_cache",
+    "exoneural_governor.util",
+}
+
+
+def _imported(*args: str, env: dict[str, str] | None = None) -> tuple[set[str], subprocess.CompletedProcess[str]]:
+    """Modules imported by `python -X importtime <args>`."""
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ENGINE_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    names = set()
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        names.add(line.rsplit("|", 1)[1].strip())
+    return names, p
+
+
+def _governor_modules(names: set[str]) -> set[str]:
+    return {n for n in names if n == "exoneural_governor" or n.startswith("exoneural_governor.")}
+
+
+def test_help_does_not_import_subcommand_graphs() -> None:
+    names, p = _imported("-m", "exoneural_governor.cli", "--help")
+    assert p.returncode == 0, p.stderr
+    assert "inventory" in p.stdout
+    assert sorted(HEAVY_MODULES & names) == []
+
+
+def test_inventory_does_not_import_vr_or_contract_graphs(tmp_path: Path) -> None:
+    # Point the run at a scratch repo root so the reports never land in engine/artifacts.
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "pyproject.toml").write_text("", encoding="utf-8")
+    cfg = json.loads((ENGINE_ROOT / "configs" / "sg.config.json").read_text(encoding="utf-8"))
+    cfg["repo_root"] = str(repo)
+    cfg_path = tmp_path / "sg.config.json"
+    cfg_path.write_text(json.dumps(cfg), encoding="utf-8")
+    env = dict(
+        os.environ,
+        AXL_TEST_OUTPUT_DIR=str(tmp_path / "test-output"),
+        AXL_ARTIFACTS_ROOT=str(tmp_path / "artifacts"),
+    )
+
+    names, p = _imported("-m", "exoneural_governor.cli", "--config", str(cfg_path), "inventory", env=env)
+    assert p.returncode == 0, p.stderr[-2000:]
+    assert HEAVY_MODULES & names == {"jsonschema", "exoneural_governor.config"}
+    assert _governor_modules(names) == INVENTORY_MODULES
+    assert (repo / "artifacts" / "reports" / "inventory" / "inventory.json").is_file()
+
+
+def test_cli_module_imports_nothing_but_stdlib() -> None:
+    names, p = _imported("-c", "import exoneural_governor.cli")
+    assert p.returncode == 0, p.stderr
+    assert _governor_modules(names) == {"exoneural_governor", "exoneural_governor.cli"}
+    assert sorted(HEAVY_MODULES & names) == []
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from exoneural_governor._exec import ResourceLimits, ResourceUsage, stream_process
+from exoneural_governor.budget import CommandBudget
+from exoneural_governor.scheduler import parse_plan
+from exoneural_governor.util import run_cmd
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="rusage and rlimits are POSIX-only")
+
+_BURN = "import time\nbuf = bytearray(64 * 1024 * 1024)\nend = time.process_time() + 0.3\nwhile time.process_time() < end:\n    pass\n"
+
+
+def _run(tmp_path: Path, code: str, limits: ResourceLimits | None = None):
+    return run_cmd(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        stdout_path=tmp_path / "out.txt",
+        stderr_path=tmp_path / "err.txt",
+        limits=limits,
+    )
+
+
+@posix_only
+def test_run_cmd_measures_child_rusage(tmp_path: Path) -> None:
+    res = _run(tmp_path, _BURN)
+    assert res.exit_code == 0
+    assert res.usage is not None
+    assert res.usage.cpu_seconds is not None and res.usage.cpu_seconds >= 0.3
+    assert res.usage.max_rss_kb is not None and res.usage.max_rss_kb >= 64 * 1024
+    assert res.usage.wall_seconds >= res.usage.cpu_seconds * 0.5
+    assert set(res.as_dict()) == {"argv", "cwd", "exit_code", "stdout_path", "stderr_path"}
+
+
+@posix_only
+def test_hard_limits_stop_runaway_commands(tmp_path: Path) -> None:
+    started = time.monotonic()
+    slept = _run(tmp_path, "import time\ntime.sleep(30)\n", ResourceLimits(wall_seconds=0.5))
+    assert time.monotonic() - started < 10
+    assert slept.exit_code != 0 and slept.usage is not None and slept.usage.timed_out
+
+    spun = _run(tmp_path, "while True:\n    pass\n", ResourceLimits(cpu_seconds=1))
+    assert spun.exit_code != 0
+
+    hog = _run(tmp_path, "bytearray(512 * 1024 * 1024)\n", ResourceLimits(address_space_bytes=256 * 1024 * 1024))
+    assert hog.exit_code != 0
+
+
+@posix_only
+def test_limits_hold_from_exec_without_preexec_fn(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    real_popen = subprocess.Popen
+    calls = []
+
+    def recording_popen(*args, **kwargs):
+        calls.append(kwargs.get("preexec_fn"))
+        return real_popen(*args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", recording_popen)
+    res = _run(tmp_path, "import resource\nprint(resource.getrlimit(resource.RLIMIT_CPU))\n", ResourceLimits(cpu_seconds=7))
+    assert res.exit_code == 0 and calls == [None]
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8").strip() == "(7, 7)"
+
+
+@posix_only
+def test_limited_command_with_missing_binary_is_not_found(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        stream_process(["no-such-binary-axl"], cwd=tmp_path, env={"PATH": os.defpath}, limits=ResourceLimits(cpu_seconds=1))
+
+
+def test_budget_violations_use_config_defaults() -> None:
+    default = CommandBudget.from_config_budgets({"max_changed_files": 200, "command_wall_seconds": 10, "command_max_rss_mb": 100})
+    plan = parse_plan([{"id": "t", "argv": ["x"], "budget": {"cpu_seconds": 1}}])
+    budget = plan[0].budget.over(default)
+    assert budget.as_dict() == {"wall_seconds": 10, "cpu_seconds": 1, "max_rss_mb": 100}
+
+    assert budget.violations(ResourceUsage(wall_seconds=2.0, cpu_seconds=0.5, max_rss_kb=50 * 1024)) == []
+    over = ResourceUsage(wall_seconds=12.0, cpu_seconds=1.5, max_rss_kb=200 * 1024, timed_out=True)
+    assert budget.violations(over) == ["wall_limit_killed", "wall_seconds", "cpu_seconds", "max_rss_mb"]
@@ -11,7 +11,7 @@ def _minimal_model(repo_root: Path) -> dict:
     return {
         "repo_root": repo_root.as_posix(),
         "repo_fingerprint": "fp",
-        "agents": [{"agent_id": "a1", "path": "engine/tools/x.py", "kind": "CLI_SCRIPT", "name": "x", "interface": {"inputs": []}}],
+        "agents": [{"agent_id": "a1", "path": "engine/tools/x.py", "kind": "CLI_SCRIPT", "name": "x", "interface": {"inputs": [], "cli_parser_detected": False}}],
         "edges": [],
         "core_candidates": [{"agent_id": "a1", "rank": 1}],
         "counts": {"agents_count": 1, "edges_count": 0, "core_candidates_count": 1},
@@ -19,23 +19,14 @@ def _minimal_model(repo_root: Path) -> dict:
     }
 
 
-def test_strict_no_write_detects_outside_out(tmp_path: Path, monkeypatch) -> None:
-    repo_root = tmp_path / "repo"
-    (repo_root / "engine").mkdir(parents=True)
-    out_dir = tmp_path / "out"
-
-    calls = {"status": 0}
-
-    def fake_discover(_: Path) -> Path:
-        return repo_root
-
+def _fake_runner(repo_root: Path, model: dict, calls: dict[str, int], touch_outside: bool = False):
     def fake_run(ctx, name, cmd, cwd=None, env=None):
         if name == "git_status_porcelain":
             calls["status"] += 1
-            text = "?? outside.txt\n" if calls["status"] >= 2 else ""
+            text = "?? outside.txt\n" if touch_outside and calls["status"] >= 2 else ""
             rec = ExecResult(name=name, command=cmd, returncode=0, stdout=text, stderr="")
         elif name == "git_untracked":
-            text = "outside.txt\n" if calls["status"] >= 2 else ""
+            text = "outside.txt\n" if touch_outside and calls["status"] >= 2 else ""
             rec = ExecResult(name=name, command=cmd, returncode=0, stdout=text, stderr="")
         elif name.startswith("git_head") or name.startswith("git_status_"):
             rec = ExecResult(name=name, command=cmd, returncode=0, stdout="abc\n", stderr="")
@@ -48,23 +39,74 @@ def test_strict_no_write_detects_outside_out(tmp_path: Path, monkeypatch) -> Non
             contract_path = Path(cmd[contract_idx + 1])
             model_path.parent.mkdir(parents=True, exist_ok=True)
             contract_path.parent.mkdir(parents=True, exist_ok=True)
-            model_path.write_text(json.dumps(_minimal_model(repo_root)), encoding="utf-8")
+            model_path.write_text(json.dumps(model), encoding="utf-8")
             contract_path.write_text(json.dumps({"agent_id": "a1", "core_rank": 1, "blame": {"top_author": "a"}}) + "\n", encoding="utf-8")
-            (repo_root / "outside.txt").write_text("x", encoding="utf-8")
+            if touch_outside:
+                (repo_root / "outside.txt").write_text("x", encoding="utf-8")
             rec = ExecResult(name=name, command=cmd, returncode=0, stdout="", stderr="")
         else:
             rec = ExecResult(name=name, command=cmd, returncode=0, stdout="", stderr="")
         ctx.commands.append(rec)
         return rec
 
-    monkeypatch.setattr(contract_eval, "discover_repo_root", fake_discover)
+    return fake_run
+
+
+def _patch_env(monkeypatch, repo_root: Path, fake_run) -> None:
+    monkeypatch.setattr(contract_eval, "discover_repo_root", lambda _: repo_root)
     monkeypatch.setattr(contract_eval, "_run_cmd", fake_run)
     monkeypatch.setattr(contract_eval, "git_available", lambda: True)
     monkeypatch.setattr(contract_eval, "in_git_repo", lambda _: True)
 
+
+def test_strict_no_write_detects_outside_out(tmp_path: Path, monkeypatch) -> None:
+    repo_root = tmp_path / "repo"
+    (repo_root / "engine").mkdir(parents=True)
+    out_dir = tmp_path / "out"
+
+    calls = {"status": 0}
+    _patch_env(monkeypatch, repo_root, _fake_runner(repo_root, _minimal_model(repo_root), calls, touch_outside=True))
+
     code, report = contract_eval.evaluate_contracts(strict=True, out_path=out_dir, json_mode=True, no_write=True)
     assert code == 2
     g = {x["id"]: x for x in report["gates"]}
     assert g["GATE_A05_OUTSIDE_OUT_WRITE_CHECK"]["status"] == "FAIL"
     assert g["GATE_A02_STRICT_NO_WRITE"]["status"] == "FAIL"
     assert g["GATE_A05_OUTSIDE_OUT_WRITE_CHECK"]["details"]["outside_new_untracked"] == ["outside.txt"]
+
+
+def test_interface_gate_uses_model_facts_only(tmp_path: Path, monkeypatch) -> None:
+    # The agent paths do not exist on disk: the gate must decide from the model alone.
+    repo_root = tmp_path / "repo"
+    (repo_root / "engine").mkdir(parents=True)
+    model = _minimal_model(repo_root)
+    model["agents"] = [
+        {"agent_id": "a1", "path": "engine/tools/x.py", "kind": "CLI_SCRIPT", "name": "x", "interface": {"inputs": [], "cli_parser_detected": True}},
+        {"agent_id": "a2", "path": "engine/tools/y.py", "kind": "CLI_SCRIPT", "name": "y", "interface": {"inputs": [{"name": "out"}], "cli_parser_detected": True}},
+        {"agent_id": "a3", "path": "engine/tools/z.py", "kind": "CLI_SCRIPT", "name": "z", "interface": {"inputs": [], "cli_parser_detected": False}},
+    ]
+    _patch_env(monkeypatch, repo_root, _fake_runner(repo_root, model, {"status": 0}))
+
+    _, report = contract_eval.evaluate_contracts(strict=False, out_path=tmp_path / "out", json_mode=True, no_write=True)
+    g = {x["id"]: x for x in report["gates"]}
+    assert g["GATE_C03_ZERO_SHOT_INTERFACE_EXTRACTION_MINIMUM"]["status"] == "FAIL"
+    assert g["GATE_C03_ZERO_SHOT_INTERFACE_EXTRACTION_MINIMUM"]["details"]["missing_inputs"] == {"count": 1, "items": ["engine/tools/x.py"]}
+    assert g["GATE_C03_ZERO_SHOT_INTERFACE_EXTRACTION_MINIMUM"]["details"]["missing_parser_fact"] == {"count": 0, "items": []}
+
+
+def test_interface_gate_fails_closed_without_parser_fact(tmp_path: Path, monkeypatch) -> None:
+    repo_root = tmp_path / "repo"
+    (repo_root / "engine").mkdir(parents=True)
+    model = _minimal_model(repo_root)
+    model["agents"] = [
+        {"agent_id": "a1", "path": "engine/tools/x.py", "kind": "CLI_SCRIPT", "name": "x", "interface": {"inputs": []}},
+        {"agent_id": "a2", "path": "engine/tools/y.py", "kind": "CLI_SCRIPT", "name": "y"},
+        {"agent_id": "a3", "path": "engine/tools/z.py", "kind": "CLI_SCRIPT", "name": "z", "interface": {"inputs": [], "cli_parser_detected": False}},
+    ]
+    _patch_env(monkeypatch, repo_root, _fake_runner(repo_root, model, {"status": 0}))
+
+    _, report = contract_eval.evaluate_contracts(strict=False, out_path=tmp_path / "out", json_mode=True, no_write=True)
+    gate = {x["id"]: x for x in report["gates"]}["GATE_C03_ZERO_SHOT_INTERFACE_EXTRACTION_MINIMUM"]
+    assert gate["status"] == "FAIL"
+    assert gate["details"]["missing_parser_fact"] == {"count": 2, "items": ["engine/tools/x.py", "engine/tools/y.py"]}
+    assert gate["details"]["missing_inputs"] == {"count": 0, "items": []}
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from exoneural_governor.evidence_store import EvidenceStore, detach_tree
+from exoneural_governor.manifest import build_manifest
+
+
+def _run_dir(base: Path, name: str, stdout: bytes) -> Path:
+    root = base / name
+    (root / "COMMANDS").mkdir(parents=True)
+    (root / "REPORTS").mkdir(parents=True)
+    (root / "COMMANDS" / "000.stdout.txt").write_bytes(stdout)
+    (root / "COMMANDS" / "000.stderr.txt").write_bytes(b"")
+    (root / "REPORTS" / "catalog.json").write_text('{"ok": true}\n', encoding="utf-8")
+    return root
+
+
+def test_dedup_links_identical_evidence_without_changing_manifest(tmp_path: Path) -> None:
+    store = EvidenceStore.for_base(tmp_path)
+    first = _run_dir(tmp_path, "run-a", b"same log\n")
+    second = _run_dir(tmp_path, "run-b", b"other log\n")
+    before = [build_manifest(first)["entries"], build_manifest(second)["entries"]]
+
+    one = store.dedup_tree(first)
+    two = store.dedup_tree(second, {e["path"]: e["sha256"] for e in before[1]})
+
+    assert (one.files, one.stored, one.linked) == (3, 3, 0)
+    assert (two.files, two.stored, two.linked) == (3, 1, 2)
+    assert [build_manifest(first)["entries"], build_manifest(second)["entries"]] == before
+    shared = (first / "REPORTS" / "catalog.json").stat()
+    assert shared.st_ino == (second / "REPORTS" / "catalog.json").stat().st_ino
+    assert shared.st_nlink == 3
+    assert store.dedup_tree(first).linked == 3
+
+
+def test_detach_and_prune_leave_other_runs_intact(tmp_path: Path) -> None:
+    store = EvidenceStore.for_base(tmp_path)
+    first = _run_dir(tmp_path, "run-a", b"same log\n")
+    second = _run_dir(tmp_path, "run-b", b"same log\n")
+    store.dedup_tree(first)
+    store.dedup_tree(second)
+
+    assert detach_tree(first) == 3
+    assert not (first / "COMMANDS" / "000.stdout.txt").exists()
+    assert (second / "COMMANDS" / "000.stdout.txt").read_bytes() == b"same log\n"
+    assert store.prune() == 0
+
+    for p in list(second.rglob("*")):
+        if p.is_file():
+            p.unlink()
+    assert store.prune() == 3
+
+
+def test_damaged_object_is_replaced(tmp_path: Path) -> None:
+    store = EvidenceStore.for_base(tmp_path)
+    first = _run_dir(tmp_path, "run-a", b"same log\n")
+    store.dedup_tree(first)
+    # An in-place edit of a linked copy corrupts the shared object.
+    (first / "COMMANDS" / "000.stdout.txt").write_bytes(b"edited!!\n")
+
+    second = _run_dir(tmp_path, "run-b", b"same log\n")
+    store.dedup_tree(second)
+    assert (second / "COMMANDS" / "000.stdout.txt").read_bytes() == b"same log\n"
+    assert (first / "COMMANDS" / "000.stdout.txt").read_bytes() == b"edited!!\n"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from exoneural_governor import hashcache
+from exoneural_governor.hashcache import HashCache
+
+
+@pytest.fixture(autouse=True)
+def no_racy_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hashcache, "RACY_WINDOW_NS", 0)
+
+
+def _cache(tmp_path: Path, **kwargs: bool) -> HashCache:
+    return HashCache(tmp_path / "cache" / "hashes.sqlite3", **kwargs)
+
+
+def test_hash_cache_hits_until_stat_changes(tmp_path: Path) -> None:
+    f = tmp_path / "a.txt"
+    f.write_bytes(b"alpha")
+    cache = _cache(tmp_path)
+
+    assert cache.sha256_file(f) == hashlib.sha256(b"alpha").hexdigest()
+    assert cache.sha256_file(f) == hashlib.sha256(b"alpha").hexdigest()
+    assert (cache.hits, cache.misses, cache.bytes_hashed) == (1, 1, 5)
+
+    f.write_bytes(b"bravo")
+    assert cache.sha256_file(f) == hashlib.sha256(b"bravo").hexdigest()
+    assert (cache.misses, cache.bytes_hashed) == (2, 10)
+
+    # Persisted: a fresh instance on the same database hits immediately.
+    again = _cache(tmp_path)
+    assert again.sha256_file(f) == hashlib.sha256(b"bravo").hexdigest()
+    assert again.hits == 1
+
+
+def test_hash_cache_verify_mode_rehashes_and_repairs(tmp_path: Path) -> None:
+    f = tmp_path / "a.txt"
+    f.write_bytes(b"alpha")
+    cache = _cache(tmp_path)
+    cache.sha256_file(f)
+
+    # Poison the stored digest: a plain lookup trusts it, verify mode does not.
+    st = f.stat()
+    conn = cache._connection()
+    assert conn is not None
+    conn.execute("UPDATE file_hash SET sha256 = 'stale' WHERE ino = ?", (st.st_ino,))
+
+    assert cache.sha256_file(f) == "stale"
+    assert cache.sha256_file(f, verify=True) == hashlib.sha256(b"alpha").hexdigest()
+    assert cache.sha256_file(f) == hashlib.sha256(b"alpha").hexdigest()
+    assert _cache(tmp_path, verify=True).sha256_file(f) == hashlib.sha256(b"alpha").hexdigest()
+
+
+def test_hash_cache_skips_racy_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hashcache, "RACY_WINDOW_NS", 3600 * 10**9)
+    f = tmp_path / "a.txt"
+    f.write_bytes(b"alpha")
+    cache = _cache(tmp_path)
+    cache.sha256_file(f)
+    cache.sha256_file(f)
+    assert cache.hits == 0
+
+
+def test_default_cache_honours_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    f = tmp_path / "a.txt"
+    f.write_bytes(b"alpha")
+    db = tmp_path / "env.sqlite3"
+    monkeypatch.setenv(hashcache.CACHE_ENV, str(db))
+    assert hashcache.sha256_file(f) == hashlib.sha256(b"alpha").hexdigest()
+    assert db.exists()
+    assert hashcache.default_cache().db_path == db
+
+    monkeypatch.setenv(hashcache.CACHE_ENV, "off")
+    assert hashcache.default_cache().db_path is None
+    assert hashcache.sha256_file(f) == hashlib.sha256(b"alpha").hexdigest()
+
+    monkeypatch.setenv(hashcache.CACHE_ENV, str(db))
+    monkeypatch.setenv(hashcache.VERIFY_ENV, "1")
+    assert hashcache.default_cache().verify is True
+
+
+def test_hash_cache_degrades_to_plain_hashing(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("x", encoding="utf-8")
+    f = tmp_path / "a.txt"
+    f.write_bytes(b"alpha")
+    cache = HashCache(blocker / "hashes.sqlite3")
+    assert cache.sha256_file(f) == hashlib.sha256(b"alpha").hexdigest()
+    assert cache.sha256_file(os.fspath(f)) == hashlib.sha256(b"alpha").hexdigest()
+    assert cache.hits == 0
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from exoneural_governor import hashcache
+from exoneural_governor.manifest import build_manifest
+
+
+def test_parallel_manifest_matches_serial_and_mmap_hashing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(hashcache.CACHE_ENV, "off")
+    monkeypatch.setattr(hashcache, "MMAP_MIN_BYTES", 4096)
+    root = tmp_path / "evidence"
+    blobs = {
+        "b/large.bin": bytes(range(256)) * 200,
+        "a.txt": b"alpha",
+        "b/c/empty.log": b"",
+        "z.json": b"{}",
+    }
+    for rel, data in blobs.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_bytes(data)
+
+    serial = build_manifest(root, workers=1)
+    parallel = build_manifest(root, workers=4)
+
+    assert parallel["entries"] == serial["entries"]
+    assert [e["path"] for e in parallel["entries"]] == sorted(blobs)
+    for entry in parallel["entries"]:
+        data = blobs[entry["path"]]
+        assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+        assert entry["size_bytes"] == len(data)
@@ -40,6 +40,13 @@ def test_repo_model_fixture_a_contract_and_names(tmp_path: Path) -> None:
     assert isinstance(row["outputs"], list)
 
 
+def test_repo_model_records_cli_parser_facts() -> None:
+    model = generate_repo_model(_fixture("repo_model_fixture_a"))
+    by_path = {a["path"]: a for a in model["agents"]}
+    assert by_path["scripts/run.py"]["interface"]["cli_parser_detected"] is True
+    assert by_path["Makefile"]["interface"]["cli_parser_detected"] is False
+
+
 def test_repo_model_fixture_b_import_edges() -> None:
     model = generate_repo_model(_fixture("repo_model_fixture_b"))
     edge_types = [e["edge_type"] for e in model["edges"]]
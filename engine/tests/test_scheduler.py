@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from exoneural_governor.scheduler import CommandSpec, parse_plan, plan_from_argv, run_plan
+
+
+def _recorder():
+    lock = threading.Lock()
+    events: list[tuple[str, str]] = []
+    active = {"now": 0, "peak": 0}
+
+    def run_one(i: int, spec: CommandSpec) -> str:
+        with lock:
+            events.append(("start", spec.id))
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05 if spec.id != "slow" else 0.2)
+        with lock:
+            events.append(("end", spec.id))
+            active["now"] -= 1
+        return f"{i}:{spec.id}"
+
+    return run_one, events, active
+
+
+def test_run_plan_overlaps_independent_commands_and_keeps_declaration_order() -> None:
+    plan = parse_plan(
+        [
+            {"id": "slow", "argv": ["x"]},
+            {"id": "lint", "argv": ["x"]},
+            {"id": "types", "argv": ["x"]},
+            {"id": "tests", "argv": ["x"], "needs": ["lint"]},
+        ]
+    )
+    run_one, events, active = _recorder()
+    results = run_plan(plan, run_one, jobs=2)
+
+    assert results == ["0:slow", "1:lint", "2:types", "3:tests"]
+    assert active["peak"] == 2
+    assert events.index(("end", "lint")) < events.index(("start", "tests"))
+    # "slow" is still running when the others finish: execution really overlapped.
+    assert events[-1] == ("end", "slow")
+
+
+def test_plain_argv_entries_stay_sequential() -> None:
+    plan = plan_from_argv([["a"], ["b"], ["c"]])
+    run_one, events, active = _recorder()
+    assert run_plan(plan, run_one, jobs=8) == ["0:cmd-000", "1:cmd-001", "2:cmd-002"]
+    assert active["peak"] == 1
+
+
+def test_exclusive_command_is_a_barrier() -> None:
+    plan = parse_plan(
+        [
+            {"id": "a", "argv": ["x"]},
+            {"id": "b", "argv": ["x"]},
+            {"id": "gate", "argv": ["x"], "exclusive": True},
+            {"id": "c", "argv": ["x"]},
+        ]
+    )
+    run_one, events, _ = _recorder()
+    run_plan(plan, run_one, jobs=4)
+    gate_start = events.index(("start", "gate"))
+    gate_end = events.index(("end", "gate"))
+    assert events.index(("end", "a")) < gate_start and events.index(("end", "b")) < gate_start
+    assert gate_end < events.index(("start", "c"))
+
+
+@pytest.mark.parametrize(
+    "raw, message",
+    [
+        ([{"id": "a", "argv": ["x"], "needs": ["b"]}, {"id": "b", "argv": ["x"]}], "not declared before"),
+        ([{"id": "a", "argv": ["x"]}, {"id": "a", "argv": ["y"]}], "duplicate command id"),
+    ],
+)
+def test_parse_plan_fails_closed(raw: list, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_plan(raw)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+from exoneural_governor import schema_cache
+
+GATES_PATH = Path(__file__).resolve().parents[1] / "scripts" / "check_prod_spec_gates.py"
+SCHEMA_VALIDATE_PATH = GATES_PATH.with_name("schema_validate.py")
+SPEC = importlib.util.spec_from_file_location("check_prod_spec_gates", GATES_PATH)
+assert SPEC and SPEC.loader
+check_prod_spec_gates = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = check_prod_spec_gates
+SPEC.loader.exec_module(check_prod_spec_gates)
+
+_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["name"],
+    "properties": {"name": {"type": "string", "pattern": "^[a-z]+$"}, "kind": {"enum": ["a", "b"]}},
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(schema_cache.CACHE_ENV, str(tmp_path / "stamps"))
+    schema_cache.clear()
+
+
+def _write(path: Path, schema: dict) -> Path:
+    path.write_text(json.dumps(schema), encoding="utf-8")
+    return path
+
+
+def _count_meta_checks(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    real = jsonschema.Draft202012Validator.check_schema
+
+    def counting(schema):
+        calls.append(1)
+        return real(schema)
+
+    monkeypatch.setattr(jsonschema.Draft202012Validator, "check_schema", staticmethod(counting))
+    return calls
+
+
+def test_validators_are_cached_by_schema_content(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_meta_checks(monkeypatch)
+    first = _write(tmp_path / "a.schema.json", _SCHEMA)
+    copy = _write(tmp_path / "b.schema.json", _SCHEMA)
+
+    v = schema_cache.load_validator(first)
+    assert schema_cache.load_validator(first) is v
+    assert schema_cache.load_validator(copy) is v
+    assert calls == [1]
+
+    _write(first, {**_SCHEMA, "required": ["name", "kind"]})
+    assert schema_cache.load_validator(first) is not v
+    with pytest.raises(jsonschema.ValidationError, match="'kind' is a required property"):
+        schema_cache.validate({"name": "x"}, first)
+
+
+def test_meta_validation_is_remembered_across_processes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _count_meta_checks(monkeypatch)
+    path = _write(tmp_path / "a.schema.json", _SCHEMA)
+    schema_cache.load_validator(path)
+    schema_cache.clear()  # a new process: empty in-memory cache, same stamp directory
+    schema_cache.load_validator(path)
+    assert calls == [1]
+
+    monkeypatch.setenv(schema_cache.CACHE_ENV, "off")
+    schema_cache.clear()
+    schema_cache.load_validator(path)
+    assert calls == [1, 1]
+
+
+def test_invalid_schema_is_rejected_every_time(tmp_path: Path) -> None:
+    path = _write(tmp_path / "bad.schema.json", {"type": 12})
+    for _ in range(2):
+        with pytest.raises(jsonschema.SchemaError):
+            schema_cache.load_validator(path)
+    assert not (tmp_path / "stamps").exists()
+
+
+def test_errors_match_jsonschema_validate(tmp_path: Path) -> None:
+    path = _write(tmp_path / "a.schema.json", _SCHEMA)
+    bad = {"name": "UPPER", "kind": "c"}
+    with pytest.raises(jsonschema.ValidationError) as direct:
+        jsonschema.validate(bad, _SCHEMA)
+    with pytest.raises(jsonschema.ValidationError) as cached:
+        schema_cache.validate(bad, path)
+    assert cached.value.message == direct.value.message
+
+
+def test_gate_checker_compiles_each_schema_once(tmp_path: Path) -> None:
+    path = _write(tmp_path / "pb.schema.json", _SCHEMA)
+    check_prod_spec_gates._COMPILED_SCHEMAS.clear()
+    assert check_prod_spec_gates.schema_validate({"name": "abc", "kind": "a"}, path) == (True, "ok")
+    ok, msg = check_prod_spec_gates.schema_validate({"name": "ABC"}, path)
+    assert not ok and msg == "Field name='ABC' does not match pattern ^[a-z]+$"
+    assert check_prod_spec_gates.schema_validate({"name": "abc", "kind": "z"}, path)[1].startswith("Field kind='z' not in allowed enum")
+    assert len(check_prod_spec_gates._COMPILED_SCHEMAS) == 1
+    assert check_prod_spec_gates.schema_validate({}, tmp_path / "missing.json")[1].startswith("Cannot load schema:")
+
+
+def test_schema_validate_reports_invalid_schemas(tmp_path: Path) -> None:
+    schemas = tmp_path / "schemas"
+    schemas.mkdir()
+    for name in ("root_manifest", "object_manifest", "eval_report"):
+        _write(schemas / f"{name}.schema.json", _SCHEMA)
+    _write(schemas / "object_manifest.schema.json", {**_SCHEMA, "type": "no-such-type"})
+    _write(tmp_path / "MANIFEST.json", {"name": "abc"})
+    p = subprocess.run(
+        [sys.executable, str(SCHEMA_VALIDATE_PATH), "--repo-root", str(tmp_path)],
+        capture_output=True,
+        text=True,
+        check=False,
+        env={**os.environ, schema_cache.CACHE_ENV: str(tmp_path / "stamps")},
+    )
+    assert p.returncode == 1
+    assert p.stdout.startswith(f"FAIL: invalid schema {schemas / 'object_manifest.schema.json'}: ")
+    assert "Traceback" not in p.stderr
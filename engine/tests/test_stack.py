@@ -144,3 +144,15 @@ def test_release_sets_evidence_included_false_when_missing_dir(tmp_path: Path) -
 
     rep = build_release(_cfg_for_repo(repo_root), vr_path=vr_path, output_dir=out_dir)
     assert rep["evidence_included"] is False
+
+
+def test_release_zip_is_bit_reproducible(tmp_path: Path) -> None:
+    repo_root = _repo_copy(tmp_path)
+    vr_path = tmp_path / "VR.json"
+    vr_path.write_text("{}\n", encoding="utf-8")
+    cfg = _cfg_for_repo(repo_root)
+
+    first = build_release(cfg, vr_path=vr_path, output_dir=repo_root / "tmp-release-a", workers=1)
+    second = build_release(cfg, vr_path=vr_path, output_dir=repo_root / "tmp-release-b", workers=4)
+
+    assert (repo_root / first["zip_path"]).read_bytes() == (repo_root / second["zip_path"]).read_bytes()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from exoneural_governor._exec import ResourceLimits, build_env, run_command, stream_process
+from exoneural_governor.util import run_cmd, sha256_file
+
+_NOISY = (
+    "import sys\n"
+    "out = sys.stdout.buffer\n"
+    "for i in range(20000):\n"
+    "    out.write(b'line %d\\r\\n' % i)\n"
+    "out.write(b'bad utf8: \\xff\\xfe\\r')\n"
+    "sys.stderr.buffer.write(b'err\\r\\nmore\\xc3')\n"
+)
+
+
+def test_run_cmd_streams_to_files_with_bounded_tail(tmp_path: Path) -> None:
+    out = tmp_path / "cmd.stdout.txt"
+    err = tmp_path / "cmd.stderr.txt"
+    res = run_cmd([sys.executable, "-c", _NOISY], cwd=tmp_path, stdout_path=out, stderr_path=err, tail_bytes=128)
+
+    legacy = subprocess.run([sys.executable, "-c", _NOISY], cwd=tmp_path, capture_output=True, check=False)
+    assert res.exit_code == 0
+    assert out.read_bytes() == legacy.stdout
+    assert err.read_bytes() == legacy.stderr
+    assert res.stdout_sha256 == sha256_file(out)
+    assert res.stderr_sha256 == sha256_file(err)
+    assert res.stdout_tail == legacy.stdout[-128:]
+    assert set(res.as_dict()) == {"argv", "cwd", "exit_code", "stdout_path", "stderr_path"}
+
+
+def test_run_command_digests_match_captured_text(tmp_path: Path) -> None:
+    cmd = [sys.executable, "-c", _NOISY]
+    legacy = subprocess.run(cmd, cwd=tmp_path, env=build_env(), capture_output=True, text=True, encoding="utf-8", errors="replace", check=False)
+    expected_out = hashlib.sha256(legacy.stdout.encode("utf-8", errors="replace")).hexdigest()
+    expected_err = hashlib.sha256(legacy.stderr.encode("utf-8", errors="replace")).hexdigest()
+
+    full = run_command("noisy", cmd, tmp_path)
+    assert full.stdout == legacy.stdout
+    assert full.stderr == legacy.stderr
+    assert full.as_dict()["stdout_sha256"] == expected_out
+
+    log = tmp_path / "noisy.stdout.txt"
+    teed = run_command("noisy", cmd, tmp_path, stdout_path=log, stderr_path=tmp_path / "noisy.stderr.txt", tail_bytes=64)
+    assert len(teed.stdout.encode("utf-8")) <= 64
+    assert teed.as_dict()["stdout_sha256"] == expected_out
+    assert teed.as_dict()["stderr_sha256"] == expected_err
+    assert sha256_file(log) == expected_out
+
+
+class _FullDisk:
+    def write(self, data: bytes) -> int:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+
+@pytest.mark.parametrize("limits", [None, ResourceLimits(wall_seconds=600)])
+def test_sink_error_kills_the_child_instead_of_hanging(tmp_path: Path, limits: ResourceLimits | None) -> None:
+    endless = "import sys\nwhile True:\n    sys.stdout.buffer.write(b'x' * 65536)\n"
+    with pytest.raises(OSError) as exc:
+        stream_process(
+            [sys.executable, "-c", endless],
+            cwd=tmp_path,
+            env=build_env(),
+            stdout_sink=_FullDisk(),  # type: ignore[arg-type]
+            limits=limits,
+        )
+    assert exc.value.errno == errno.ENOSPC
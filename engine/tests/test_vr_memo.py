@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+from pathlib import Path
+
+from exoneural_governor.config import Config
+from exoneural_governor.scheduler import parse_plan
+from exoneural_governor.vr import run_vr
+
+_TOOL = "import sys\nfrom pathlib import Path\nwith open(sys.argv[1], 'a') as f:\n    f.write('ran\\n')\nprint(Path('data/input.txt').read_text())\n"
+
+
+def _repo(tmp_path: Path) -> tuple[Config, Path]:
+    repo = tmp_path / "repo"
+    (repo / "data").mkdir(parents=True)
+    (repo / "catalog").mkdir()
+    (repo / "catalog" / "index.json").write_text('{"objects": []}\n', encoding="utf-8")
+    (repo / "data" / "input.txt").write_text("v1\n", encoding="utf-8")
+    (repo / "tool.py").write_text(_TOOL, encoding="utf-8")
+    (repo / "SECURITY.redaction.yml").write_text("patterns: []\n", encoding="utf-8")
+    runs = tmp_path / "runs.log"
+    plan = parse_plan(
+        [
+            {"id": "memo", "argv": [sys.executable, "tool.py", str(runs)], "inputs": ["data"]},
+            {"id": "always", "argv": [sys.executable, "-c", "print('plain')"]},
+        ]
+    )
+    cfg = Config(
+        repo_root=repo,
+        base_branch="main",
+        allowlist_globs=[],
+        baseline_commands=[list(s.argv) for s in plan],
+        artifact_name="memo-test",
+        budgets={},
+        redaction_policy_path=repo / "SECURITY.redaction.yml",
+        evidence_root_base=repo / "artifacts" / "evidence",
+        baseline_plan=plan,
+    )
+    return cfg, runs
+
+
+def test_unchanged_inputs_reuse_recorded_evidence(tmp_path: Path, monkeypatch) -> None:
+    cfg, runs = _repo(tmp_path)
+    monkeypatch.setenv("BUILD_ID", "first")
+    first = run_vr(cfg, write_back=False)
+    monkeypatch.setenv("BUILD_ID", "second")
+    second = run_vr(cfg, write_back=False)
+
+    assert runs.read_text(encoding="utf-8") == "ran\n"
+    miss, hit = first["commands"][0], second["commands"][0]
+    assert miss["cache"]["hit"] is False and miss["cache"]["input_digest"]
+    assert hit["cache"] == {
+        "hit": True,
+        "input_digest": miss["cache"]["input_digest"],
+        "source_work_id": first["work_id"],
+        "source_evidence_root": first["evidence_root"],
+        "source_utc": hit["cache"]["source_utc"],
+    }
+    assert hit["usage"] == miss["usage"]
+    assert Path(hit["stdout_path"]).parent == Path(second["evidence_root"]) / "COMMANDS"
+    assert Path(hit["stdout_path"]).read_text(encoding="utf-8") == "v1\n\n"
+    # Commands without declared inputs are never memoized.
+    assert second["commands"][1]["cache"] == {"hit": False, "input_digest": None}
+
+    (cfg.repo_root / "data" / "input.txt").write_text("v2\n", encoding="utf-8")
+    monkeypatch.setenv("BUILD_ID", "third")
+    third = run_vr(cfg, write_back=False)
+    assert third["commands"][0]["cache"]["hit"] is False
+    assert Path(third["commands"][0]["stdout_path"]).read_text(encoding="utf-8") == "v2\n\n"
+    assert runs.read_text(encoding="utf-8") == "ran\nran\n"
+
+
+def test_replay_is_checked_against_the_current_budget(tmp_path: Path, monkeypatch) -> None:
+    cfg, runs = _repo(tmp_path)
+    monkeypatch.setenv("BUILD_ID", "first")
+    run_vr(cfg, write_back=False)
+    tight = dataclasses.replace(cfg, budgets={"command_wall_seconds": 0})
+    monkeypatch.setenv("BUILD_ID", "second")
+    vr = run_vr(tight, write_back=False)
+    assert vr["commands"][0]["cache"]["hit"] is False
+    assert vr["commands"][0]["budget"]["wall_seconds"] == 0
+    assert vr["commands"][0]["budget_violations"] == ["wall_seconds"]
+    assert runs.read_text(encoding="utf-8") == "ran\nran\n"
+
+
+def test_lockfile_changes_invalidate_the_memo(tmp_path: Path, monkeypatch) -> None:
+    cfg, runs = _repo(tmp_path)
+    lock = cfg.repo_root / "requirements.lock"
+    for build, pins in (("first", "a==1\n"), ("second", "a==1\n"), ("third", "a==2\n")):
+        lock.write_text(pins, encoding="utf-8")
+        monkeypatch.setenv("BUILD_ID", build)
+        run_vr(cfg, write_back=False)
+    assert runs.read_text(encoding="utf-8") == "ran\nran\n"
+
+
+def test_failed_runs_are_not_memoized(tmp_path: Path, monkeypatch) -> None:
+    cfg, runs = _repo(tmp_path)
+    (cfg.repo_root / "data" / "input.txt").unlink()
+    (cfg.repo_root / "data" / "other.txt").write_text("x\n", encoding="utf-8")
+    for build in ("first", "second"):
+        monkeypatch.setenv("BUILD_ID", build)
+        vr = run_vr(cfg, write_back=False)
+        assert vr["commands"][0]["exit_code"] != 0
+        assert vr["commands"][0]["cache"]["hit"] is False
+    assert runs.read_text(encoding="utf-8") == "ran\nran\n"
+
+
+def test_memo_can_be_disabled(tmp_path: Path, monkeypatch) -> None:
+    cfg, runs = _repo(tmp_path)
+    monkeypatch.setenv("AXL_VR_MEMO", "off")
+    for build in ("first", "second"):
+        monkeypatch.setenv("BUILD_ID", build)
+        assert run_vr(cfg, write_back=False)["commands"][0]["cache"] == {"hit": False, "input_digest": None}
+    assert runs.read_text(encoding="utf-8") == "ran\nran\n"
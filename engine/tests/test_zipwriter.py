@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import zipfile
+import zlib
+from pathlib import Path
+
+import pytest
+
+from exoneural_governor import zipwriter
+from exoneural_governor.zipwriter import MemberStore, write_zip
+
+
+def _tree(root: Path) -> list[tuple[str, Path]]:
+    blobs = {
+        "b.txt": b"bravo\n" * 1000,
+        "a/é.md": "unicode name\n".encode("utf-8"),
+        "a/empty": b"",
+        "c.bin": os.urandom(1 << 16),
+    }
+    members = []
+    for rel, data in blobs.items():
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(data)
+        members.append((rel, p))
+    return members
+
+
+def test_write_zip_is_reproducible_and_readable(tmp_path: Path) -> None:
+    members = _tree(tmp_path / "src")
+    first = tmp_path / "one.zip"
+    second = tmp_path / "two.zip"
+    assert write_zip(first, members, workers=1) == len(members)
+    for _, p in members:
+        os.utime(p, (1_700_000_000, 1_700_000_000))
+        p.chmod(0o755)
+    write_zip(second, members, workers=4)
+
+    assert first.read_bytes() == second.read_bytes()
+    with zipfile.ZipFile(first) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == [name for name, _ in members]
+        for info, (_, p) in zip(zf.infolist(), members):
+            assert info.date_time == (1980, 1, 1, 0, 0, 0)
+            assert info.external_attr >> 16 == 0o100644
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read(info) == p.read_bytes()
+
+
+def test_write_zip_emits_zip64_records_when_limits_are_crossed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(zipwriter, "ZIP64_LIMIT", 1000)
+    monkeypatch.setattr(zipwriter, "ZIP64_COUNT_LIMIT", 2)
+    members = _tree(tmp_path / "src")
+    out = tmp_path / "z64.zip"
+    write_zip(out, members, workers=2)
+
+    with zipfile.ZipFile(out) as zf:
+        assert zf.testzip() is None
+        assert [zf.read(name) for name, _ in members] == [p.read_bytes() for _, p in members]
+
+
+def test_write_zip_rejects_duplicate_members(tmp_path: Path) -> None:
+    members = _tree(tmp_path / "src")
+    with pytest.raises(ValueError, match="duplicate zip member"):
+        write_zip(tmp_path / "dup.zip", members + members[:1], workers=2)
+
+
+def test_failed_write_keeps_the_previous_archive(tmp_path: Path) -> None:
+    members = _tree(tmp_path / "src")
+    out = tmp_path / "out" / "release.zip"
+    out.parent.mkdir()
+    write_zip(out, members, workers=2)
+    before = out.read_bytes()
+    with pytest.raises(ValueError, match="duplicate zip member"):
+        write_zip(out, members + members[:1], workers=2)
+    assert out.read_bytes() == before
+    assert [p.name for p in out.parent.iterdir()] == ["release.zip"]
+
+
+def test_member_store_splices_unchanged_members(tmp_path: Path) -> None:
+    members = _tree(tmp_path / "src")
+    store = MemberStore(tmp_path / "store")
+    plain = tmp_path / "plain.zip"
+    write_zip(plain, members, workers=2)
+
+    cold = tmp_path / "cold.zip"
+    write_zip(cold, members, workers=2, store=store)
+    assert (store.hits, store.misses) == (0, len(members))
+
+    warm = tmp_path / "warm.zip"
+    write_zip(warm, members, workers=2, store=store)
+    assert store.hits == len(members)
+    assert warm.read_bytes() == cold.read_bytes() == plain.read_bytes()
+
+    members[0][1].write_bytes(b"changed\n")
+    write_zip(tmp_path / "delta.zip", members, workers=2, store=store)
+    assert store.hits == 2 * len(members) - 1
+    with zipfile.ZipFile(tmp_path / "delta.zip") as zf:
+        assert zf.read(members[0][0]) == b"changed\n"
+
+
+def test_member_store_is_keyed_on_the_zlib_build(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    members = _tree(tmp_path / "src")
+    store = MemberStore(tmp_path / "store")
+    write_zip(tmp_path / "cold.zip", members, workers=1, store=store)
+    # Another zlib build may deflate the same bytes differently: no splicing.
+    monkeypatch.setattr(zlib, "ZLIB_RUNTIME_VERSION", zlib.ZLIB_RUNTIME_VERSION + "-other")
+    write_zip(tmp_path / "other.zip", members, workers=1, store=store)
+    assert store.hits == 0
+    write_zip(tmp_path / "again.zip", members, workers=1, store=store)
+    assert store.hits == len(members)
+
+
+def test_member_store_drops_entries_that_do_not_match_source(tmp_path: Path) -> None:
+    members = _tree(tmp_path / "src")
+    store = MemberStore(tmp_path / "store")
+    write_zip(tmp_path / "cold.zip", members, workers=1, store=store)
+    name, src = members[0]
+    entry = next(p for p in (tmp_path / "store").rglob("*") if p.is_file() and p.name == hashlib.sha256(src.read_bytes()).hexdigest())
+    # Same header (crc32, size of the source), deflate stream of other bytes.
+    header = entry.read_bytes()[: MemberStore._HEADER.size]
+    forged = zlib.compressobj(6, zlib.DEFLATED, -15)
+    entry.write_bytes(header + forged.compress(b"x" * len(src.read_bytes())) + forged.flush())
+
+    out = tmp_path / "rebuilt.zip"
+    write_zip(out, members, workers=1, store=store)
+    assert store.hits == len(members) - 1
+    with zipfile.ZipFile(out) as zf:
+        assert zf.read(name) == src.read_bytes()
+    assert out.read_bytes() == (tmp_path / "cold.zip").read_bytes()
+    # The bad entry was replaced by a fresh one.
+    write_zip(tmp_path / "again.zip", members, workers=1, store=store)
+    assert store.hits == 2 * len(members) - 1
+
+
+def test_stored_member_header_is_checked(tmp_path: Path) -> None:
+    members = _tree(tmp_path / "src")
+    store = MemberStore(tmp_path / "store")
+    write_zip(tmp_path / "a.zip", members, method=zipfile.ZIP_STORED, store=store)
+    for entry in (p for p in (tmp_path / "store").rglob("*") if p.is_file()):
+        magic, crc, size = MemberStore._HEADER.unpack(entry.read_bytes())
+        entry.write_bytes(MemberStore._HEADER.pack(magic, crc ^ 1, size))
+    write_zip(tmp_path / "b.zip", members, method=zipfile.ZIP_STORED, store=store)
+    assert store.hits == 0
+    assert (tmp_path / "b.zip").read_bytes() == (tmp_path / "a.zip").read_bytes()
+
+
+def test_stored_members_match_zipfile_output(tmp_path: Path) -> None:
+    members = _tree(tmp_path / "src")
+    expected = tmp_path / "expected.zip"
+    with zipfile.ZipFile(expected, "w", compression=zipfile.ZIP_STORED) as z:
+        for name, p in members:
+            zi = zipfile.ZipInfo(name)
+            zi.date_time = (1980, 1, 1, 0, 0, 0)
+            zi.external_attr = 0o100644 << 16
+            z.writestr(zi, p.read_bytes())
+
+    store = MemberStore(tmp_path / "store")
+    for i in range(2):
+        out = tmp_path / f"stored{i}.zip"
+        write_zip(out, members, method=zipfile.ZIP_STORED, store=store)
+        assert out.read_bytes() == expected.read_bytes()
+    assert store.hits == len(members)
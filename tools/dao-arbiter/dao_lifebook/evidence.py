@@ -79,8 +79,8 @@ class ProofAssembler:
             pr_url=pr_url,
             commit_sha=commit_sha,
             required_checks_final=check_results,
-            local_gates=local_gates or [],
-            artifacts=artifacts or [],
+            local_gates=local_gates or (),
+            artifacts=artifacts or (),
             diff_summary=diff_summary,
             time=TimeSpan(t_start=t_start, t_green=t_green),
         )
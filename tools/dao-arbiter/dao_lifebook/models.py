@@ -21,17 +21,20 @@ import enum
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, Mapping
 
 from pydantic import (
     BaseModel,
     Field,
+    PrivateAttr,
     field_validator,
     model_validator,
     ConfigDict,
 )
 
 SCHEMA_VERSION = "2026.2.0"
+# Built once: json.dumps(sort_keys=True, ...) constructs an encoder per call.
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
 _MAX_HISTORY = 2000
 
 
@@ -292,11 +295,13 @@ class ProofBundle(BaseModel):
     schema_version: str = SCHEMA_VERSION
     pr_url: str
     commit_sha: str
-    required_checks_final: list[CheckResult]
-    local_gates: list[LocalGateResult] = Field(default_factory=list)
-    artifacts: list[ArtifactRef] = Field(default_factory=list)
+    # Tuples, not lists: the bundle is frozen and integrity_hash() is memoized.
+    required_checks_final: tuple[CheckResult, ...]
+    local_gates: tuple[LocalGateResult, ...] = ()
+    artifacts: tuple[ArtifactRef, ...] = ()
     diff_summary: DiffSummary
     time: TimeSpan
+    _integrity_hash: str | None = PrivateAttr(default=None)
 
     @property
     def all_green(self) -> bool:
@@ -305,12 +310,21 @@ class ProofBundle(BaseModel):
             return False
         return all(c.status.is_green for c in self.required_checks_final)
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> ProofBundle:
+        # model_copy carries private attributes over and skips model_post_init:
+        # drop the memo so the copy hashes its own (possibly updated) fields.
+        copied = super().model_copy(update=update, deep=deep)
+        copied._integrity_hash = None
+        return copied
+
     def integrity_hash(self) -> str:
-        """Deterministic hash — sorted keys, stable separators."""
-        data = self.model_dump(mode="json")
-        data.pop("schema_version", None)
-        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
-        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        """Deterministic hash — sorted keys, stable separators.  Memoized (the model is frozen)."""
+        if self._integrity_hash is None:
+            data = self.model_dump(mode="json")
+            data.pop("schema_version", None)
+            canonical = _CANONICAL_JSON.encode(data)
+            self._integrity_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return self._integrity_hash
 
 
 # ─── Governor Decision ───────────────────────────────────────────────────────
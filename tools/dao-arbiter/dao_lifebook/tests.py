@@ -274,6 +274,13 @@ class TestProofBundle:
         expected = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
         assert b.integrity_hash() == expected
 
+    def test_integrity_hash_memoized(self):
+        b = self._make_bundle()
+        h = b.integrity_hash()
+        assert b._integrity_hash == h
+        assert "_integrity_hash" not in b.model_dump()
+        assert ProofBundle.model_validate(b.model_dump()).integrity_hash() == h
+
     def test_schema_version_excluded_from_hash(self):
         """Schema version bumps must not invalidate existing hashes."""
         b1 = self._make_bundle()
@@ -10,14 +10,13 @@ Both modules produce auditable metrics and feed G10-SYNC / G11-INVARIANT_FIXATIO
 """
 from __future__ import annotations
 
-import hashlib
-import json
 import time
 from collections import deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
+from ..canonical import sha256_canonical
 from .gates import CIL9Snapshot, CIL10Snapshot, GateRunResult, GateStatus
 from .typed_plan import SPS
 
@@ -30,8 +29,7 @@ def _utc() -> str:
     return datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 def _sha256(obj: Any) -> str:
-    b = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
-    return hashlib.sha256(b).hexdigest()
+    return sha256_canonical(obj)
 
 
 # ──────────────────────────────────────────────
@@ -115,11 +113,9 @@ class UDSInput:
     uds_hash:        str = ""
 
     def __post_init__(self) -> None:
-        payload = json.dumps(
-            {"intent": self.intent, "constraints": self.constraints, "objective": self.objective},
-            sort_keys=True, separators=(",", ":"),
-        ).encode()
-        self.uds_hash = hashlib.sha256(payload).hexdigest()
+        self.uds_hash = sha256_canonical(
+            {"intent": self.intent, "constraints": self.constraints, "objective": self.objective}
+        )
 
     def as_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -14,12 +14,11 @@ All gates are fail-closed: FAIL => block execution, emit PB.
 """
 from __future__ import annotations
 
-import hashlib
-import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, asdict
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..canonical import canonical_json, join_array, memoize, sha256_canonical, sha256_hex
 from .identity import AAID, ACRootKey, APBHeader, jws_verify, zto_verify
 from .typed_plan import GateResult, SPS, SMTGate, build_ac_baseline_invariants
 
@@ -35,12 +34,18 @@ class GateStatus(str, Enum):
     NOT_READY   = "NOT_READY"
 
 
-@dataclass
+@dataclass(frozen=True)
 class GateRunResult:
     gate_id:    str
     status:     GateStatus
-    evidence:   List[str] = field(default_factory=list)
-    violations: List[str] = field(default_factory=list)
+    evidence:   Tuple[str, ...] = ()
+    violations: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Frozen and memoized: store the sequences immutably so the cached
+        # canonical bytes cannot go stale behind a caller's list.
+        object.__setattr__(self, "evidence", tuple(self.evidence))
+        object.__setattr__(self, "violations", tuple(self.violations))
 
     @property
     def passed(self) -> bool:
@@ -49,8 +54,14 @@ class GateRunResult:
     def as_dict(self) -> Dict[str, Any]:
         d = asdict(self)
         d["status"] = self.status.value
+        d["evidence"] = list(self.evidence)
+        d["violations"] = list(self.violations)
         return d
 
+    @memoize
+    def canonical_bytes(self) -> bytes:
+        return canonical_json(self.as_dict())
+
 
 # ──────────────────────────────────────────────
 # G6-AUTH
@@ -126,13 +137,12 @@ class EnvironmentProfile:
     env_fingerprint_hash: str = ""         # SHA256 of canonical profile
 
     def compute_fingerprint(self) -> str:
-        payload = json.dumps({
+        self.env_fingerprint_hash = sha256_canonical({
             "profile_id":     self.profile_id,
             "python_version": self.python_version,
             "platform":       self.platform,
             "toolchain_pins": self.toolchain_pins,
-        }, sort_keys=True, separators=(",", ":")).encode()
-        self.env_fingerprint_hash = hashlib.sha256(payload).hexdigest()
+        })
         return self.env_fingerprint_hash
 
     def as_dict(self) -> Dict[str, Any]:
@@ -422,11 +432,7 @@ class GateRunnerResult:
     @property
     def gate_results_hash(self) -> str:
         """Deterministic hash over all gate results — included in APB."""
-        payload = json.dumps(
-            [r.as_dict() for r in self.results],
-            sort_keys=True, separators=(",", ":")
-        ).encode()
-        return hashlib.sha256(payload).hexdigest()
+        return sha256_hex(join_array(r.canonical_bytes() for r in self.results))
 
     def summary(self) -> Dict[str, str]:
         return {r.gate_id: r.status.value for r in self.results}
@@ -29,6 +29,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from ..canonical import canonical_json, sha256_hex
 
 # ──────────────────────────────────────────────
 # Constants
@@ -51,11 +52,11 @@ def _utc_now() -> str:
 def _b64url(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
 
-def _sha256hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+_sha256hex = sha256_hex
 
 def _canonical_json(obj: Any) -> bytes:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    # APB / JWS payloads keep non-ASCII literal (ensure_ascii=False).
+    return canonical_json(obj, ensure_ascii=False)
 
 
 # ──────────────────────────────────────────────
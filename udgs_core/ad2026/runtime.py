@@ -12,7 +12,6 @@ AD2026Runtime:
 """
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 from dataclasses import dataclass, asdict
@@ -20,6 +19,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..autonomous_audit import AutonomousAuditEngine, Qa8Mode
+from ..canonical import sha256_canonical
 from .identity import (
     AAID, ACRootKey, APBChain, EvidenceKind, EvidenceRef,
     ENV_CLASS_NO_TEE, _canonical_json, _sha256hex,
@@ -229,9 +229,7 @@ class AD2026Runtime:
             toolchain_pins=tc_pins,
         )
         pinned_env_fp = env_profile.compute_fingerprint()
-        pinned_tc_hash = _sha256hex(
-            json.dumps(tc_pins, sort_keys=True, separators=(",", ":")).encode()
-        )
+        pinned_tc_hash = sha256_canonical(tc_pins)
 
         # MCP policy with default token
         default_token = RCToken(
@@ -310,12 +308,8 @@ class AD2026Runtime:
         )
 
         # Toolchain hash reproducibility for T1
-        tc_hash_a = _sha256hex(
-            json.dumps(self.ac.toolchain_pins, sort_keys=True, separators=(",", ":")).encode()
-        )
-        tc_hash_b = _sha256hex(
-            json.dumps(self.ac.toolchain_pins, sort_keys=True, separators=(",", ":")).encode()
-        )
+        tc_hash_a = sha256_canonical(self.ac.toolchain_pins)
+        tc_hash_b = sha256_canonical(self.ac.toolchain_pins)
 
         summary = self.telemetry.run_all_auto(
             ac_canonical_bytes=self.ac.canonical_bytes(),
@@ -378,9 +372,7 @@ class AD2026Runtime:
         gate_results.append(g7_result)
 
         # G8-SANDBOX
-        live_tc_hash = _sha256hex(
-            json.dumps(self.ac.toolchain_pins, sort_keys=True, separators=(",", ":")).encode()
-        )
+        live_tc_hash = sha256_canonical(self.ac.toolchain_pins)
         g8_result = self.g8.run(
             live_env=self.env_profile,
             pinned_fingerprint=self.pinned_env_fp,
@@ -12,12 +12,11 @@ Implements:
 """
 from __future__ import annotations
 
-import hashlib
-import json
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from ..canonical import canonical_json, sha256_hex
 
 # ──────────────────────────────────────────────
 # Typed Action  (AD-2026 §1.2)
@@ -88,10 +87,10 @@ class SPS:
             "utc":     self.utc,
             "actions": [a.as_dict() for a in self.actions],
         }
-        return json.dumps(d, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return canonical_json(d)
 
     def sha256(self) -> str:
-        return hashlib.sha256(self.canonical_bytes()).hexdigest()
+        return sha256_hex(self.canonical_bytes())
 
     def as_dict(self) -> Dict[str, Any]:
         return {
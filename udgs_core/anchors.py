@@ -3,28 +3,52 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Tuple, Optional, Set
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple, Optional, Set
+
+from .canonical import sha256_canonical
 
 
 def sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+class ReadCounter:
+    """Files and bytes read by sha256_file in this process; thread-safe."""
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, nbytes: int) -> None:
+        with self._lock:
+            self.files += 1
+            self.bytes += nbytes
+
+
+READS = ReadCounter()
+
+
 def sha256_file(path: str, *, chunk_size: int = 1024 * 1024) -> str:
     h = hashlib.sha256()
+    nbytes = 0
     with open(path, "rb") as f:
         while True:
             chunk = f.read(chunk_size)
             if not chunk:
                 break
             h.update(chunk)
+            nbytes += len(chunk)
+    READS.add(nbytes)
     return h.hexdigest()
 
 
 def sha256_json(obj: Dict[str, Any]) -> str:
-    payload = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return sha256_bytes(payload)
+    return sha256_canonical(obj)
 
 
 def iter_files(root: str) -> Iterable[str]:
@@ -34,22 +58,653 @@ def iter_files(root: str) -> Iterable[str]:
             yield os.path.join(dirpath, fn)
 
 
-def sha256_tree(root: str, *, exclude_rel_paths: Optional[Set[str]] = None, exclude_rel_prefixes: Optional[Set[str]] = None) -> Tuple[str, Dict[str, str]]:
+class PrefixTrie:
+    """Character trie answering "does any excluded prefix start this path?" in O(len(path))."""
+
+    _END = ""
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        self._root: Dict[str, Any] = {}
+        for prefix in prefixes:
+            node = self._root
+            for ch in prefix:
+                node = node.setdefault(ch, {})
+            node[self._END] = True
+
+    def __bool__(self) -> bool:
+        return bool(self._root)
+
+    def matches(self, s: str) -> bool:
+        node = self._root
+        if self._END in node:
+            return True
+        for ch in s:
+            node = node.get(ch)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+
+def _scan_tree(root: str, exclude_rel_paths: Set[str], prefixes: PrefixTrie, start_rel: str = "") -> List[Tuple[str, str]]:
+    """(rel, abs) of every file, in os.walk(root) order with sorted names.
+
+    ``start_rel`` ("dir/sub/") restricts the scan to that subtree; rel paths stay
+    relative to root.
+
+    Same selection as os.walk: symlinked directories are listed but not entered,
+    symlinks to files count as files and unreadable directories are skipped. A
+    directory whose "rel/" already starts with an excluded prefix is pruned
+    without being listed, since every path under it would be excluded too.
+    """
+    out: List[Tuple[str, str]] = []
+    stack: List[Tuple[str, str]] = [(os.path.join(root, start_rel) if start_rel else root, start_rel)]
+    while stack:
+        dirpath, dir_rel = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs: List[Tuple[str, str]] = []
+        for entry in entries:
+            rel = dir_rel + entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink() and not (prefixes and prefixes.matches(rel + "/")):
+                    subdirs.append((entry.path, rel + "/"))
+            elif rel not in exclude_rel_paths and not (prefixes and prefixes.matches(rel)):
+                out.append((rel, entry.path))
+        stack.extend(reversed(subdirs))
+    return out
+
+
+def sha256_tree(
+    root: str,
+    *,
+    exclude_rel_paths: Optional[Set[str]] = None,
+    exclude_rel_prefixes: Optional[Set[str]] = None,
+    workers: Optional[int] = None,
+) -> Tuple[str, Dict[str, str]]:
     """
     Deterministic directory hashing:
-    - hashes each file
+    - hashes each file (on ``workers`` threads, default: CPU count)
     - hashes the sorted mapping of relative paths -> file hash
     Returns: (tree_hash, file_hashes)
     """
-    file_hashes: Dict[str, str] = {}
     root = os.path.abspath(root)
-    exclude_rel_paths = set(exclude_rel_paths or set())
-    exclude_rel_prefixes = set(exclude_rel_prefixes or set())
-    for path in iter_files(root):
-        rel = os.path.relpath(path, root).replace("\\", "/")
-        if rel in exclude_rel_paths or any(rel.startswith(prefix) for prefix in exclude_rel_prefixes):
-            continue
-        file_hashes[rel] = sha256_file(path)
+    files = _scan_tree(root, set(exclude_rel_paths or set()), PrefixTrie(exclude_rel_prefixes or ()))
+    file_hashes = _hash_files(files, workers)
 
     tree_hash = sha256_json(file_hashes)
     return tree_hash, file_hashes
+
+
+@dataclass(frozen=True)
+class TreeSpec:
+    """One tree for sha256_trees: a directory relative to the common root plus its
+    sha256_tree exclusions (relative to that directory)."""
+
+    path: str = "."
+    exclude_rel_paths: FrozenSet[str] = frozenset()
+    exclude_rel_prefixes: FrozenSet[str] = frozenset()
+
+
+class _Selector:
+    def __init__(self, spec: TreeSpec) -> None:
+        rel = "/".join(_split_rel(spec.path))
+        self.prefix = rel + "/" if rel else ""
+        self.paths = set(spec.exclude_rel_paths)
+        self.trie = PrefixTrie(spec.exclude_rel_prefixes)
+
+    def wants_dir(self, d: str) -> bool:
+        """Whether a walk must enter directory d ("rel/"): it leads to or lies in this tree and is not pruned."""
+        if self.prefix.startswith(d):
+            return True
+        if not d.startswith(self.prefix):
+            return False
+        return not (self.trie and self.trie.matches(d[len(self.prefix):]))
+
+    def selects(self, f: str) -> bool:
+        if not f.startswith(self.prefix):
+            return False
+        local = f[len(self.prefix):]
+        return local not in self.paths and not (self.trie and self.trie.matches(local))
+
+
+def tree_filter(specs: Iterable[TreeSpec]) -> Callable[[str], bool]:
+    """Predicate over root-relative paths ("rel/" for directories): True for the
+    files sha256_trees(root, specs) would select and the directories it would enter."""
+    selectors = [_Selector(spec) for spec in specs]
+
+    def include(rel: str) -> bool:
+        if rel.endswith("/"):
+            return any(s.wants_dir(rel) for s in selectors)
+        return any(s.selects(rel) for s in selectors)
+
+    return include
+
+
+def _real_chain(root: str, outer: str, inner: str) -> bool:
+    """Whether every directory from outer (exclusive) to inner (inclusive) is a real, non-symlinked directory."""
+    acc = outer
+    for part in inner[len(outer):].rstrip("/").split("/"):
+        acc += part
+        full = os.path.join(root, acc)
+        if os.path.islink(full) or not os.path.isdir(full):
+            return False
+        acc += "/"
+    return True
+
+
+def _scan_selected(root: str, start: str, selectors: List[_Selector]) -> List[Tuple[str, str, List[int]]]:
+    """(rel, abs, selecting tree indexes) for every file under start that some tree selects.
+
+    Same traversal rules as _scan_tree; a directory is entered when any tree needs it."""
+    out: List[Tuple[str, str, List[int]]] = []
+    stack: List[Tuple[str, str]] = [(os.path.join(root, start) if start else root, start)]
+    while stack:
+        dirpath, dir_rel = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs: List[Tuple[str, str]] = []
+        for entry in entries:
+            rel = dir_rel + entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink() and any(sel.wants_dir(rel + "/") for sel in selectors):
+                    subdirs.append((entry.path, rel + "/"))
+            else:
+                owners = [i for i, sel in enumerate(selectors) if sel.selects(rel)]
+                if owners:
+                    out.append((rel, entry.path, owners))
+        stack.extend(reversed(subdirs))
+    return out
+
+
+def sha256_trees(
+    root: str,
+    specs: Dict[str, TreeSpec],
+    *,
+    workers: Optional[int] = None,
+    state: Optional["StatState"] = None,
+    verify: bool = False,
+    executor: Optional[Executor] = None,
+    stats: Optional["HashStats"] = None,
+) -> Dict[str, Tuple[str, Dict[str, str]]]:
+    """sha256_tree for several, possibly nested, trees under root, reading each file once.
+
+    Returns {name: (tree_hash, file_hashes)}, each identical to
+    sha256_tree(os.path.join(root, spec.path), exclude_rel_paths=..., exclude_rel_prefixes=...).
+    A tree nested in another is collected by the outer tree's walk unless a
+    symlinked or missing directory lies on the way to it; such trees get their
+    own walk, as sha256_tree would follow a symlinked top directory.
+
+    ``state`` (keyed by paths relative to root) serves files whose stat is
+    unchanged since the previous scan and afterwards holds exactly this scan's
+    files. ``verify`` rereads every file, bypassing the state.
+    ``executor`` hashes on a caller-owned pool instead of a private one.
+    ``stats`` receives the number of files visited and per-tree hash times.
+    """
+    root = os.path.abspath(root)
+    names = list(specs)
+    selectors = [_Selector(specs[n]) for n in names]
+    # Walk roots: outermost trees first; nested trees join the walk that reaches them.
+    walks: Dict[str, List[int]] = {}
+    for i in sorted(range(len(names)), key=lambda i: len(selectors[i].prefix)):
+        prefix = selectors[i].prefix
+        outer = next(
+            (w for w in walks if prefix.startswith(w) and (w == prefix or _real_chain(root, w, prefix))),
+            None,
+        )
+        walks.setdefault(prefix if outer is None else outer, []).append(i)
+
+    per_tree: List[List[Tuple[str, str]]] = [[] for _ in names]
+    unique: Dict[str, str] = {}
+    for start, members in walks.items():
+        group = [selectors[i] for i in members]
+        for rel, path, owners in _scan_selected(root, start, group):
+            unique.setdefault(rel, path)
+            for j in owners:
+                per_tree[members[j]].append((rel, path))
+    timings: Optional[Dict[str, float]] = {} if stats is not None else None
+    digests = _hash_files(list(unique.items()), workers, state=state, verify=verify, executor=executor, timings=timings)
+    if state is not None:
+        state.retain(unique)
+    if stats is not None and timings is not None:
+        stats.files += len(unique)
+        for i, name in enumerate(names):
+            stats.seconds[name] = stats.seconds.get(name, 0.0) + sum(timings[rel] for rel, _ in per_tree[i])
+
+    out: Dict[str, Tuple[str, Dict[str, str]]] = {}
+    for i, name in enumerate(names):
+        cut = len(selectors[i].prefix)
+        file_hashes = {rel[cut:]: digests[rel] for rel, _ in per_tree[i]}
+        out[name] = (sha256_json(file_hashes), file_hashes)
+    return out
+
+
+def _hash_files(
+    files: List[Tuple[str, str]],
+    workers: Optional[int],
+    *,
+    state: Optional["StatState"] = None,
+    verify: bool = False,
+    executor: Optional[Executor] = None,
+    timings: Optional[Dict[str, float]] = None,
+) -> Dict[str, str]:
+    """{rel: sha256}; ``timings``, when given, receives each file's hashing seconds."""
+    if state is not None:
+        def hash_one(item: Tuple[str, str]) -> str:
+            return state.sha256(item[0], item[1], verify=verify)
+    else:
+        def hash_one(item: Tuple[str, str]) -> str:
+            return sha256_file(item[1])
+
+    if timings is None:
+        one = hash_one
+    else:
+        def one(item: Tuple[str, str]) -> str:
+            t0 = time.perf_counter()
+            digest = hash_one(item)
+            timings[item[0]] = time.perf_counter() - t0
+            return digest
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if executor is not None and len(files) > 1:
+        digests = list(executor.map(one, files))
+    elif workers <= 1 or len(files) <= 1:
+        digests = [one(item) for item in files]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = list(pool.map(one, files))
+    return {rel: digest for (rel, _), digest in zip(files, digests)}
+
+
+@dataclass
+class HashStats:
+    """Counters filled in by sha256_trees(stats=...).
+
+    ``seconds`` is per tree: the time spent hashing (or serving from cache) the
+    files it selects; a file shared by nested trees counts toward each of them.
+    """
+
+    files: int = 0
+    seconds: Dict[str, float] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Stat snapshots
+# ---------------------------------------------------------------------------
+
+STAT_STATE_SCHEMA = "udgs-stat-state/1"
+# A file modified this close to the scan may be written again within the same
+# timestamp tick; StatState does not record it until it is older.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class StatState:
+    """Per-file (size, mtime_ns, ctime_ns, inode, sha256) of the previous scan.
+
+    A file whose stat tuple is unchanged is not read again: an idle rescan
+    costs one stat per file. Entries are only recorded once a file is older
+    than ``RACY_WINDOW_NS``. A stat-preserving rewrite goes unnoticed until the next
+    ``verify`` pass; ``verified_at`` (epoch seconds) records the last one.
+    """
+
+    def __init__(self, files: Optional[Dict[str, List[Any]]] = None, verified_at: Optional[float] = None) -> None:
+        self.files: Dict[str, List[Any]] = dict(files or {})
+        self.verified_at = verified_at
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+        self._lock = threading.Lock()
+
+    def sha256(self, rel: str, path: str, *, verify: bool = False) -> str:
+        st = os.stat(path)
+        sig = [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+        entry = self.files.get(rel)
+        if not verify and entry is not None and entry[:4] == sig:
+            with self._lock:
+                self.hits += 1
+            return entry[4]
+        digest = sha256_file(path)
+        racy = time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) < RACY_WINDOW_NS
+        with self._lock:
+            self.misses += 1
+            if racy:
+                self.changed |= self.files.pop(rel, None) is not None
+            elif entry != sig + [digest]:
+                self.files[rel] = sig + [digest]
+                self.changed = True
+        return digest
+
+    def retain(self, rels: Iterable[str]) -> None:
+        """Forget files that the latest scan no longer saw."""
+        keep = set(rels)
+        gone = [rel for rel in self.files if rel not in keep]
+        for rel in gone:
+            del self.files[rel]
+        self.changed |= bool(gone)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"schema": STAT_STATE_SCHEMA, "verified_at": self.verified_at, "files": dict(sorted(self.files.items()))}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StatState":
+        if data.get("schema") != STAT_STATE_SCHEMA:
+            raise ValueError(f"E_STAT_STATE_SCHEMA: {data.get('schema')!r}")
+        files = data["files"]
+        for rel, entry in files.items():
+            if not (isinstance(entry, list) and len(entry) == 5 and isinstance(entry[4], str)):
+                raise ValueError(f"E_STAT_STATE_ENTRY: {rel}")
+        verified_at = data.get("verified_at")
+        return cls(files, float(verified_at) if verified_at is not None else None)
+
+
+def save_stat_state(path: str, state: StatState) -> None:
+    tmp = f"{path}.tmp.{os.getpid()}"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state.as_dict(), f, separators=(",", ":"))
+    os.replace(tmp, path)
+    state.changed = False
+
+
+def load_stat_state(path: str) -> Optional[StatState]:
+    """The persisted snapshot, or None when it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return StatState.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Merkle anchors
+# ---------------------------------------------------------------------------
+
+MERKLE_SCHEMA = "udgs-merkle/1"
+
+
+@dataclass
+class MerkleNode:
+    """One directory: its files' sha256, its subdirectories and its digest.
+
+    digest = sha256_json({"files": {name: sha256}, "dirs": {name: child digest}});
+    directories without any (non-excluded) file below them are not represented,
+    exactly as they do not contribute to the flat tree hash.
+    """
+
+    files: Dict[str, str] = field(default_factory=dict)
+    dirs: Dict[str, "MerkleNode"] = field(default_factory=dict)
+    digest: str = ""
+
+    def recompute(self) -> str:
+        self.digest = sha256_json({"files": self.files, "dirs": {n: c.digest for n, c in self.dirs.items()}})
+        return self.digest
+
+    def seal(self) -> str:
+        """Recompute every digest in this subtree (children first)."""
+        for child in self.dirs.values():
+            child.seal()
+        return self.recompute()
+
+    def copy(self) -> "MerkleNode":
+        return MerkleNode(dict(self.files), {n: c.copy() for n, c in self.dirs.items()}, self.digest)
+
+
+class MerkleTree:
+    """Per-directory digests over the same file selection as sha256_tree.
+
+    ``tree_hash()`` is the flat anchor (identical to sha256_tree); ``root_digest``
+    and the per-directory digests let ``update`` rehash only dirty paths and
+    ``diff`` name the changed subtrees by descending only into differing digests.
+    """
+
+    def __init__(
+        self,
+        node: MerkleNode,
+        *,
+        exclude_rel_paths: Iterable[str] = (),
+        exclude_rel_prefixes: Iterable[str] = (),
+    ) -> None:
+        self.node = node
+        self.exclude_rel_paths = frozenset(exclude_rel_paths)
+        self.exclude_rel_prefixes = frozenset(exclude_rel_prefixes)
+
+    @classmethod
+    def build(
+        cls,
+        root: str,
+        *,
+        exclude_rel_paths: Optional[Set[str]] = None,
+        exclude_rel_prefixes: Optional[Set[str]] = None,
+        workers: Optional[int] = None,
+    ) -> "MerkleTree":
+        root = os.path.abspath(root)
+        files = _scan_tree(root, set(exclude_rel_paths or set()), PrefixTrie(exclude_rel_prefixes or ()))
+        return cls.from_file_hashes(
+            _hash_files(files, workers),
+            exclude_rel_paths=exclude_rel_paths or (),
+            exclude_rel_prefixes=exclude_rel_prefixes or (),
+        )
+
+    @classmethod
+    def from_file_hashes(cls, file_hashes: Dict[str, str], **excludes: Iterable[str]) -> "MerkleTree":
+        node = MerkleNode()
+        for rel, digest in file_hashes.items():
+            *dirs, name = rel.split("/")
+            cur = node
+            for d in dirs:
+                cur = cur.dirs.setdefault(d, MerkleNode())
+            cur.files[name] = digest
+        _sort_node(node, recursive=True)
+        node.seal()
+        return cls(node, **excludes)
+
+    def copy(self) -> "MerkleTree":
+        """Independent copy (update() changes a tree in place)."""
+        return MerkleTree(
+            self.node.copy(), exclude_rel_paths=self.exclude_rel_paths, exclude_rel_prefixes=self.exclude_rel_prefixes
+        )
+
+    @property
+    def root_digest(self) -> str:
+        return self.node.digest
+
+    def same_selection(self, *, exclude_rel_paths: Iterable[str] = (), exclude_rel_prefixes: Iterable[str] = ()) -> bool:
+        return self.exclude_rel_paths == frozenset(exclude_rel_paths) and self.exclude_rel_prefixes == frozenset(exclude_rel_prefixes)
+
+    def file_hashes(self) -> Dict[str, str]:
+        """Flat {rel: sha256} in sha256_tree (os.walk) order."""
+        out: Dict[str, str] = {}
+
+        def walk(node: MerkleNode, prefix: str) -> None:
+            for name in sorted(node.files):
+                out[prefix + name] = node.files[name]
+            for name in sorted(node.dirs):
+                walk(node.dirs[name], prefix + name + "/")
+
+        walk(self.node, "")
+        return out
+
+    def tree_hash(self) -> str:
+        return sha256_json(self.file_hashes())
+
+    def digest(self, rel_dir: str = "") -> Optional[str]:
+        node = self._node_at(_split_rel(rel_dir))
+        return node.digest if node is not None else None
+
+    def _node_at(self, parts: List[str]) -> Optional[MerkleNode]:
+        node: Optional[MerkleNode] = self.node
+        for part in parts:
+            node = node.dirs.get(part) if node is not None else None
+        return node
+
+    def diff(self, other: "MerkleTree") -> List[str]:
+        """Paths that differ: changed/added/removed files, and "dir/" for subtrees present on one side only."""
+        out: List[str] = []
+
+        def walk(a: MerkleNode, b: MerkleNode, prefix: str) -> None:
+            if a.digest == b.digest:
+                return
+            for name in sorted(set(a.files) | set(b.files)):
+                if a.files.get(name) != b.files.get(name):
+                    out.append(prefix + name)
+            for name in sorted(set(a.dirs) | set(b.dirs)):
+                ca, cb = a.dirs.get(name), b.dirs.get(name)
+                if ca is None or cb is None:
+                    out.append(prefix + name + "/")
+                else:
+                    walk(ca, cb, prefix + name + "/")
+
+        walk(self.node, other.node, "")
+        return out
+
+    def update(
+        self,
+        root: str,
+        dirty_paths: Iterable[str],
+        *,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> int:
+        """Rehash only ``dirty_paths`` (files or directories, relative to root; created,
+        modified or deleted) and recombine the digests of their ancestors.
+        Returns the number of files hashed."""
+        root = os.path.abspath(root)
+        dirty: List[str] = []
+        for rel in sorted({"/".join(_split_rel(p)) for p in dirty_paths}):
+            if not any(rel == d or d == "" or rel.startswith(d + "/") for d in dirty):
+                dirty.append(rel)
+        if "" in dirty:
+            self.node = MerkleTree.build(
+                root,
+                exclude_rel_paths=set(self.exclude_rel_paths),
+                exclude_rel_prefixes=set(self.exclude_rel_prefixes),
+                workers=workers,
+            ).node
+            return len(self.file_hashes())
+
+        prefixes = PrefixTrie(self.exclude_rel_prefixes)
+        files: List[Tuple[str, str]] = []
+        touched: Set[Tuple[str, ...]] = set()
+        for rel in dirty:
+            parts = rel.split("/")
+            parent = self._node_at(parts[:-1])
+            if parent is not None:
+                parent.files.pop(parts[-1], None)
+                parent.dirs.pop(parts[-1], None)
+            touched.update(tuple(parts[:i]) for i in range(len(parts)))
+            files.extend(self._rescan(root, rel, prefixes))
+
+        for rel, digest in _hash_files(files, workers, executor=executor).items():
+            *dirs, name = rel.split("/")
+            cur = self.node
+            for i, d in enumerate(dirs):
+                cur = cur.dirs.setdefault(d, MerkleNode())
+                touched.add(tuple(dirs[: i + 1]))
+            cur.files[name] = digest
+
+        # Children before parents; drop directories left without files.
+        for parts_t in sorted(touched, key=len, reverse=True):
+            node = self._node_at(list(parts_t))
+            if node is None:
+                continue
+            if parts_t and not node.files and not node.dirs:
+                parent = self._node_at(list(parts_t[:-1]))
+                if parent is not None:
+                    parent.dirs.pop(parts_t[-1], None)
+                continue
+            _sort_node(node)
+            node.recompute()
+        return len(files)
+
+    def _rescan(self, root: str, rel: str, prefixes: PrefixTrie) -> List[Tuple[str, str]]:
+        """Files at or under rel that sha256_tree would select."""
+        parts = rel.split("/")
+        acc = ""
+        for part in parts[:-1]:
+            acc += part
+            full = os.path.join(root, acc)
+            if os.path.islink(full) or not os.path.isdir(full) or (prefixes and prefixes.matches(acc + "/")):
+                return []
+            acc += "/"
+        full = os.path.join(root, *parts)
+        if os.path.isdir(full):
+            if os.path.islink(full) or (prefixes and prefixes.matches(rel + "/")):
+                return []
+            return _scan_tree(root, set(self.exclude_rel_paths), prefixes, start_rel=rel + "/")
+        if os.path.lexists(full) and rel not in self.exclude_rel_paths and not (prefixes and prefixes.matches(rel)):
+            return [(rel, full)]
+        return []
+
+    def as_dict(self) -> Dict[str, Any]:
+        def node_dict(node: MerkleNode) -> Dict[str, Any]:
+            return {"digest": node.digest, "files": dict(node.files), "dirs": {n: node_dict(c) for n, c in node.dirs.items()}}
+
+        return {
+            "schema": MERKLE_SCHEMA,
+            "exclude_rel_paths": sorted(self.exclude_rel_paths),
+            "exclude_rel_prefixes": sorted(self.exclude_rel_prefixes),
+            "root": node_dict(self.node),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MerkleTree":
+        """Rebuild a persisted tree; every digest is recomputed and must match (ValueError otherwise)."""
+        if not isinstance(data, dict) or data.get("schema") != MERKLE_SCHEMA:
+            raise ValueError("not a udgs Merkle tree")
+
+        def load(raw: Dict[str, Any]) -> MerkleNode:
+            node = MerkleNode(files=dict(raw["files"]), dirs={n: load(c) for n, c in raw["dirs"].items()})
+            if node.recompute() != raw["digest"]:
+                raise ValueError("Merkle tree digest mismatch")
+            return node
+
+        return cls(
+            load(data["root"]),
+            exclude_rel_paths=data.get("exclude_rel_paths", []),
+            exclude_rel_prefixes=data.get("exclude_rel_prefixes", []),
+        )
+
+
+def _split_rel(rel: str) -> List[str]:
+    return [p for p in rel.replace("\\", "/").split("/") if p and p != "."]
+
+
+def _sort_node(node: MerkleNode, *, recursive: bool = False) -> None:
+    # Keep children in name order so persisted trees are byte-stable.
+    node.files = dict(sorted(node.files.items()))
+    node.dirs = dict(sorted(node.dirs.items()))
+    if recursive:
+        for child in node.dirs.values():
+            _sort_node(child, recursive=True)
+
+
+def save_merkle_tree(path: str, tree: MerkleTree) -> None:
+    tmp = f"{path}.tmp.{os.getpid()}"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(tree.as_dict(), f, sort_keys=True, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def load_merkle_tree(path: str) -> Optional[MerkleTree]:
+    """The persisted tree, or None when it is missing, unreadable or fails its digest check."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return MerkleTree.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
@@ -8,14 +8,20 @@ Architecture
 The engine holds a QA7 baseline: the reference component hashes and system anchor
 recorded at the moment QA7 was certified.  On every watch cycle it:
 
-  1. Recomputes live component hashes.
-  2. Compares them to the QA7 baseline (drift detection).
+  1. Recomputes live component hashes.  Files whose (size, mtime, ctime, inode)
+     match the previous scan are not reread; a full verification pass rereads
+     everything every ``stat_fast_path.full_verify_interval_sec`` seconds.
+     In event mode (``watch(events=True)``) a cycle runs only when the
+     filesystem reports changes, and rehashes only the changed paths.
+  2. Compares them to the QA7 baseline (drift detection); per-directory Merkle
+     digests of the last matching scan name the changed paths of each drift.
   3. Classifies each drifted component as GENERATED (auto-healable) or SOURCE (alert-only).
   4. For GENERATED components: regenerates the artifact from the live source tree and
      validates the result. Outcome recorded as HEALED or HEAL_FAILED.
   5. For SOURCE components: emits a structured ALERT packet and enters the
      DeterministicCycle (FAIL→FIX→PROVE→CHECKPOINT) with fail-closed semantics.
-  6. Persists all events to HEAL_LOG.jsonl (append-only) and updates QA8_STATUS.json.
+  6. Persists all events to the heal log (append-only HEAL_LOG.jsonl, rotated into
+     indexed segments; see heal_log.py) and updates QA8_STATUS.json.
 
 Fail-closed guarantee
 ---------------------
@@ -29,14 +35,32 @@ import json
 import os
 import time
 from dataclasses import dataclass, field, asdict
+from concurrent.futures import Executor
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
-
-from .anchors import sha256_tree, sha256_file, sha256_json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .anchors import (
+    READS,
+    HashStats,
+    MerkleTree,
+    StatState,
+    TreeSpec,
+    load_merkle_tree,
+    load_stat_state,
+    save_merkle_tree,
+    save_stat_state,
+    sha256_file,
+    sha256_json,
+    sha256_trees,
+    tree_filter,
+)
+from .fswatch import DEFAULT_DEBOUNCE_SEC, DEFAULT_POLL_INTERVAL_SEC, open_watcher
+from .heal_log import DEFAULT_SEGMENT_MAX_BYTES, HealLog
 from .state_machine import DeterministicCycle, Evidence, LoopState
 from .strict_json import compute_packet_anchor
 from .system_object import build_system_object, write_system_object
+from .telemetry import CycleMetrics, Qa8Telemetry
 
 
 # ---------------------------------------------------------------------------
@@ -56,6 +80,12 @@ GENERATED_ARTIFACTS = {
     "UDGS_MANIFEST.json",
 }
 
+# Drift reports name at most this many changed paths per component.
+MAX_CHANGED_PATHS = 100
+
+# Default period of the full rehash that catches stat-preserving tampering.
+DEFAULT_FULL_VERIFY_INTERVAL_SEC = 3600.0
+
 
 # ---------------------------------------------------------------------------
 # Data-classes
@@ -79,6 +109,10 @@ class ComponentDrift:
     baseline_hash: str
     live_hash: str
     is_generated: bool = False
+    # Paths (relative to the project root) that differ from the last tree seen
+    # matching the baseline; "dir/" marks a subtree added or removed as a whole.
+    changed_paths: List[str] = field(default_factory=list)
+    changed_path_count: Optional[int] = None
 
     def as_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -113,6 +147,8 @@ class Qa8Status:
     live_anchor: Optional[str]
     grade: str = QA8_GRADE
     version: str = "2026.02.25"
+    last_full_verify_utc: Optional[str] = None
+    telemetry: Optional[Dict[str, Any]] = None
 
     def as_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -180,7 +216,7 @@ class AutonomousAuditEngine:
     root          : absolute path to the project root
     config_path   : path to system/udgs.config.json
     system_object_path : path to SYSTEM_OBJECT.json (the live generated artifact)
-    qa8_state_dir : directory for QA8_STATUS.json and HEAL_LOG.jsonl
+    qa8_state_dir : directory for QA8_STATUS.json and the heal log
     qa8_config    : parsed qa8.config.json dict
     """
 
@@ -216,6 +252,28 @@ class AutonomousAuditEngine:
         self._heal_count = 0
         self._alert_count = 0
         self._halt_count = 0
+        # Merkle trees of the latest live scan, and of the last scan that matched
+        # the baseline (persisted under <qa8_state_dir>/merkle/).
+        self._live_trees: Dict[str, MerkleTree] = {}
+        self._live_hashes: Dict[str, str] = {}
+        self._good_trees: Dict[str, Optional[MerkleTree]] = {}
+        # Stat snapshot of the previous scan (persisted as <qa8_state_dir>/stat_state.json).
+        fast_path = qa8_config.get("stat_fast_path") or {}
+        self._stat_fast_path = bool(fast_path.get("enabled", True))
+        self._full_verify_interval = float(
+            fast_path.get("full_verify_interval_sec", DEFAULT_FULL_VERIFY_INTERVAL_SEC)
+        )
+        self._stat_state: Optional[StatState] = None
+        # Performance metrics (QA8_STATUS.json "telemetry", <qa8_state_dir>/metrics.prom).
+        self.telemetry = Qa8Telemetry(self.root)
+        self._cycle_metrics = CycleMetrics()
+        # Hashing pool shared with other engines (see supervisor.py); None: a private pool per scan.
+        self.executor: Optional[Executor] = None
+        heal_log_config = qa8_config.get("heal_log") or {}
+        self.heal_log = HealLog(
+            qa8_state_dir,
+            segment_max_bytes=int(heal_log_config.get("segment_max_bytes", DEFAULT_SEGMENT_MAX_BYTES)),
+        )
 
     # ------------------------------------------------------------------
     # Baseline
@@ -234,8 +292,8 @@ class AutonomousAuditEngine:
     # Live hash computation
     # ------------------------------------------------------------------
 
-    def _compute_live_hashes(self) -> Dict[str, str]:
-        """Return {component_name: tree_hash} for all components in baseline."""
+    def _component_specs(self) -> Tuple[Dict[str, TreeSpec], List[str]]:
+        """TreeSpecs of the baseline components that exist, and the names of those that do not."""
         if self._baseline is None:
             raise RuntimeError("Baseline not loaded. Call load_baseline() first.")
 
@@ -246,47 +304,193 @@ class AutonomousAuditEngine:
             self._baseline.get("config", {}).get("audit_exclude_rel_prefixes", [])
         )
 
-        live: Dict[str, str] = {}
+        specs: Dict[str, TreeSpec] = {}
+        missing: List[str] = []
         for name, meta in self._baseline["components"].items():
             rel_path = meta["path"]
             abs_path = os.path.join(self.root, rel_path) if rel_path != "." else self.root
             if not os.path.exists(abs_path):
-                live[name] = "MISSING"
-                continue
-            if rel_path == ".":
-                tree_hash, _ = sha256_tree(
-                    abs_path,
-                    exclude_rel_paths=exclude_paths,
-                    exclude_rel_prefixes=exclude_prefixes,
-                )
+                missing.append(name)
+            elif rel_path == ".":
+                specs[name] = TreeSpec(rel_path, frozenset(exclude_paths), frozenset(exclude_prefixes))
+            else:
+                specs[name] = TreeSpec(rel_path)
+        return specs, missing
+
+    def _compute_live_hashes(self, dirty_paths: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Return {component_name: tree_hash} for all components in baseline.
+
+        ``dirty_paths`` (root-relative files or directories, as reported by a
+        watcher) limits the work to those paths: only the components containing
+        them are updated, from the previous scan's Merkle trees. A full scan
+        runs instead when there is no previous scan or a full verify is due."""
+        specs, missing = self._component_specs()
+        live: Dict[str, str] = {name: "MISSING" for name in missing}
+        files_read, bytes_read = READS.files, READS.bytes
+        metrics = self._cycle_metrics = CycleMetrics()
+
+        state = self._load_stat_state()
+        verify = self._full_verify_due(state)
+        updated = self._update_live_hashes(specs, dirty_paths, metrics) if dirty_paths is not None and not verify else None
+        if updated is not None:
+            live.update(updated)
+            metrics.incremental = True
+        else:
+            live.update(self._scan_live_hashes(specs, state, verify, metrics))
+        metrics.files_hashed = READS.files - files_read
+        metrics.bytes_hashed = READS.bytes - bytes_read
+        return {name: live[name] for name in self._baseline["components"]}  # type: ignore[index]
+
+    def _scan_live_hashes(
+        self, specs: Dict[str, TreeSpec], state: StatState, verify: bool, metrics: CycleMetrics
+    ) -> Dict[str, str]:
+        """Full scan of every component; rebuilds the live trees."""
+
+        # Components overlap (the root component covers all others): one walk,
+        # each file hashed once.
+        stats = HashStats()
+        hashed = sha256_trees(
+            self.root,
+            specs,
+            state=state if self._stat_fast_path else None,
+            verify=verify,
+            executor=self.executor,
+            stats=stats,
+        )
+        metrics.files_visited = stats.files
+        metrics.component_seconds = dict(stats.seconds)
+        if verify:
+            state.verified_at = time.time()
+            state.changed = True
+        if state.changed:
+            try:
+                save_stat_state(self._stat_state_path(), state)
+            except OSError:
+                pass
+
+        self._live_trees = {}
+        for name, (tree_hash, file_hashes) in hashed.items():
+            spec = specs[name]
+            self._live_trees[name] = MerkleTree.from_file_hashes(
+                file_hashes,
+                exclude_rel_paths=spec.exclude_rel_paths,
+                exclude_rel_prefixes=spec.exclude_rel_prefixes,
+            )
+        self._live_hashes = {name: tree_hash for name, (tree_hash, _) in hashed.items()}
+        return dict(self._live_hashes)
+
+    def _update_live_hashes(
+        self, specs: Dict[str, TreeSpec], dirty_paths: Iterable[str], metrics: CycleMetrics
+    ) -> Optional[Dict[str, str]]:
+        """Apply dirty paths to the live trees; None when a full scan is needed instead."""
+        dirty = {"/".join(p for p in rel.replace("\\", "/").split("/") if p and p != ".") for rel in dirty_paths}
+        if "" in dirty or set(self._live_trees) != set(specs) or set(self._live_hashes) != set(specs):
+            return None
+        live: Dict[str, str] = {}
+        for name, spec in specs.items():
+            prefix = "" if spec.path in (".", "") else spec.path.strip("/") + "/"
+            if any(prefix.startswith(rel + "/") for rel in dirty):
+                # An ancestor of the component was created, moved or deleted: the
+                # watcher reports only that ancestor, so rebuild the whole component.
+                if not os.path.isdir(os.path.join(self.root, spec.path)):
+                    return None
+                mine = [""]
             else:
-                tree_hash, _ = sha256_tree(abs_path)
-            live[name] = tree_hash
+                mine = [rel[len(prefix):] for rel in dirty if (rel + "/").startswith(prefix)]
+            if mine:
+                tree = self._live_trees[name]
+                t0 = time.perf_counter()
+                metrics.files_visited += tree.update(os.path.join(self.root, spec.path), mine, executor=self.executor)
+                self._live_hashes[name] = tree.tree_hash()
+                metrics.component_seconds[name] = time.perf_counter() - t0
+            live[name] = self._live_hashes[name]
         return live
 
+    def _stat_state_path(self) -> str:
+        return os.path.join(self.qa8_state_dir, "stat_state.json")
+
+    def _load_stat_state(self) -> StatState:
+        if self._stat_state is None:
+            self._stat_state = load_stat_state(self._stat_state_path()) or StatState()
+        return self._stat_state
+
+    def _full_verify_due(self, state: StatState) -> bool:
+        """A full rehash is due on the first scan and every full_verify_interval_sec after."""
+        if state.verified_at is None:
+            return True
+        return time.time() - state.verified_at >= self._full_verify_interval
+
+
+    # ------------------------------------------------------------------
+    # Merkle trees of known-good component states
+    # ------------------------------------------------------------------
+
+    def _good_tree_path(self, name: str) -> str:
+        return os.path.join(self.qa8_state_dir, "merkle", f"{name}.json")
+
+    def _good_tree(self, name: str) -> Optional[MerkleTree]:
+        if name not in self._good_trees:
+            self._good_trees[name] = load_merkle_tree(self._good_tree_path(name))
+        return self._good_trees[name]
+
+    def _remember_good_trees(self, drifted: set[str]) -> None:
+        """Persist the live tree of every component that matches the baseline."""
+        for name, tree in self._live_trees.items():
+            if name in drifted:
+                continue
+            good = self._good_tree(name)
+            if good is not None and good.root_digest == tree.root_digest and good.same_selection(
+                exclude_rel_paths=tree.exclude_rel_paths, exclude_rel_prefixes=tree.exclude_rel_prefixes
+            ):
+                continue
+            try:
+                save_merkle_tree(self._good_tree_path(name), tree)
+            except OSError:
+                continue
+            # A copy: live trees are updated in place by event-driven cycles.
+            self._good_trees[name] = tree.copy()
+
+    def _changed_paths(self, name: str, rel_path: str) -> Optional[List[str]]:
+        """Changed paths of a drifted component, or None when no good tree is known."""
+        live, good = self._live_trees.get(name), self._good_tree(name)
+        if live is None or good is None:
+            return None
+        prefix = "" if rel_path in (".", "") else rel_path.rstrip("/") + "/"
+        return [prefix + p for p in live.diff(good)]
+
     # ------------------------------------------------------------------
     # Drift detection
     # ------------------------------------------------------------------
 
-    def detect_drift(self) -> List[ComponentDrift]:
-        """Compare live hashes to baseline.  Return list of drifted components."""
+    def detect_drift(self, live: Optional[Dict[str, str]] = None) -> List[ComponentDrift]:
+        """Compare live hashes to baseline.  Return list of drifted components.
+
+        ``live`` is the result of _compute_live_hashes() when the caller already
+        has it; otherwise the tree is hashed here."""
         if self._baseline is None:
             raise RuntimeError("Baseline not loaded.")
 
-        live = self._compute_live_hashes()
+        if live is None:
+            live = self._compute_live_hashes()
         drifts: List[ComponentDrift] = []
         for name, meta in self._baseline["components"].items():
             baseline_hash = meta.get("hash", "")
             live_hash = live.get(name, "MISSING")
             if baseline_hash != live_hash:
-                drifts.append(ComponentDrift(
+                drift = ComponentDrift(
                     name=name,
                     path=meta.get("path", ""),
                     kind=meta.get("kind", ""),
                     baseline_hash=baseline_hash,
                     live_hash=live_hash,
                     is_generated=(name in GENERATED_COMPONENTS),
-                ))
+                )
+                changed = self._changed_paths(name, drift.path)
+                if changed is not None:
+                    drift.changed_paths = changed[:MAX_CHANGED_PATHS]
+                    drift.changed_path_count = len(changed)
+                drifts.append(drift)
+        self._remember_good_trees({d.name for d in drifts})
         return drifts
 
     # ------------------------------------------------------------------
@@ -423,23 +627,26 @@ class AutonomousAuditEngine:
     # Scan-and-heal cycle
     # ------------------------------------------------------------------
 
-    def run_cycle(self) -> Qa8Status:
+    def run_cycle(self, dirty_paths: Optional[Iterable[str]] = None) -> Qa8Status:
         """
         One autonomous audit cycle:
-          1. Detect drift.
+          1. Detect drift (only in the components containing ``dirty_paths``, when given).
           2. If drift found → run heal cycle.
           3. Update and persist QA8_STATUS.json.
           Return updated Qa8Status.
         """
         now = _utc_now()
+        started = time.perf_counter()
         self._scan_count += 1
         self._set_mode(Qa8Mode.SCANNING)
 
         if self._baseline is None:
             self.load_baseline()
 
-        drifts = self.detect_drift()
-        live = self._compute_live_hashes()
+        # One hash pass per cycle: drift detection, the live anchor and the heal
+        # decision all use these hashes.
+        live = self._compute_live_hashes(dirty_paths)
+        drifts = self.detect_drift(live)
 
         # Compute live system anchor for status
         baseline_comps = self._baseline.get("components", {})  # type: ignore[union-attr]
@@ -452,6 +659,7 @@ class AutonomousAuditEngine:
 
         if not drifts:
             self._set_mode(Qa8Mode.NOMINAL)
+            self._record_cycle(started)
             status = self._build_status(now, live_anchor)
             self._persist_status(status)
             return status
@@ -479,6 +687,7 @@ class AutonomousAuditEngine:
             self._alert_count += 1
             self._set_mode(Qa8Mode.ALERT)
 
+        self._record_cycle(started)
         status = self._build_status(now, event.new_system_anchor or live_anchor)
         if event.outcome in ("HEALED", "HALT", "HEAL_FAILED"):
             status_dict = status.as_dict()
@@ -492,25 +701,95 @@ class AutonomousAuditEngine:
     # Watch loop (daemon)
     # ------------------------------------------------------------------
 
-    def watch(self, interval_sec: float = 30.0, max_cycles: Optional[int] = None) -> None:
+    def watch(
+        self,
+        interval_sec: float = 30.0,
+        max_cycles: Optional[int] = None,
+        *,
+        events: bool = False,
+        debounce_sec: float = DEFAULT_DEBOUNCE_SEC,
+        backend: str = "auto",
+    ) -> None:
         """
-        Continuous watch loop.  Runs run_cycle() every ``interval_sec`` seconds.
+        Continuous watch loop.  Runs run_cycle() every ``interval_sec`` seconds,
+        or, with ``events``, whenever the watched tree changes (see _watch_events).
         Stops when max_cycles is reached (if given) or the mode becomes HALT.
         """
+        if events:
+            self._watch_events(max_cycles, debounce_sec=debounce_sec, backend=backend, poll_interval=interval_sec)
+            return
         cycle_n = 0
         while True:
             status = self.run_cycle()
             cycle_n += 1
-            _log(f"[QA8 CYCLE {cycle_n}] mode={status.mode}  "
-                 f"scans={status.scan_count}  heals={status.heal_count}  "
-                 f"alerts={status.alert_count}  halts={status.halt_count}")
-            if status.mode == Qa8Mode.HALT:
-                _log("[QA8] HALT state reached – stopping watch loop (fail-closed).")
-                break
-            if max_cycles is not None and cycle_n >= max_cycles:
+            if not self._log_cycle(cycle_n, status, max_cycles):
                 break
             time.sleep(interval_sec)
 
+    def _watch_events(
+        self,
+        max_cycles: Optional[int],
+        *,
+        debounce_sec: float,
+        backend: str,
+        poll_interval: float,
+    ) -> None:
+        """
+        Event-driven loop: after one full cycle, sleep until the filesystem
+        reports changes (inotify, or stat-diff polling every ``poll_interval``
+        seconds where inotify is unavailable), debounce the burst and rescan
+        only the changed paths.  The only other wake-up is the periodic full
+        verification.  Paths no component selects (e.g. qa8_state/) are not
+        watched, so the engine's own writes do not trigger cycles.
+        """
+        with self.open_change_watcher(debounce_sec=debounce_sec, backend=backend, poll_interval=poll_interval) as watcher:
+            cycle_n = 0
+            dirty: Optional[Iterable[str]] = None
+            while True:
+                status = self.run_cycle(dirty)
+                cycle_n += 1
+                if not self._log_cycle(cycle_n, status, max_cycles):
+                    break
+                dirty = watcher.wait(timeout=self.seconds_until_full_verify())
+
+    def open_change_watcher(
+        self,
+        *,
+        debounce_sec: float = DEFAULT_DEBOUNCE_SEC,
+        backend: str = "auto",
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SEC,
+    ) -> Any:
+        """A watcher over exactly the paths the baseline components select (see fswatch.open_watcher)."""
+        if self._baseline is None:
+            self.load_baseline()
+        specs, _ = self._component_specs()
+        starts = ["" if spec.path in (".", "") else spec.path for spec in specs.values()]
+        return open_watcher(
+            self.root,
+            starts,
+            tree_filter(specs.values()),
+            debounce_sec=debounce_sec,
+            poll_interval=poll_interval,
+            backend=backend,
+        )
+
+    def seconds_until_full_verify(self) -> float:
+        """Seconds until the next periodic full verification is due (0.0: due now)."""
+        verified_at = self._load_stat_state().verified_at
+        if verified_at is None:
+            return 0.0
+        return max(0.0, verified_at + self._full_verify_interval - time.time())
+
+    def _log_cycle(self, cycle_n: int, status: Qa8Status, max_cycles: Optional[int]) -> bool:
+        """Log a finished watch cycle; False when the loop must stop."""
+        _log(f"[QA8 CYCLE {cycle_n}] mode={status.mode}  "
+             f"scans={status.scan_count}  heals={status.heal_count}  "
+             f"alerts={status.alert_count}  halts={status.halt_count}")
+        if status.mode == Qa8Mode.HALT:
+            _log("[QA8] HALT state reached – stopping watch loop (fail-closed).")
+            return False
+        return max_cycles is None or cycle_n < max_cycles
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -530,17 +809,32 @@ class AutonomousAuditEngine:
             baseline_anchor=self._baseline_anchor(),
             live_anchor=live_anchor,
             grade=QA8_GRADE,
+            last_full_verify_utc=self._last_full_verify_utc(),
+            telemetry=self.telemetry.as_dict(),
         )
 
+    def _record_cycle(self, started: float) -> None:
+        """Add the finished cycle to the telemetry and rewrite metrics.prom."""
+        self._cycle_metrics.cycle_seconds = time.perf_counter() - started
+        self.telemetry.record(self._cycle_metrics)
+        try:
+            self.telemetry.write_prometheus(os.path.join(self.qa8_state_dir, "metrics.prom"))
+        except OSError:
+            pass
+
+    def _last_full_verify_utc(self) -> Optional[str]:
+        verified_at = self._stat_state.verified_at if self._stat_state is not None else None
+        if verified_at is None:
+            return None
+        return datetime.fromtimestamp(verified_at, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
     def _persist_status(self, status: Qa8Status) -> None:
         path = os.path.join(self.qa8_state_dir, "QA8_STATUS.json")
         with open(path, "w", encoding="utf-8") as f:
             json.dump(status.as_dict(), f, indent=2, ensure_ascii=False)
 
     def _append_heal_log(self, event: HealEvent) -> None:
-        path = os.path.join(self.qa8_state_dir, "HEAL_LOG.jsonl")
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event.as_dict(), ensure_ascii=False) + "\n")
+        self.heal_log.append(event.as_dict())
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,131 @@
+"""
+udgs_core.bulk_validate
+=======================
+Validate many STRICT_JSON packets in one process.
+
+A source is a directory (every ``*.json`` file below it, in sorted order), a
+JSONL file (one packet per line) or ``-`` (JSONL on stdin).  Packets are
+parsed and validated in chunks on a process pool; results come back in input
+order with a bounded number of chunks in flight, so arbitrarily long streams
+are reported as they are read.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .strict_json import ValidationError, validate_packet
+
+# Fewer packets than this are validated in-process (a pool costs more to start).
+PARALLEL_MIN_PACKETS = 256
+DEFAULT_CHUNK_SIZE = 256
+# Chunks queued per worker before the reader waits for results.
+_IN_FLIGHT_PER_WORKER = 2
+
+# (source label, packet text); text None: source is a file to read.
+PacketItem = Tuple[str, Optional[str]]
+
+
+@dataclass
+class PacketResult:
+    source: str
+    ok: bool
+    errors: List[ValidationError] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "ok": self.ok,
+            "errors": [{"path": e.path, "message": e.message} for e in self.errors],
+        }
+
+
+def _jsonl_items(label: str, lines: Iterable[str]) -> Iterator[PacketItem]:
+    for lineno, line in enumerate(lines, 1):
+        if line.strip():
+            yield f"{label}:{lineno}", line
+
+
+def iter_packet_sources(path: str) -> Iterator[PacketItem]:
+    """Packets of a directory, a JSONL file or ``-`` (JSONL on stdin), in a stable order."""
+    if path == "-":
+        yield from _jsonl_items("<stdin>", sys.stdin)
+    elif os.path.isdir(path):
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(".json"):
+                    yield os.path.join(dirpath, name), None
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            yield from _jsonl_items(path, f)
+
+
+def validate_one(source: str, text: Optional[str]) -> PacketResult:
+    try:
+        if text is None:
+            with open(source, "r", encoding="utf-8") as f:
+                obj = json.load(f)
+        else:
+            obj = json.loads(text)
+    except (OSError, ValueError) as exc:
+        return PacketResult(source, False, [ValidationError("$", f"Unreadable packet: {exc}")])
+    ok, errors = validate_packet(obj)
+    return PacketResult(source, ok, errors)
+
+
+def _validate_chunk(chunk: List[PacketItem]) -> List[PacketResult]:
+    return [validate_one(source, text) for source, text in chunk]
+
+
+def _chunks(items: Iterator[PacketItem], size: int) -> Iterator[List[PacketItem]]:
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_stream(
+    items: Iterable[PacketItem],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[PacketResult]:
+    """Validate packets on ``workers`` processes (default: CPU count); yields results in input order."""
+    if chunk_size <= 0:
+        raise ValueError(f"E_BULK_CHUNK_SIZE: {chunk_size}")
+    it = iter(items)
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    head = list(islice(it, PARALLEL_MIN_PACKETS))
+    if workers <= 1 or len(head) < PARALLEL_MIN_PACKETS:
+        for source, text in chain(head, it):
+            yield validate_one(source, text)
+        return
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in _chunks(chain(head, it), chunk_size):
+            pending.append(pool.submit(_validate_chunk, chunk))
+            if len(pending) >= workers * _IN_FLIGHT_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_report(results: Iterable[PacketResult], out: TextIO, *, failures_only: bool = False) -> Tuple[int, int]:
+    """Write one JSON line per result (only failures with ``failures_only``); returns (total, failed)."""
+    total = failed = 0
+    for result in results:
+        total += 1
+        if not result.ok:
+            failed += 1
+        elif failures_only:
+            continue
+        out.write(json.dumps(result.as_dict(), ensure_ascii=False) + "\n")
+    return total, failed
@@ -0,0 +1,69 @@
+"""
+udgs_core.canonical
+===================
+Canonical JSON encoding and digests shared by every hashed structure.
+
+Canonical form: sorted keys, compact separators (``","`` and ``":"``), UTF-8
+bytes.  ``ensure_ascii`` selects the string escaping and must match what a
+digest was defined with: anchors and AD-2026 gate hashes escape non-ASCII
+(the json default), APB / JWS payloads keep it literal.
+
+Encoders are built once per flavour; ``json.dumps(obj, sort_keys=True, ...)``
+constructs a new JSONEncoder on every call, which dominates for the small
+dicts and lists hashed most often.  The encoding is compositional — a list is
+``[`` + the canonical items joined by ``,`` + ``]`` — so ``join_array`` builds
+a list digest from per-item bytes that were memoized with ``memoize``.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+_ASCII = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+_UNICODE = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+T = TypeVar("T")
+
+
+def canonical_json(obj: Any, *, ensure_ascii: bool = True, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Canonical UTF-8 encoding of obj."""
+    if default is not None:
+        encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=ensure_ascii, default=default)
+    else:
+        encoder = _ASCII if ensure_ascii else _UNICODE
+    return encoder.encode(obj).encode("utf-8")
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_canonical(obj: Any, *, ensure_ascii: bool = True, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """sha256 hex digest of obj's canonical encoding."""
+    return sha256_hex(canonical_json(obj, ensure_ascii=ensure_ascii, default=default))
+
+
+def join_array(items: Iterable[bytes]) -> bytes:
+    """Canonical encoding of a list from the canonical encodings of its items."""
+    return b"[" + b",".join(items) + b"]"
+
+
+def memoize(method: Callable[[Any], T]) -> Callable[[Any], T]:
+    """Cache a zero-argument method's result on the instance.
+
+    Only for immutable objects (frozen dataclasses or models): the cache is
+    never invalidated.  Stored in the instance ``__dict__``, so dataclass
+    fields, equality and ``asdict`` are unaffected."""
+    key = f"_memo_{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self: Any) -> T:
+        try:
+            return self.__dict__[key]
+        except KeyError:
+            value = self.__dict__[key] = method(self)
+            return value
+
+    return wrapper
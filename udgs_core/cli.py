@@ -6,15 +6,30 @@ import os
 import sys
 from typing import Any, Dict
 
-from .anchors import sha256_file, sha256_tree
+from .anchors import MerkleTree, load_merkle_tree, save_merkle_tree, sha256_file, sha256_tree
 from .state_machine import DeterministicCycle, Evidence
 from .strict_json import compute_packet_anchor, load_and_validate
+from .bulk_validate import DEFAULT_CHUNK_SIZE, iter_packet_sources, validate_stream, write_report
 from .system_object import build_system_object, write_system_object
 from .autonomous_audit import make_engine, Qa8Mode, QA8_GRADE
+from .heal_log import HealLog
+from .supervisor import Qa8Supervisor
 from .ad2026.runtime import AD2026Runtime
 
 
 def cmd_anchor(args: argparse.Namespace) -> int:
+    if args.dirty and not args.merkle:
+        print("--dirty requires --merkle", file=sys.stderr)
+        return 2
+    if os.path.isdir(args.path) and args.merkle:
+        tree = load_merkle_tree(args.merkle) if args.dirty else None
+        if tree is not None:
+            tree.update(args.path, args.dirty)
+        else:
+            tree = MerkleTree.build(args.path)
+        save_merkle_tree(args.merkle, tree)
+        print(tree.tree_hash())
+        return 0
     if os.path.isdir(args.path):
         tree_hash, _ = sha256_tree(args.path)
         print(tree_hash)
@@ -36,6 +51,16 @@ def cmd_validate_packet(args: argparse.Namespace) -> int:
     return 1
 
 
+def cmd_validate_packets(args: argparse.Namespace) -> int:
+    if args.source != "-" and not os.path.exists(args.source):
+        print(f"Path not found: {args.source}", file=sys.stderr)
+        return 2
+    results = validate_stream(iter_packet_sources(args.source), workers=args.workers, chunk_size=args.chunk_size)
+    total, failed = write_report(results, sys.stdout, failures_only=args.failures_only)
+    print(f"{total - failed}/{total} packets valid", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
 def cmd_loop(args: argparse.Namespace) -> int:
     cycle = DeterministicCycle(fail_closed=True)
     evidence: Dict[str, Any] = {}
@@ -88,11 +113,42 @@ def cmd_qa8_watch(args: argparse.Namespace) -> int:
     engine.load_baseline()
     interval = float(args.interval)
     max_cycles = int(args.max_cycles) if args.max_cycles else None
-    print(f"[QA8] Starting autonomous audit watch — interval={interval}s  grade={QA8_GRADE}", flush=True)
-    engine.watch(interval_sec=interval, max_cycles=max_cycles)
+    if args.events:
+        print(f"[QA8] Starting event-driven autonomous audit watch — debounce={args.debounce}s  grade={QA8_GRADE}", flush=True)
+    else:
+        print(f"[QA8] Starting autonomous audit watch — interval={interval}s  grade={QA8_GRADE}", flush=True)
+    engine.watch(
+        interval_sec=interval,
+        max_cycles=max_cycles,
+        events=args.events,
+        debounce_sec=float(args.debounce),
+        backend=args.backend,
+    )
     return 0
 
 
+def cmd_qa8_supervise(args: argparse.Namespace) -> int:
+    roots = list(args.root)
+    if args.roots_file:
+        with open(args.roots_file, "r", encoding="utf-8") as f:
+            roots += [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+    if not roots:
+        print(json.dumps({"error": "no roots: pass --root (repeatable) or --roots-file"}))
+        return 2
+    supervisor = Qa8Supervisor(
+        roots,
+        qa8_config_path=args.qa8_config,
+        workers=int(args.workers) if args.workers else None,
+        debounce_sec=float(args.debounce),
+        backend=args.backend,
+        poll_interval=float(args.interval),
+    )
+    print(f"[QA8] Supervising {len(supervisor.engines)} roots — workers={supervisor.workers}  grade={QA8_GRADE}", flush=True)
+    last = supervisor.run(max_cycles=int(args.max_cycles) if args.max_cycles else None)
+    print(json.dumps({root: status.as_dict() for root, status in last.items()}, indent=2, ensure_ascii=False))
+    return 1 if any(status.mode == Qa8Mode.HALT for status in last.values()) else 0
+
+
 def cmd_qa8_heal(args: argparse.Namespace) -> int:
     engine = make_engine(args.root, args.qa8_config)
     engine.load_baseline()
@@ -109,6 +165,10 @@ def cmd_qa8_status(args: argparse.Namespace) -> int:
         return 1
     with open(status_path, "r", encoding="utf-8") as f:
         data = json.load(f)
+    if args.history is not None or args.since is not None:
+        log = HealLog(os.path.join(root, "qa8_state"))
+        history = log.since(args.since, limit=args.history) if args.since is not None else log.tail(args.history or 0)
+        data = {"status": data, "history": history}
     print(json.dumps(data, indent=2, ensure_ascii=False))
     return 0
 
@@ -181,12 +241,21 @@ def main(argv: list[str] | None = None) -> int:
 
     pa = sub.add_parser("anchor", help="Compute SHA-256 anchor for file or directory")
     pa.add_argument("path")
+    pa.add_argument("--merkle", default=None, help="Persist per-directory Merkle digests to this JSON file")
+    pa.add_argument("--dirty", action="append", default=[], help="Path (relative to PATH) changed since --merkle was saved; only these are rehashed (repeatable)")
     pa.set_defaults(fn=cmd_anchor)
 
     pv = sub.add_parser("validate-packet", help="Validate STRICT_JSON FAIL_PACKET bundle")
     pv.add_argument("packet")
     pv.set_defaults(fn=cmd_validate_packet)
 
+    pvs = sub.add_parser("validate-packets", help="Validate a directory or JSONL stream of packets; one JSON result line per packet")
+    pvs.add_argument("source", help="Directory of *.json packets, JSONL file, or - for JSONL on stdin")
+    pvs.add_argument("--workers", type=int, default=None, help="Validation processes (default: CPU count)")
+    pvs.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Packets per worker task")
+    pvs.add_argument("--failures-only", action="store_true", help="Report only packets that fail validation")
+    pvs.set_defaults(fn=cmd_validate_packets)
+
     pp = sub.add_parser("packet-anchor", help="Compute deterministic SHA256_ANCHOR for a STRICT_JSON packet")
     pp.add_argument("packet")
     pp.set_defaults(fn=cmd_packet_anchor)
@@ -208,8 +277,22 @@ def main(argv: list[str] | None = None) -> int:
     pw.add_argument("--qa8-config", default=None)
     pw.add_argument("--interval", default=30, help="Watch interval in seconds (default: 30)")
     pw.add_argument("--max-cycles", default=None, help="Stop after N cycles (default: infinite)")
+    pw.add_argument("--events", action="store_true", help="Scan on filesystem change notifications instead of every interval")
+    pw.add_argument("--debounce", default=0.2, help="With --events: seconds of quiet that end a burst (default: 0.2)")
+    pw.add_argument("--backend", choices=["auto", "inotify", "poll"], default="auto", help="With --events: change source; poll compares stats every --interval seconds (default: auto)")
     pw.set_defaults(fn=cmd_qa8_watch)
 
+    psv = sub.add_parser("qa8-supervise", help="Watch several roots in one process with a shared hashing pool")
+    psv.add_argument("--root", action="append", default=[], help="Project root to watch (repeatable)")
+    psv.add_argument("--roots-file", default=None, help="File with one project root per line")
+    psv.add_argument("--qa8-config", default=None)
+    psv.add_argument("--workers", default=None, help="Hashing threads shared by all roots (default: CPU count)")
+    psv.add_argument("--debounce", default=0.2, help="Seconds of quiet that end a burst of changes (default: 0.2)")
+    psv.add_argument("--backend", choices=["auto", "inotify", "poll"], default="auto", help="Change source; poll compares stats every --interval seconds (default: auto)")
+    psv.add_argument("--interval", default=1.0, help="Poll interval in seconds for --backend poll (default: 1)")
+    psv.add_argument("--max-cycles", default=None, help="Stop each root after N cycles (default: infinite)")
+    psv.set_defaults(fn=cmd_qa8_supervise)
+
     ph = sub.add_parser("qa8-heal", help="Run one QA8 autonomous audit + heal cycle")
     ph.add_argument("--root", default=".")
     ph.add_argument("--qa8-config", default=None)
@@ -217,6 +300,8 @@ def main(argv: list[str] | None = None) -> int:
 
     pqs = sub.add_parser("qa8-status", help="Print current QA8_STATUS.json")
     pqs.add_argument("--root", default=".")
+    pqs.add_argument("--history", type=int, default=None, help="Also print the newest N heal log events")
+    pqs.add_argument("--since", default=None, help="Also print heal log events at or after this UTC timestamp (YYYY-MM-DDTHH:MM:SSZ)")
     pqs.set_defaults(fn=cmd_qa8_status)
 
     # AD-2026 commands
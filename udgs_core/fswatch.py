@@ -0,0 +1,317 @@
+"""
+udgs_core.fswatch
+=================
+Filesystem change notification for the QA8 watch loop.
+
+``open_watcher`` returns an inotify watcher on Linux and a portable stat-diff
+poller elsewhere (or when inotify is unavailable or out of watches).  Both
+answer ``wait(timeout)`` with the set of changed paths, relative to the watch
+root, once a burst of changes has been quiet for ``debounce_sec``; or None when
+nothing changed before the timeout.  A returned path may be a file or a
+directory; ``""`` means "anything may have changed" (event queue overflow).
+
+Stdlib-only: inotify is reached through ctypes.
+"""
+from __future__ import annotations
+
+import abc
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# include(rel) decides which paths are watched; directories are passed as "rel/".
+PathFilter = Callable[[str], bool]
+
+DEFAULT_DEBOUNCE_SEC = 0.2
+# A continuous stream of changes is still reported at least this often.
+MAX_DEBOUNCE_SEC = 5.0
+DEFAULT_POLL_INTERVAL_SEC = 1.0
+
+
+def _include_all(rel: str) -> bool:
+    return True
+
+
+class _Watcher(abc.ABC):
+    def __init__(self, root: str, starts: Iterable[str], include: Optional[PathFilter], debounce_sec: float) -> None:
+        self.root = os.path.abspath(root)
+        self.include = include or _include_all
+        self.debounce_sec = debounce_sec
+        # A start already reached through real directories from an outer start needs no walk of its own.
+        self.starts: List[str] = []
+        for start in sorted({s.strip("/") + "/" if s.strip("/") else "" for s in starts} or {""}, key=len):
+            if not any(start.startswith(outer) and self._real_chain(outer, start) for outer in self.starts):
+                self.starts.append(start)
+
+    def _real_chain(self, outer: str, inner: str) -> bool:
+        outer_path = os.path.realpath(os.path.join(self.root, outer))
+        return os.path.realpath(os.path.join(self.root, inner)) == os.path.join(outer_path, inner[len(outer) :].rstrip("/"))
+
+    @abc.abstractmethod
+    def _poll(self, timeout: Optional[float]) -> Set[str]:
+        """Changed paths seen within timeout (None: no limit); an empty set if none were."""
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Set[str]]:
+        """Changed paths after a debounced burst, or None if nothing changed within timeout (None: forever)."""
+        changed = self._poll(timeout)
+        if not changed:
+            return None
+        deadline = time.monotonic() + MAX_DEBOUNCE_SEC
+        while "" not in changed:
+            quiet = min(self.debounce_sec, deadline - time.monotonic())
+            if quiet <= 0:
+                break
+            more = self._poll(quiet)
+            if not more:
+                break
+            changed |= more
+        return {""} if "" in changed else changed
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "_Watcher":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _walk_dirs(self, start: str) -> Iterable[str]:
+        """Directories ("rel/") at and under start that include() selects; symlinks below start are not entered."""
+        stack = [start]
+        while stack:
+            d = stack.pop()
+            yield d
+            try:
+                with os.scandir(os.path.join(self.root, d) if d else self.root) as it:
+                    entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+            except OSError:
+                continue
+            stack.extend(d + e.name + "/" for e in entries if self.include(d + e.name + "/"))
+
+
+# ---------------------------------------------------------------------------
+# Stat-diff polling (portable fallback)
+# ---------------------------------------------------------------------------
+
+class PollingWatcher(_Watcher):
+    """Compares a (size, mtime_ns, ctime_ns, inode) snapshot every ``poll_interval`` seconds; reads no file contents."""
+
+    def __init__(
+        self,
+        root: str,
+        starts: Iterable[str] = ("",),
+        include: Optional[PathFilter] = None,
+        *,
+        debounce_sec: float = DEFAULT_DEBOUNCE_SEC,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SEC,
+    ) -> None:
+        super().__init__(root, starts, include, debounce_sec)
+        self.poll_interval = poll_interval
+        self._snapshot = self._take()
+
+    def _take(self) -> Dict[str, Tuple[int, int, int, int]]:
+        snap: Dict[str, Tuple[int, int, int, int]] = {}
+        for start in self.starts:
+            for d in self._walk_dirs(start):
+                try:
+                    with os.scandir(os.path.join(self.root, d) if d else self.root) as it:
+                        for entry in it:
+                            rel = d + entry.name
+                            if entry.is_dir(follow_symlinks=False) or not self.include(rel):
+                                continue
+                            try:
+                                st = entry.stat()
+                            except OSError:
+                                continue
+                            snap[rel] = (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+                except OSError:
+                    continue
+        return snap
+
+    def _poll(self, timeout: Optional[float]) -> Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snap = self._take()
+            old, self._snapshot = self._snapshot, snap
+            changed = {rel for rel in old.keys() | snap.keys() if old.get(rel) != snap.get(rel)}
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            pause = self.poll_interval if deadline is None else min(self.poll_interval, deadline - time.monotonic())
+            time.sleep(max(pause, 0.0))
+
+
+# ---------------------------------------------------------------------------
+# inotify (Linux)
+# ---------------------------------------------------------------------------
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+_EVENT = struct.Struct("iIII")
+_libc: Optional[ctypes.CDLL] = None
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    global _libc
+    if _libc is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        except (OSError, AttributeError):
+            return None
+        _libc = libc
+    return _libc
+
+
+def inotify_available() -> bool:
+    return _load_libc() is not None
+
+
+class InotifyWatcher(_Watcher):
+    """One inotify watch per selected directory; new directories are watched as they appear.
+
+    Raises OSError when inotify cannot be set up (e.g. the per-user watch limit
+    is exhausted); open_watcher then falls back to polling.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        starts: Iterable[str] = ("",),
+        include: Optional[PathFilter] = None,
+        *,
+        debounce_sec: float = DEFAULT_DEBOUNCE_SEC,
+    ) -> None:
+        super().__init__(root, starts, include, debounce_sec)
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._libc = libc
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._dirs: Dict[int, str] = {}
+        try:
+            for start in self.starts:
+                self._watch_tree(start, strict=True)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, start: str, *, strict: bool = False) -> None:
+        for d in self._walk_dirs(start):
+            path = os.path.join(self.root, d) if d else self.root
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                # A directory that vanished mid-walk is reported by its parent's events.
+                if err == errno.ENOSPC or (strict and err not in (errno.ENOENT, errno.ENOTDIR)):
+                    raise OSError(err, f"inotify_add_watch {path}: {os.strerror(err)}")
+                continue
+            self._dirs[wd] = d
+
+    def _forget_tree(self, d: str) -> None:
+        for wd, rel in list(self._dirs.items()):
+            if rel.startswith(d):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._dirs[wd]
+
+    def _poll(self, timeout: Optional[float]) -> Set[str]:
+        if self._fd < 0:
+            return set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            buf = os.read(self._fd, 256 * 1024)
+        except BlockingIOError:
+            return set()
+        changed: Set[str] = set()
+        offset = 0
+        while offset + _EVENT.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(buf[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                changed.add("")
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            d = self._dirs.get(wd)
+            if d is None or not name:
+                continue  # *_SELF events: the parent reports the same change by name
+            rel = d + name
+            if mask & IN_ISDIR:
+                if not self.include(rel + "/"):
+                    continue
+                if mask & IN_MOVED_FROM:
+                    self._forget_tree(rel + "/")
+                elif mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._watch_tree(rel + "/")
+                    except OSError:
+                        changed.add("")
+                changed.add(rel)
+            elif self.include(rel):
+                changed.add(rel)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._dirs.clear()
+
+
+def open_watcher(
+    root: str,
+    starts: Iterable[str] = ("",),
+    include: Optional[PathFilter] = None,
+    *,
+    debounce_sec: float = DEFAULT_DEBOUNCE_SEC,
+    poll_interval: float = DEFAULT_POLL_INTERVAL_SEC,
+    backend: str = "auto",
+) -> _Watcher:
+    """inotify when available (backend "auto" or "inotify"), otherwise stat-diff polling."""
+    if backend not in ("auto", "inotify", "poll"):
+        raise ValueError(f"E_WATCH_BACKEND: {backend!r}")
+    starts = list(starts)
+    if backend != "poll":
+        try:
+            return InotifyWatcher(root, starts, include, debounce_sec=debounce_sec)
+        except OSError:
+            if backend == "inotify":
+                raise
+    return PollingWatcher(root, starts, include, debounce_sec=debounce_sec, poll_interval=poll_interval)
@@ -0,0 +1,252 @@
+"""
+udgs_core.heal_log
+==================
+Segmented, indexed QA8 heal log.
+
+Events are appended as JSON lines to the active segment ``HEAL_LOG.jsonl``
+(the file earlier versions wrote).  When it reaches ``segment_max_bytes`` it is
+sealed by renaming it to ``heal_log/HEAL_LOG.<segment>.jsonl`` and a new active
+segment starts.  Every event also gets one fixed-width record in
+``HEAL_LOG.idx``:
+
+    <seq:012d> <utc:20> <segment:06d> <offset:012d> <event_id:8>\\n
+
+so the newest events or those since a timestamp are found by seeking and
+binary search in the index, and only the segments holding them are opened.
+An index that lags behind the active segment (a crash between the two
+appends, a log written before the index existed, or a reader racing the
+writer) is completed by the writer's next append; readers index the lagging
+tail in memory and never write.
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+ACTIVE_NAME = "HEAL_LOG.jsonl"
+INDEX_NAME = "HEAL_LOG.idx"
+SEGMENT_DIR = "heal_log"
+DEFAULT_SEGMENT_MAX_BYTES = 1024 * 1024
+
+_UTC_WIDTH = 20  # "2026-02-25T00:00:00Z"
+_ID_WIDTH = 8
+_RECORD_BYTES = 12 + 1 + _UTC_WIDTH + 1 + 6 + 1 + 12 + 1 + _ID_WIDTH + 1
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    seq: int
+    utc: str
+    segment: int
+    offset: int
+    event_id: str
+
+    def encode(self) -> bytes:
+        utc = self.utc[:_UTC_WIDTH].ljust(_UTC_WIDTH)
+        event_id = self.event_id[:_ID_WIDTH].ljust(_ID_WIDTH)
+        line = f"{self.seq:012d} {utc} {self.segment:06d} {self.offset:012d} {event_id}\n"
+        return line.encode("ascii", "replace")
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "IndexEntry":
+        text = raw.decode("ascii")
+        if len(raw) != _RECORD_BYTES or not text.endswith("\n"):
+            raise ValueError(f"E_HEAL_INDEX_RECORD: {raw!r}")
+        seq, utc, segment, offset, event_id = text[:-1].split(" ", 4)
+        return cls(int(seq), utc, int(segment), int(offset), event_id.rstrip())
+
+
+class HealLog:
+    """Append and query the heal log in ``state_dir`` (single writer)."""
+
+    def __init__(self, state_dir: str, *, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES) -> None:
+        if segment_max_bytes <= 0:
+            raise ValueError(f"E_HEAL_LOG_SEGMENT_SIZE: {segment_max_bytes}")
+        self.state_dir = state_dir
+        self.segment_max_bytes = segment_max_bytes
+        self.active_path = os.path.join(state_dir, ACTIVE_NAME)
+        self.index_path = os.path.join(state_dir, INDEX_NAME)
+        self.segment_dir = os.path.join(state_dir, SEGMENT_DIR)
+        self._recovered = False
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    def _sealed_path(self, segment: int) -> str:
+        return os.path.join(self.segment_dir, f"HEAL_LOG.{segment:06d}.jsonl")
+
+    def _segment_path(self, segment: int) -> str:
+        sealed = self._sealed_path(segment)
+        return sealed if os.path.exists(sealed) else self.active_path
+
+    def _active_segment(self) -> int:
+        """Number of the active segment: one past the newest sealed segment."""
+        try:
+            names = os.listdir(self.segment_dir)
+        except OSError:
+            return 0
+        sealed = [int(n.split(".")[1]) for n in names if n.startswith("HEAL_LOG.") and n.endswith(".jsonl") and n.split(".")[1].isdigit()]
+        return max(sealed) + 1 if sealed else 0
+
+    # ------------------------------------------------------------------
+    # Index access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        try:
+            return os.path.getsize(self.index_path) // _RECORD_BYTES
+        except OSError:
+            return 0
+
+    def _read_records(self, start: int, stop: int) -> List[IndexEntry]:
+        if stop <= start:
+            return []
+        with open(self.index_path, "rb") as f:
+            f.seek(start * _RECORD_BYTES)
+            raw = f.read((stop - start) * _RECORD_BYTES)
+        return [IndexEntry.decode(raw[i : i + _RECORD_BYTES]) for i in range(0, len(raw), _RECORD_BYTES)]
+
+    def _last_record(self) -> Optional[IndexEntry]:
+        n = len(self)
+        return self._read_records(n - 1, n)[0] if n else None
+
+    def _first_since(self, utc: str) -> int:
+        """Index of the first record with timestamp >= utc (timestamps are appended in order)."""
+        lo, hi = 0, len(self)
+        with open(self.index_path, "rb") as f:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                f.seek(mid * _RECORD_BYTES)
+                if IndexEntry.decode(f.read(_RECORD_BYTES)).utc < utc:
+                    lo = mid + 1
+                else:
+                    hi = mid
+        return lo
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _unindexed(self) -> List[IndexEntry]:
+        """Records for the events of the active segment that the index does not cover yet."""
+        try:
+            size = os.path.getsize(self.active_path)
+        except OSError:
+            return []
+        segment = self._active_segment()
+        last = self._last_record()
+        offset = last.offset if last is not None and last.segment == segment else 0
+        seq = last.seq + 1 if last is not None else 0
+        if last is not None and last.segment == segment:
+            with open(self.active_path, "rb") as f:
+                f.seek(offset)
+                offset += len(f.readline())
+        if offset >= size:
+            return []
+        records: List[IndexEntry] = []
+        with open(self.active_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final write; the next append starts a fresh line
+                try:
+                    event = json.loads(line)
+                    utc, event_id = str(event.get("utc", "")), str(event.get("event_id", ""))
+                except (ValueError, AttributeError):
+                    utc, event_id = "", ""
+                records.append(IndexEntry(seq, utc, segment, offset, event_id))
+                seq += 1
+                offset += len(line)
+        return records
+
+    def _recover(self) -> None:
+        """Write index records for unindexed events (writer only, once per instance)."""
+        if self._recovered:
+            return
+        self._recovered = True
+        records = self._unindexed()
+        if records:
+            with open(self.index_path, "ab") as f:
+                f.write(b"".join(rec.encode() for rec in records))
+
+    def _seal_if_full(self) -> None:
+        try:
+            size = os.path.getsize(self.active_path)
+        except OSError:
+            return
+        if size < self.segment_max_bytes:
+            return
+        segment = self._active_segment()
+        os.makedirs(self.segment_dir, exist_ok=True)
+        os.replace(self.active_path, self._sealed_path(segment))
+
+    def append(self, event: Dict[str, Any]) -> IndexEntry:
+        """Append one event (needs "utc" and "event_id") and index it."""
+        os.makedirs(self.state_dir, exist_ok=True)
+        self._recover()
+        self._seal_if_full()
+        line = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+        last = self._last_record()
+        segment = self._active_segment()
+        with open(self.active_path, "ab") as f:
+            offset = f.tell()
+            if offset and not self._ends_with_newline():
+                f.write(b"\n")
+                offset += 1
+            f.write(line)
+        entry = IndexEntry(
+            seq=last.seq + 1 if last is not None else 0,
+            utc=str(event.get("utc", "")),
+            segment=segment,
+            offset=offset,
+            event_id=str(event.get("event_id", "")),
+        )
+        with open(self.index_path, "ab") as f:
+            f.write(entry.encode())
+        return entry
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.active_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _load(self, records: List[IndexEntry]) -> Iterator[Dict[str, Any]]:
+        handles: Dict[int, Any] = {}
+        try:
+            for rec in records:
+                f = handles.get(rec.segment)
+                if f is None:
+                    f = handles[rec.segment] = open(self._segment_path(rec.segment), "rb")
+                f.seek(rec.offset)
+                yield json.loads(f.readline())
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """The newest n events, oldest first."""
+        if n <= 0:
+            return []
+        pending = self._unindexed()
+        total = len(self)
+        records = self._read_records(max(0, total - n), total) + pending
+        return list(self._load(records[-n:]))
+
+    def since(self, utc: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Events with utc >= the given timestamp, oldest first (at most ``limit``: the newest ones)."""
+        if limit is not None and limit <= 0:
+            return []
+        pending = [rec for rec in self._unindexed() if rec.utc >= utc]
+        total = len(self)
+        start = self._first_since(utc) if total else 0
+        if limit is not None:
+            start = max(start, total - limit)
+        records = self._read_records(start, total) + pending
+        return list(self._load(records[-limit:] if limit is not None else records))
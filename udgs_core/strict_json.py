@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import re
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
@@ -17,6 +16,9 @@ REQUIRED_KEYS = [
     "SHA256_ANCHOR",
 ]
 
+_REQUIRED_KEY_SET = frozenset(REQUIRED_KEYS)
+_ANCHORED_KEYS = tuple(k for k in REQUIRED_KEYS if k != "SHA256_ANCHOR")
+
 SHA256_RE = re.compile(r"^[a-f0-9]{64}$")
 
 FAIL_PACKET_REQUIRED_KEYS = ["summary", "signals", "repro"]
@@ -62,9 +64,8 @@ def packet_anchor_payload(obj: Dict[str, Any]) -> Dict[str, Any]:
     """
     if not isinstance(obj, dict):
         raise TypeError("Packet must be a dict")
-    base = deepcopy(obj)
-    base.pop("SHA256_ANCHOR", None)
-    return {k: base[k] for k in REQUIRED_KEYS if k != "SHA256_ANCHOR" and k in base}
+    # Read-only: nested values are shared with obj, not copied.
+    return {k: obj[k] for k in _ANCHORED_KEYS if k in obj}
 
 
 def compute_packet_anchor(obj: Dict[str, Any]) -> str:
@@ -94,7 +95,7 @@ def validate_packet(obj: Dict[str, Any]) -> Tuple[bool, List[ValidationError]]:
         errors.append(ValidationError("$.SHA256_ANCHOR", "Must be a string"))
 
     # STRICT_JSON: no extra top-level keys allowed (fail-closed)
-    extra = [k for k in obj.keys() if k not in REQUIRED_KEYS]
+    extra = [k for k in obj.keys() if k not in _REQUIRED_KEY_SET]
     if extra:
         errors.append(ValidationError("$", f"Extra keys not allowed: {extra}"))
 
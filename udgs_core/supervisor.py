@@ -0,0 +1,181 @@
+"""
+udgs_core.supervisor
+====================
+One process watching many QA8 roots.
+
+Every root keeps its own AutonomousAuditEngine and change watcher, but:
+
+- all engines hash on one bounded thread pool (``workers`` threads in total,
+  instead of a CPU-count pool per watcher process);
+- cycles run one at a time, picked by a scheduler: roots with pending changes
+  first, the longest-waiting first, bursts that arrive while a root waits are
+  merged; roots whose periodic full verification is due run only when no
+  changes are pending.  Many checkouts changing together (a branch switch on
+  a build host) are therefore hashed one after another, not all at once.
+
+A root that reaches HALT is dropped (fail-closed for that root only); so is
+a root whose cycle or change watcher raises.  The error is logged and kept in
+``errors``, and the other roots keep running.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .autonomous_audit import AutonomousAuditEngine, Qa8Mode, Qa8Status, _log, make_engine
+from .fswatch import DEFAULT_DEBOUNCE_SEC, DEFAULT_POLL_INTERVAL_SEC
+
+# Watcher threads re-check for shutdown this often while idle.
+_WAKE_SEC = 1.0
+
+
+class Qa8Supervisor:
+    """Watch ``roots`` in one process (see module docstring)."""
+
+    def __init__(
+        self,
+        roots: Iterable[str],
+        *,
+        qa8_config_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        debounce_sec: float = DEFAULT_DEBOUNCE_SEC,
+        backend: str = "auto",
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SEC,
+    ) -> None:
+        self.engines: Dict[str, AutonomousAuditEngine] = {}
+        for root in roots:
+            root = os.path.abspath(root)
+            if root in self.engines:
+                continue
+            self.engines[root] = make_engine(root, qa8_config_path)
+        if not self.engines:
+            raise ValueError("E_SUPERVISOR_NO_ROOTS")
+        self.workers = workers or (os.cpu_count() or 1)
+        self.debounce_sec = debounce_sec
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.cycles: Dict[str, int] = {root: 0 for root in self.engines}
+        self.errors: Dict[str, str] = {}
+        self._active: Set[str] = set(self.engines)
+        # root -> (first pending time, dirty paths; None: full scan)
+        self._pending: Dict[str, Tuple[float, Optional[Set[str]]]] = {}
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def submit(self, root: str, dirty: Optional[Iterable[str]]) -> None:
+        """Queue a cycle for root; merges with a cycle already pending (None: full scan)."""
+        with self._cond:
+            if root not in self._active:
+                return
+            since, pending = self._pending.get(root, (time.monotonic(), set()))
+            if pending is None or dirty is None:
+                merged: Optional[Set[str]] = None
+            else:
+                merged = pending | set(dirty)
+            self._pending[root] = (since, merged)
+            self._cond.notify()
+
+    def _next(self) -> Optional[Tuple[str, Optional[Set[str]]]]:
+        """Pop the longest-waiting pending root, else a root whose full verification is due;
+        wait for either.  None once stopped."""
+        with self._cond:
+            while not self._stop.is_set():
+                if self._pending:
+                    root = min(self._pending, key=lambda r: self._pending[r][0])
+                    return root, self._pending.pop(root)[1]
+                due = {root: self.engines[root].seconds_until_full_verify() for root in self._active}
+                if not due:
+                    return None
+                root = min(due, key=lambda r: due[r])
+                if due[root] <= 0:
+                    return root, None
+                self._cond.wait(timeout=due[root])
+        return None
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    def run(self, max_cycles: Optional[int] = None) -> Dict[str, Qa8Status]:
+        """Run until every root halted or ran ``max_cycles`` cycles (if given) or stop() is called.
+        Returns the last status of every root that ran."""
+        last: Dict[str, Qa8Status] = {}
+        threads: List[threading.Thread] = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="qa8-hash") as pool:
+            try:
+                for root, eng in self.engines.items():
+                    eng.executor = pool
+                    try:
+                        eng.load_baseline()
+                        watcher = eng.open_change_watcher(
+                            debounce_sec=self.debounce_sec, backend=self.backend, poll_interval=self.poll_interval
+                        )
+                    except Exception as exc:
+                        self._fail(root, "start", exc)
+                        continue
+                    t = threading.Thread(target=self._pump, args=(root, watcher), name=f"qa8-watch:{root}", daemon=True)
+                    t.start()
+                    threads.append(t)
+                    self.submit(root, None)  # initial full cycle
+                while True:
+                    nxt = self._next()
+                    if nxt is None:
+                        break
+                    root, dirty = nxt
+                    try:
+                        status = self.engines[root].run_cycle(dirty)
+                    except Exception as exc:
+                        self._fail(root, "cycle", exc)
+                        continue
+                    last[root] = status
+                    self.cycles[root] += 1
+                    _log(f"[QA8 SUPERVISOR] {root} cycle={self.cycles[root]} mode={status.mode} "
+                         f"changed={'all' if dirty is None else len(dirty)} pending={len(self._pending)}")
+                    if status.mode == Qa8Mode.HALT or (max_cycles is not None and self.cycles[root] >= max_cycles):
+                        if status.mode == Qa8Mode.HALT:
+                            _log(f"[QA8 SUPERVISOR] {root} reached HALT – no longer watched (fail-closed).")
+                        self._drop(root)
+            finally:
+                self.stop()
+                for t in threads:
+                    t.join()
+                for eng in self.engines.values():
+                    eng.executor = None
+        return last
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stop.set()
+            self._cond.notify_all()
+
+    def _drop(self, root: str) -> None:
+        with self._cond:
+            self._active.discard(root)
+            self._pending.pop(root, None)
+            if not self._active:
+                self._stop.set()
+
+    def _fail(self, root: str, where: str, exc: BaseException) -> None:
+        self.errors[root] = f"{where}: {type(exc).__name__}: {exc}"
+        _log(f"[QA8 SUPERVISOR] {root} {where} failed ({type(exc).__name__}: {exc}) – no longer watched (fail-closed).")
+        self._drop(root)
+
+    def _pump(self, root: str, watcher: Any) -> None:
+        """Forward a root's change bursts to the scheduler until stopped or the root is dropped.
+
+        A watcher that raises drops its root: changes would otherwise go unnoticed."""
+        try:
+            with watcher:
+                while not self._stop.is_set() and root in self._active:
+                    dirty = watcher.wait(timeout=_WAKE_SEC)
+                    if dirty is not None:
+                        self.submit(root, dirty)
+        except Exception as exc:
+            self._fail(root, "watcher", exc)
@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from .anchors import sha256_tree, sha256_file
+from .anchors import TreeSpec, sha256_file, sha256_trees
+from .canonical import sha256_canonical
 
 
 @dataclass(frozen=True)
@@ -34,12 +35,14 @@ def build_system_object(root: str, config_path: str) -> UDGSSystemObject:
     with open(config_path, "r", encoding="utf-8") as f:
         config = json.load(f)
 
-    comps: Dict[str, ComponentRef] = {}
+    # Components overlap (AXL_UI covers the whole root), so they are collected
+    # first and hashed together: every file is read once, in one walk.
+    specs: Dict[str, TreeSpec] = {}
+    kinds: Dict[str, Tuple[str, str]] = {}
 
     def add_tree(name: str, rel_path: str, kind: str, *, exclude_rel_paths: Optional[set[str]] = None, exclude_rel_prefixes: Optional[set[str]] = None) -> None:
-        abs_path = os.path.join(root, rel_path)
-        tree_hash, _ = sha256_tree(abs_path, exclude_rel_paths=exclude_rel_paths, exclude_rel_prefixes=exclude_rel_prefixes)
-        comps[name] = ComponentRef(name=name, path=rel_path, kind=kind, hash=tree_hash)
+        specs[name] = TreeSpec(rel_path, frozenset(exclude_rel_paths or ()), frozenset(exclude_rel_prefixes or ()))
+        kinds[name] = (rel_path, kind)
 
     audit_excludes = set(config.get("audit_exclude_rel_paths", []))
     audit_exclude_prefixes = set(config.get("audit_exclude_rel_prefixes", []))
@@ -57,6 +60,12 @@ def build_system_object(root: str, config_path: str) -> UDGSSystemObject:
     if os.path.isdir(os.path.join(root, "system")):
         add_tree("SYSTEM_DOCS", "system", "docs")
 
+    hashed = sha256_trees(root, specs)
+    comps: Dict[str, ComponentRef] = {
+        name: ComponentRef(name=name, path=rel_path, kind=kind, hash=hashed[name][0])
+        for name, (rel_path, kind) in kinds.items()
+    }
+
     # System anchor: hash over component hashes + config hash
     config_hash = sha256_file(config_path)
     anchor_payload = {"config_hash": config_hash, "components": {k: v.hash for k, v in sorted(comps.items())}}
@@ -66,9 +75,7 @@ def build_system_object(root: str, config_path: str) -> UDGSSystemObject:
 
 
 def sha256_tree_payload(payload: Dict[str, Any]) -> str:
-    import hashlib
-    b = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(b).hexdigest()
+    return sha256_canonical(payload)
 
 
 def write_system_object(path: str, obj: UDGSSystemObject) -> None:
@@ -0,0 +1,173 @@
+"""
+udgs_core.telemetry
+===================
+Per-cycle QA8 performance metrics.
+
+Each cycle records files visited, files and bytes actually read, cache hits
+(served from the QA8 stat snapshot), per-component hash time and
+the total cycle latency.  Qa8Telemetry accumulates them since engine start:
+counters, a cycle latency histogram and one hash-time histogram per
+component.  ``as_dict()`` goes into QA8_STATUS.json; ``prometheus()`` is the
+text exposition format, rewritten as ``qa8_state/metrics.prom`` after every
+cycle (suitable for node_exporter's textfile collector).
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+CYCLE_SECONDS_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+COMPONENT_SECONDS_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics: bucket i counts values <= le)."""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, le in enumerate(self.buckets):
+            if value <= le:
+                self.counts[i] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": {_le(le): n for le, n in zip(self.buckets, self.counts)} | {"+Inf": self.count},
+            "sum": round(self.sum, 6),
+            "count": self.count,
+        }
+
+    def prometheus(self, name: str, labels: Dict[str, str]) -> List[str]:
+        lines = [f"{name}_bucket{_labels({**labels, 'le': _le(le)})} {n}" for le, n in zip(self.buckets, self.counts)]
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {self.count}")
+        lines.append(f"{name}_sum{_labels(labels)} {self.sum!r}")
+        lines.append(f"{name}_count{_labels(labels)} {self.count}")
+        return lines
+
+
+@dataclass
+class CycleMetrics:
+    files_visited: int = 0
+    files_hashed: int = 0
+    bytes_hashed: int = 0
+    cycle_seconds: float = 0.0
+    incremental: bool = False
+    component_seconds: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def cache_hits(self) -> int:
+        return max(0, self.files_visited - self.files_hashed)
+
+    @property
+    def cache_hit_ratio(self) -> Optional[float]:
+        return self.cache_hits / self.files_visited if self.files_visited else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        ratio = self.cache_hit_ratio
+        return {
+            "files_visited": self.files_visited,
+            "files_hashed": self.files_hashed,
+            "bytes_hashed": self.bytes_hashed,
+            "cache_hits": self.cache_hits,
+            "cache_hit_ratio": round(ratio, 6) if ratio is not None else None,
+            "cycle_seconds": round(self.cycle_seconds, 6),
+            "incremental": self.incremental,
+            "component_seconds": {k: round(v, 6) for k, v in sorted(self.component_seconds.items())},
+        }
+
+
+class Qa8Telemetry:
+    """Metrics of one engine since it started."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.cycles = 0
+        self.files_visited = 0
+        self.files_hashed = 0
+        self.bytes_hashed = 0
+        self.cache_hits = 0
+        self.last: Optional[CycleMetrics] = None
+        self.cycle_seconds = Histogram(CYCLE_SECONDS_BUCKETS)
+        self.component_seconds: Dict[str, Histogram] = {}
+
+    def record(self, cycle: CycleMetrics) -> None:
+        self.cycles += 1
+        self.files_visited += cycle.files_visited
+        self.files_hashed += cycle.files_hashed
+        self.bytes_hashed += cycle.bytes_hashed
+        self.cache_hits += cycle.cache_hits
+        self.cycle_seconds.observe(cycle.cycle_seconds)
+        for name, seconds in cycle.component_seconds.items():
+            self.component_seconds.setdefault(name, Histogram(COMPONENT_SECONDS_BUCKETS)).observe(seconds)
+        self.last = cycle
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "last_cycle": self.last.as_dict() if self.last is not None else None,
+            "totals": {
+                "cycles": self.cycles,
+                "files_visited": self.files_visited,
+                "files_hashed": self.files_hashed,
+                "bytes_hashed": self.bytes_hashed,
+                "cache_hits": self.cache_hits,
+            },
+            "histograms": {
+                "cycle_seconds": self.cycle_seconds.as_dict(),
+                "component_hash_seconds": {n: h.as_dict() for n, h in sorted(self.component_seconds.items())},
+            },
+        }
+
+    def prometheus(self) -> str:
+        root = {"root": self.root}
+        out: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[str]) -> None:
+            out.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples])
+
+        metric("qa8_cycles_total", "counter", "QA8 audit cycles run.", [f"qa8_cycles_total{_labels(root)} {self.cycles}"])
+        metric("qa8_files_visited_total", "counter", "Files checked against their hash.",
+               [f"qa8_files_visited_total{_labels(root)} {self.files_visited}"])
+        metric("qa8_files_hashed_total", "counter", "Files read and hashed (cache misses).",
+               [f"qa8_files_hashed_total{_labels(root)} {self.files_hashed}"])
+        metric("qa8_bytes_hashed_total", "counter", "Bytes read and hashed.",
+               [f"qa8_bytes_hashed_total{_labels(root)} {self.bytes_hashed}"])
+        metric("qa8_cache_hits_total", "counter", "Files served from the stat snapshot.",
+               [f"qa8_cache_hits_total{_labels(root)} {self.cache_hits}"])
+        ratio = self.last.cache_hit_ratio if self.last is not None else None
+        if ratio is not None:
+            metric("qa8_cache_hit_ratio", "gauge", "Cache hit ratio of the last cycle.",
+                   [f"qa8_cache_hit_ratio{_labels(root)} {ratio!r}"])
+        metric("qa8_cycle_duration_seconds", "histogram", "Total QA8 cycle latency.",
+               self.cycle_seconds.prometheus("qa8_cycle_duration_seconds", root))
+        samples: List[str] = []
+        for name, hist in sorted(self.component_seconds.items()):
+            samples += hist.prometheus("qa8_component_hash_seconds", {**root, "component": name})
+        metric("qa8_component_hash_seconds", "histogram", "Time spent hashing each component's files per cycle.", samples)
+        return "\n".join(out) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        tmp = f"{path}.tmp.{os.getpid()}"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.prometheus())
+        os.replace(tmp, path)
+
+
+def _le(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
@@ -0,0 +1,181 @@
+"""
+udgs_core.tests.test_canonical
+==============================
+Conformance of every canonical-JSON digest with the reference encoding
+
+    json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=<flavour>)
+
+hashed as UTF-8.  Each caller keeps the flavour its digests were defined with.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from udgs_core.anchors import sha256_json
+from udgs_core.canonical import canonical_json, join_array, memoize, sha256_canonical
+from udgs_core.strict_json import compute_packet_anchor, packet_anchor_payload
+from udgs_core.system_object import sha256_tree_payload
+from udgs_core.ad2026.identity import AAID, APBChain, _canonical_json
+from udgs_core.ad2026.typed_plan import ActionType, SPS, TypedAction
+from udgs_core.ad2026.gates import EnvironmentProfile, GateRunResult, GateRunnerResult, GateStatus
+from udgs_core.ad2026.cognitive import UDSInput, _sha256
+
+
+def _ref(obj, *, ensure_ascii=True, default=None) -> str:
+    text = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=ensure_ascii, default=default)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+SAMPLES = [
+    None,
+    True,
+    0,
+    -17,
+    2.5,
+    "plain",
+    "naïve — ✓ 日本",
+    [],
+    {},
+    [1, "two", None, [3.0, False]],
+    {"b": 1, "a": {"z": [], "y": "ü"}, "ключ": "значення"},
+    {"nested": [{"k": i, "v": str(i) * i} for i in range(5)]},
+]
+
+
+class TestCanonicalEncoding:
+    @pytest.mark.parametrize("obj", SAMPLES)
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    def test_matches_reference(self, obj, ensure_ascii):
+        assert sha256_canonical(obj, ensure_ascii=ensure_ascii) == _ref(obj, ensure_ascii=ensure_ascii)
+
+    def test_default_hook(self):
+        obj = {"t": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+        assert sha256_canonical(obj, default=str) == _ref(obj, default=str)
+        with pytest.raises(TypeError):
+            canonical_json(obj)
+
+    def test_join_array_is_list_encoding(self):
+        items = [{"b": 2, "a": 1}, "x", [None]]
+        assert join_array(canonical_json(i) for i in items) == canonical_json(items)
+        assert join_array([]) == canonical_json([])
+
+    def test_memoize_computes_once(self):
+        calls = []
+
+        @dataclasses.dataclass(frozen=True)
+        class Box:
+            value: int
+
+            @memoize
+            def digest(self) -> str:
+                calls.append(1)
+                return sha256_canonical(self.value)
+
+        b = Box(3)
+        assert b.digest() == b.digest() == _ref(3)
+        assert len(calls) == 1
+        assert dataclasses.asdict(b) == {"value": 3} and b == Box(3)
+
+
+class TestCallersConform:
+    """Every caller that hashes canonical JSON, against the reference."""
+
+    def test_anchors_and_system_object(self):
+        obj = {"config_hash": "c" * 64, "components": {"B": "é", "A": "1"}}
+        assert sha256_json(obj) == _ref(obj)
+        assert sha256_tree_payload(obj) == _ref(obj)
+
+    def test_packet_anchor(self):
+        packet = {
+            "FAIL_PACKET": {"summary": "ß", "signals": ["s"], "repro": "r"},
+            "MUTATION_PLAN": {"diff_scope": ["m"], "constraints": ["c"]},
+            "PRE_VERIFICATION_SCRIPT": "x",
+            "REGRESSION_TEST_PAYLOAD": {"suite": ["t"], "expected": {"ok": True}},
+            "SHA256_ANCHOR": "0" * 64,
+        }
+        assert compute_packet_anchor(packet) == _ref(packet_anchor_payload(packet))
+
+    def test_apb_chain_keeps_unicode_literal(self):
+        assert _canonical_json({"ü": "✓"}) == '{"ü":"✓"}'.encode("utf-8")
+        chain = APBChain(AAID.generate("agent"), "a" * 64, "b" * 64, "c" * 64)
+        state = {"β": [1, 2], "α": "ж"}
+        header = chain.append(input_state=state, output_state={}, gate_results={"G6": "PASS"})
+        assert header.sha256_input_state == _ref(state, ensure_ascii=False)
+        assert header.gate_results_hash == _ref({"G6": "PASS"}, ensure_ascii=False)
+        d = header.as_dict()
+        d.pop("jws_token")
+        assert header.sha256() == _ref(d, ensure_ascii=False)
+
+    def test_sps(self):
+        sps = SPS(sps_id="SPS-1", agent_id="agent", utc="2026-01-01T00:00:00Z")
+        sps.add(TypedAction(
+            action_id="a1", action_type=ActionType.READ, preconditions=["ready ✓"], postconditions=[],
+            invariants_touched=[], rollback_action_id="NOOP", metadata={"ñ": 1},
+        ))
+        d = {"sps_id": sps.sps_id, "agent_id": sps.agent_id, "utc": sps.utc, "actions": [a.as_dict() for a in sps.actions]}
+        assert sps.sha256() == _ref(d)
+
+    def test_gate_runner_result(self):
+        results = [
+            GateRunResult(gate_id="G6-AUTH", status=GateStatus.PASS, evidence=["ok ✓"]),
+            GateRunResult(gate_id="G7-FORMAL", status=GateStatus.FAIL, violations=["v"]),
+        ]
+        runner = GateRunnerResult(results)
+        assert runner.gate_results_hash == _ref([r.as_dict() for r in results])
+        assert GateRunnerResult([]).gate_results_hash == _ref([])
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            results[0].status = GateStatus.FAIL  # type: ignore[misc]
+
+    def test_gate_run_result_does_not_alias_caller_lists(self):
+        evidence = ["ok"]
+        result = GateRunResult(gate_id="G6-AUTH", status=GateStatus.PASS, evidence=evidence)
+        before = result.canonical_bytes()
+        evidence.append("late")
+        assert result.evidence == ("ok",) and result.violations == ()
+        assert result.canonical_bytes() == before == canonical_json(result.as_dict())
+        assert result.as_dict()["evidence"] == ["ok"]
+
+    def test_cognitive_and_environment(self):
+        obj = {"k": ["ä", 1]}
+        assert _sha256(obj) == _ref(obj)
+        uds = UDSInput(intent="ı", constraints=["c"], objective="o", ac_sha256="", policy_pack_sha256="", telemetry_hash="")
+        assert uds.uds_hash == _ref({"intent": "ı", "constraints": ["c"], "objective": "o"})
+        env = EnvironmentProfile(profile_id="p", python_version="3", platform="linux", toolchain_pins={"py": "3"})
+        assert env.compute_fingerprint() == _ref(
+            {"profile_id": "p", "python_version": "3", "platform": "linux", "toolchain_pins": {"py": "3"}}
+        )
+
+    def test_proof_bundle(self):
+        pytest.importorskip("pydantic")
+        sys.path.insert(0, os.path.join(ROOT, "tools", "dao-arbiter"))
+        try:
+            from dao_lifebook.models import CheckResult, CheckStatus, DiffSummary, ProofBundle, TimeSpan
+        finally:
+            sys.path.pop(0)
+        bundle = ProofBundle(
+            pr_url="https://example.invalid/pull/1",
+            commit_sha="abc1234",
+            required_checks_final=[CheckResult(name="ci ✓", status=CheckStatus.SUCCESS)],
+            diff_summary=DiffSummary(files_changed=1, loc_delta=2),
+            time=TimeSpan(t_start=datetime(2026, 1, 1, tzinfo=timezone.utc)),
+        )
+        assert isinstance(bundle.required_checks_final, tuple) and bundle.artifacts == ()
+        data = bundle.model_dump(mode="json")
+        data.pop("schema_version")
+        assert data["required_checks_final"] == [{"name": "ci ✓", "status": "success", "run_url": "",
+                                                  "started_at": None, "completed_at": None}]
+        assert bundle.integrity_hash() == bundle.integrity_hash() == _ref(data, default=str)
+        copied = bundle.model_copy(update={"commit_sha": "def5678"})
+        data["commit_sha"] = "def5678"
+        assert copied.integrity_hash() == _ref(data, default=str) != bundle.integrity_hash()
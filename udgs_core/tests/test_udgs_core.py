@@ -141,6 +141,183 @@ class TestSha256Tree:
         h2, _ = sha256_tree(str(tmp_path / ".." / tmp_path.name))
         assert h1 == h2
 
+    @staticmethod
+    def _walk_reference(root, exclude_rel_paths=(), exclude_rel_prefixes=()):
+        # The original single-threaded os.walk implementation.
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for fn in sorted(filenames):
+                rel = os.path.relpath(os.path.join(dirpath, fn), root).replace("\\", "/")
+                if rel in exclude_rel_paths or any(rel.startswith(p) for p in exclude_rel_prefixes):
+                    continue
+                files[rel] = sha256_file(os.path.join(dirpath, fn))
+        return sha256_json(files), files
+
+    def test_matches_os_walk_reference(self, tmp_path):
+        for rel in ["b.txt", "a/z.txt", "a/b/c.txt", "ab.txt", "art/x", "artifacts/y", "state/q.json", "state2/q.json"]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text(rel)
+        if hasattr(os, "symlink"):
+            os.symlink(tmp_path / "a", tmp_path / "linked_dir")
+            os.symlink(tmp_path / "b.txt", tmp_path / "linked_file.txt")
+        cases = [
+            {},
+            {"exclude_rel_paths": {"b.txt", "a/b/c.txt"}},
+            # Plain string prefixes: "art" also covers "artifacts/", "state/" does not cover "state2/".
+            {"exclude_rel_prefixes": {"art", "state/", "a/b"}},
+        ]
+        for kwargs in cases:
+            expected = self._walk_reference(str(tmp_path), **kwargs)
+            for workers in (1, 4):
+                got = sha256_tree(str(tmp_path), workers=workers, **kwargs)
+                assert got == expected
+                assert list(got[1]) == list(expected[1])
+
+
+from udgs_core.anchors import MerkleTree, TreeSpec, load_merkle_tree, save_merkle_tree, sha256_trees
+
+
+class TestFileHash:
+    def test_counts_files_and_bytes_read(self, tmp_path):
+        from udgs_core.anchors import READS, sha256_file
+
+        path = tmp_path / "f.txt"
+        path.write_text("one")
+        files, nbytes = READS.files, READS.bytes
+        assert sha256_file(str(path)) == hashlib.sha256(b"one").hexdigest()
+        assert (READS.files - files, READS.bytes - nbytes) == (1, 3)
+
+
+class TestStatState:
+    def test_skips_unchanged_files_and_forgets_deleted(self, tmp_path, monkeypatch):
+        from udgs_core.anchors import StatState, load_stat_state, save_stat_state
+
+        monkeypatch.setattr("udgs_core.anchors.RACY_WINDOW_NS", 0)
+        tree = tmp_path / "tree"
+        tree.mkdir()
+        (tree / "a.txt").write_text("a")
+        (tree / "b.txt").write_text("b")
+        specs = {"root": TreeSpec()}
+        state = StatState()
+        first = sha256_trees(str(tree), specs, state=state)
+        assert (state.hits, state.misses) == (0, 2)
+
+        path = str(tmp_path / "state.json")
+        save_stat_state(path, state)
+        reloaded = load_stat_state(path)
+        assert sha256_trees(str(tree), specs, state=reloaded) == first
+        assert (reloaded.hits, reloaded.misses, reloaded.changed) == (2, 0, False)
+
+        (tree / "a.txt").write_text("changed")
+        os.remove(tree / "b.txt")
+        tree_hash, files = sha256_trees(str(tree), specs, state=reloaded)["root"]
+        assert (tree_hash, files) == sha256_tree(str(tree))
+        assert set(reloaded.files) == {"a.txt"} and reloaded.misses == 1
+
+    def test_racy_files_are_not_remembered(self, tmp_path):
+        from udgs_core.anchors import StatState
+
+        (tmp_path / "fresh.txt").write_text("x")
+        state = StatState()
+        sha256_trees(str(tmp_path), {"root": TreeSpec()}, state=state)
+        assert state.files == {}
+
+    def test_load_rejects_bad_snapshot(self, tmp_path):
+        from udgs_core.anchors import load_stat_state
+
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"schema": "udgs-stat-state/1", "files": {"a": [1, 2]}}))
+        assert load_stat_state(str(path)) is None
+        assert load_stat_state(str(tmp_path / "missing.json")) is None
+
+
+class TestSha256Trees:
+    def test_nested_trees_match_separate_walks_and_read_each_file_once(self, tmp_path, monkeypatch):
+        import udgs_core.anchors as anchors_mod
+
+        for rel in ["top.txt", "engine/a.py", "engine/sub/b.py", "state/x.json", "state/comp/y.json", "real/z.txt", "SYSTEM_OBJECT.json"]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text(rel)
+        if hasattr(os, "symlink"):
+            os.symlink(tmp_path / "real", tmp_path / "linked")
+        specs = {
+            "ROOT": TreeSpec(".", frozenset({"SYSTEM_OBJECT.json"}), frozenset({"state/", "engine/sub"})),
+            "ENGINE": TreeSpec("engine"),
+            "SUB": TreeSpec("engine/sub"),
+            # Inside a prefix the root tree excludes: still walked for this tree.
+            "COMP": TreeSpec("state/comp"),
+            "LINKED": TreeSpec("linked"),
+            "GONE": TreeSpec("missing"),
+        }
+        hashed = []
+        real_sha = anchors_mod.sha256_file
+        monkeypatch.setattr(anchors_mod, "sha256_file", lambda p, **kw: hashed.append(p) or real_sha(p, **kw))
+        got = sha256_trees(str(tmp_path), specs)
+        monkeypatch.setattr(anchors_mod, "sha256_file", real_sha)
+
+        for name, spec in specs.items():
+            expected = sha256_tree(
+                str(tmp_path / spec.path),
+                exclude_rel_paths=set(spec.exclude_rel_paths),
+                exclude_rel_prefixes=set(spec.exclude_rel_prefixes),
+            )
+            assert got[name] == expected, name
+        assert len(hashed) == len(set(hashed))
+
+
+class TestMerkleTree:
+    EXCLUDES = {"exclude_rel_paths": {"gen.json"}, "exclude_rel_prefixes": {"state/"}}
+
+    @staticmethod
+    def _populate(root):
+        for rel in ["gen.json", "top.txt", "src/a.py", "src/pkg/b.py", "src/pkg/deep/c.py", "docs/x.md", "state/s.json"]:
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_text(rel)
+
+    def test_flat_anchor_matches_sha256_tree(self, tmp_path):
+        self._populate(tmp_path)
+        tree = MerkleTree.build(str(tmp_path), **self.EXCLUDES)
+        h, files = sha256_tree(str(tmp_path), **self.EXCLUDES)
+        assert tree.tree_hash() == h
+        assert tree.file_hashes() == files
+        assert tree.digest("state") is None
+
+    def test_update_rehashes_only_dirty_paths(self, tmp_path):
+        self._populate(tmp_path)
+        tree = MerkleTree.build(str(tmp_path), **self.EXCLUDES)
+        before = MerkleTree.build(str(tmp_path), **self.EXCLUDES)
+        docs_digest = tree.digest("docs")
+
+        (tmp_path / "src/pkg/deep/c.py").write_text("changed")
+        (tmp_path / "src/pkg/new.py").write_text("new")
+        shutil.rmtree(tmp_path / "docs")
+        (tmp_path / "state/s.json").write_text("excluded")
+        hashed = tree.update(str(tmp_path), ["src/pkg/deep/c.py", "src/pkg/new.py", "docs", "state/s.json"])
+
+        assert hashed == 2
+        fresh = MerkleTree.build(str(tmp_path), **self.EXCLUDES)
+        assert tree.root_digest == fresh.root_digest
+        assert tree.tree_hash() == sha256_tree(str(tmp_path), **self.EXCLUDES)[0]
+        assert docs_digest is not None and tree.digest("docs") is None
+        assert tree.diff(before) == ["docs/", "src/pkg/new.py", "src/pkg/deep/c.py"]
+
+    def test_persisted_tree_round_trips_and_rejects_tampering(self, tmp_path):
+        root = tmp_path / "root"
+        root.mkdir()
+        self._populate(root)
+        tree = MerkleTree.build(str(root), **self.EXCLUDES)
+        state = tmp_path / "tree.json"
+        save_merkle_tree(str(state), tree)
+        loaded = load_merkle_tree(str(state))
+        assert loaded is not None and loaded.root_digest == tree.root_digest
+        assert loaded.same_selection(**self.EXCLUDES)
+
+        data = json.loads(state.read_text())
+        data["root"]["dirs"]["src"]["files"]["a.py"] = "0" * 64
+        state.write_text(json.dumps(data))
+        assert load_merkle_tree(str(state)) is None
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # STATE MACHINE
@@ -298,6 +475,41 @@ class TestValidatePacket:
 # ADAPTER
 # ═══════════════════════════════════════════════════════════════════════
 
+import udgs_core.bulk_validate as bulk_validate
+from udgs_core.strict_json import packet_anchor_payload
+
+
+class TestBulkValidate:
+    def test_directory_results_in_sorted_order(self, tmp_path):
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a.json").write_text(json.dumps(_valid_packet()))
+        (tmp_path / "b" / "c.json").write_text("{not json")
+        (tmp_path / "b" / "d.json").write_text(json.dumps({**_valid_packet(), "EXTRA": 1}))
+        (tmp_path / "notes.txt").write_text("ignored")
+        results = list(bulk_validate.validate_stream(bulk_validate.iter_packet_sources(str(tmp_path)), workers=1))
+        assert [os.path.relpath(r.source, tmp_path) for r in results] == ["a.json", os.path.join("b", "c.json"), os.path.join("b", "d.json")]
+        assert [r.ok for r in results] == [True, False, False]
+        assert results[1].errors[0].message.startswith("Unreadable packet")
+
+    def test_jsonl_on_process_pool_keeps_input_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bulk_validate, "PARALLEL_MIN_PACKETS", 4)
+        packets = [_valid_packet(PRE_VERIFICATION_SCRIPT=f"run {i}") for i in range(40)]
+        packets[7]["SHA256_ANCHOR"] = "0" * 64
+        src = tmp_path / "packets.jsonl"
+        src.write_text("".join(json.dumps(p) + "\n" + ("\n" if i == 3 else "") for i, p in enumerate(packets)))
+        results = list(bulk_validate.validate_stream(bulk_validate.iter_packet_sources(str(src)), workers=2, chunk_size=3))
+        assert len(results) == 40
+        assert results[4].source == f"{src}:6"  # blank line 5 skipped
+        assert [i for i, r in enumerate(results) if not r.ok] == [7]
+        assert "Anchor mismatch" in results[7].errors[0].message
+
+    def test_anchor_does_not_copy_or_mutate(self):
+        p = _valid_packet()
+        payload = packet_anchor_payload(p)
+        assert "SHA256_ANCHOR" not in payload and "SHA256_ANCHOR" in p
+        assert payload["FAIL_PACKET"] is p["FAIL_PACKET"]
+
+
 from udgs_core.adapters.dao_lifebook_adapter import proof_bundle_to_udgs_packet
 
 
@@ -354,13 +566,13 @@ from udgs_core.autonomous_audit import (
 )
 
 
-def _make_test_engine(tmp_path):
+def _make_test_engine(tmp_path, component_path="engine"):
     """Build a minimal but real engine for testing."""
     from udgs_core.anchors import sha256_tree, sha256_file
     from udgs_core.system_object import sha256_tree_payload
 
-    engine_dir = tmp_path / "engine"
-    engine_dir.mkdir()
+    engine_dir = tmp_path / component_path
+    engine_dir.mkdir(parents=True)
     (engine_dir / "stub.py").write_text("# stub")
 
     config = {
@@ -378,7 +590,7 @@ def _make_test_engine(tmp_path):
     so = {
         "config": config,
         "components": {
-            "AXL_ENGINE": {"name": "AXL_ENGINE", "path": "engine", "kind": "engine", "hash": engine_hash}
+            "AXL_ENGINE": {"name": "AXL_ENGINE", "path": component_path, "kind": "engine", "hash": engine_hash}
         },
         "system_anchor": system_anchor,
         "audit": {"excluded_from_root_hash": [], "excluded_prefixes_from_root_hash": ["qa8_state/"]},
@@ -454,6 +666,107 @@ class TestAutonomousAuditEngine:
         assert len(ghost_drifts) == 1
         assert ghost_drifts[0].live_hash == "MISSING"
 
+    def test_cycle_hashes_each_file_once(self, tmp_path, monkeypatch):
+        import udgs_core.anchors as anchors_mod
+
+        eng = _make_test_engine(tmp_path)
+        eng.load_baseline()
+        passes, hashed = [], []
+        compute = eng._compute_live_hashes
+        monkeypatch.setattr(eng, "_compute_live_hashes", lambda *a: passes.append(1) or compute(*a))
+        real_sha = anchors_mod.sha256_file
+        monkeypatch.setattr(anchors_mod, "sha256_file", lambda p, **kw: hashed.append(p) or real_sha(p, **kw))
+
+        assert eng.run_cycle().mode == Qa8Mode.NOMINAL
+        assert passes == [1]
+        assert hashed == [str(tmp_path / "engine" / "stub.py")]
+
+        (tmp_path / "engine" / "drift.txt").write_text("drift")
+        passes.clear()
+        eng.run_cycle()
+        assert passes == [1]
+
+    def test_unchanged_files_not_reread_across_restarts(self, tmp_path, monkeypatch):
+        import udgs_core.anchors as anchors_mod
+        monkeypatch.setattr(anchors_mod, "RACY_WINDOW_NS", 0)
+        hashed = []
+        real_sha = anchors_mod.sha256_file
+
+        def recording_sha(p, **kw):
+            if p.startswith(str(tmp_path / "engine")):
+                hashed.append(p)
+            return real_sha(p, **kw)
+
+        eng = _make_test_engine(tmp_path)
+        monkeypatch.setattr(anchors_mod, "sha256_file", recording_sha)
+        stub = str(tmp_path / "engine" / "stub.py")
+        status = eng.run_cycle()
+        assert hashed == [stub]
+        assert status.last_full_verify_utc is not None
+        assert (tmp_path / "qa8_state" / "stat_state.json").exists()
+
+        hashed.clear()
+        restarted = AutonomousAuditEngine(
+            root=eng.root, config_path=eng.config_path, system_object_path=eng.system_object_path,
+            qa8_state_dir=eng.qa8_state_dir, qa8_config={},
+        )
+        assert restarted.run_cycle().mode == Qa8Mode.NOMINAL
+        assert hashed == []
+
+        (tmp_path / "engine" / "stub.py").write_text("# edited")
+        assert [d.name for d in restarted.detect_drift()] == ["AXL_ENGINE"]
+        assert hashed == [stub]
+
+    def test_full_verify_rereads_every_file(self, tmp_path, monkeypatch):
+        import udgs_core.anchors as anchors_mod
+        monkeypatch.setattr(anchors_mod, "RACY_WINDOW_NS", 0)
+        eng = _make_test_engine(tmp_path)
+        eng._full_verify_interval = 0.0
+        eng.run_cycle()
+        hashed = []
+        real_sha = anchors_mod.sha256_file
+        monkeypatch.setattr(anchors_mod, "sha256_file", lambda p, **kw: hashed.append(p) or real_sha(p, **kw))
+        eng.run_cycle()
+        eng.run_cycle()
+        stub = str(tmp_path / "engine" / "stub.py")
+        assert [h for h in hashed if h == stub] == [stub, stub]
+
+    def test_drift_names_changed_paths(self, tmp_path):
+        eng = _make_test_engine(tmp_path)
+        eng.load_baseline()
+        assert eng.detect_drift() == []
+        assert (tmp_path / "qa8_state" / "merkle" / "AXL_ENGINE.json").exists()
+
+        (tmp_path / "engine" / "stub.py").write_text("# tampered")
+        (tmp_path / "engine" / "pkg").mkdir()
+        (tmp_path / "engine" / "pkg" / "new.py").write_text("# new")
+        eng._good_trees.clear()  # as after a restart: the good tree comes from disk
+        (drift,) = eng.detect_drift()
+        assert drift.changed_paths == ["engine/stub.py", "engine/pkg/"]
+        assert drift.changed_path_count == 2
+
+    @pytest.mark.parametrize("renamed", [True, False])
+    def test_ancestor_change_rehashes_nested_component(self, tmp_path, renamed):
+        eng = _make_test_engine(tmp_path, component_path="tools/dao")
+        eng.run_cycle()
+        assert eng.run_cycle().mode == Qa8Mode.NOMINAL
+        # The watcher reports only the parent directory that moved or vanished.
+        if renamed:
+            os.rename(tmp_path / "tools", tmp_path / "tools_old")
+        else:
+            shutil.rmtree(tmp_path / "tools")
+        (tmp_path / "tools" / "dao").mkdir(parents=True)
+        (tmp_path / "tools" / "dao" / "stub.py").write_text("# tampered")
+        status = eng.run_cycle(dirty_paths=["tools", "tools_old"] if renamed else ["tools"])
+        assert status.mode != Qa8Mode.NOMINAL
+        assert eng._live_hashes["AXL_ENGINE"] == sha256_tree(str(tmp_path / "tools" / "dao"))[0]
+
+    def test_deleted_nested_component_forces_full_scan(self, tmp_path):
+        eng = _make_test_engine(tmp_path, component_path="tools/dao")
+        eng.run_cycle()
+        shutil.rmtree(tmp_path / "tools")
+        assert eng.run_cycle(dirty_paths=["tools"]).mode != Qa8Mode.NOMINAL
+
     def test_watch_terminates_on_max_cycles(self, tmp_path):
         eng = _make_test_engine(tmp_path)
         eng.load_baseline()
@@ -477,6 +790,239 @@ class TestAutonomousAuditEngine:
             assert key in d, f"Missing key: {key}"
 
 
+from udgs_core.supervisor import Qa8Supervisor
+
+
+def _make_supervised_root(path):
+    """A _make_test_engine tree laid out the way make_engine() expects."""
+    path.mkdir()
+    _make_test_engine(path)
+    (path / "system").mkdir()
+    os.replace(path / "udgs.config.json", path / "system" / "udgs.config.json")
+    return str(path)
+
+
+class TestQa8Supervisor:
+    def test_scheduler_merges_bursts_and_serves_longest_waiting_first(self, tmp_path):
+        a, b = _make_supervised_root(tmp_path / "a"), _make_supervised_root(tmp_path / "b")
+        sup = Qa8Supervisor([a, b, a])
+        assert list(sup.engines) == [a, b]
+        sup.submit(b, {"engine/x.py"})
+        sup.submit(a, {"engine/y.py"})
+        sup.submit(b, {"engine/z.py"})
+        assert sup._next() == (b, {"engine/x.py", "engine/z.py"})
+        sup.submit(a, None)  # a full scan absorbs pending paths
+        assert sup._next() == (a, None)
+
+    def test_runs_all_roots_on_one_hashing_pool(self, tmp_path, monkeypatch):
+        import udgs_core.autonomous_audit as audit_mod
+
+        roots = [_make_supervised_root(tmp_path / n) for n in ("a", "b", "c")]
+        executors = set()
+        real_trees = audit_mod.sha256_trees
+        monkeypatch.setattr(audit_mod, "sha256_trees", lambda *a, **kw: executors.add(kw.get("executor")) or real_trees(*a, **kw))
+
+        def tamper():
+            import time
+            time.sleep(0.3)
+            for root in roots:
+                with open(os.path.join(root, "engine", "injected.py"), "w") as f:
+                    f.write("# drift")
+
+        t = threading.Thread(target=tamper)
+        t.start()
+        sup = Qa8Supervisor(roots, workers=2, backend="poll", poll_interval=0.02, debounce_sec=0.05)
+        last = sup.run(max_cycles=2)
+        t.join()
+        assert sorted(last) == sorted(roots)
+        assert all(s.scan_count == 2 and s.mode in (Qa8Mode.ALERT, Qa8Mode.HEALED) for s in last.values())
+        assert len(executors) == 1 and None not in executors
+        assert all(eng.executor is None for eng in sup.engines.values())
+
+    def test_failing_root_is_dropped_and_others_keep_running(self, tmp_path):
+        a, b = _make_supervised_root(tmp_path / "a"), _make_supervised_root(tmp_path / "b")
+        sup = Qa8Supervisor([a, b], backend="poll", poll_interval=0.02)
+
+        def broken(dirty=None):
+            raise OSError("disk gone")
+
+        sup.engines[a].run_cycle = broken
+        last = sup.run(max_cycles=1)
+        assert list(last) == [b] and sup.cycles == {a: 0, b: 1}
+        assert sup.errors == {a: "cycle: OSError: disk gone"}
+
+    def test_watcher_failure_drops_its_root(self, tmp_path):
+        a, b = _make_supervised_root(tmp_path / "a"), _make_supervised_root(tmp_path / "b")
+        sup = Qa8Supervisor([a, b])
+
+        class BrokenWatcher:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def wait(self, timeout=None):
+                raise RuntimeError("inotify queue overflow")
+
+        sup.submit(a, None)
+        sup._pump(a, BrokenWatcher())
+        assert sup._active == {b} and a not in sup._pending
+        assert sup.errors == {a: "watcher: RuntimeError: inotify queue overflow"}
+
+    def test_rejects_empty_root_list(self):
+        with pytest.raises(ValueError, match="E_SUPERVISOR_NO_ROOTS"):
+            Qa8Supervisor([])
+
+
+from udgs_core.heal_log import HealLog, IndexEntry
+
+
+class TestHealLog:
+    @staticmethod
+    def _event(i):
+        return {"event_id": f"e{i:07d}", "utc": f"2026-03-01T00:00:{i:02d}Z", "outcome": "ALERT", "notes": ["x" * 40]}
+
+    def test_rotates_into_indexed_segments(self, tmp_path):
+        log = HealLog(str(tmp_path), segment_max_bytes=300)
+        for i in range(12):
+            log.append(self._event(i))
+        sealed = sorted(os.listdir(tmp_path / "heal_log"))
+        assert len(sealed) >= 3 and (tmp_path / "HEAL_LOG.jsonl").exists()
+        assert all(os.path.getsize(tmp_path / "heal_log" / n) < 300 + 150 for n in sealed)
+        assert len(log) == 12
+        assert [e["event_id"] for e in log.tail(3)] == ["e0000009", "e0000010", "e0000011"]
+        assert [e["event_id"] for e in log.since("2026-03-01T00:00:10Z")] == ["e0000010", "e0000011"]
+        assert [e["event_id"] for e in log.since("2026-03-01T00:00:00Z", limit=1)] == ["e0000011"]
+        assert log.since("2027-01-01T00:00:00Z") == []
+
+    def test_tail_opens_only_needed_segments(self, tmp_path, monkeypatch):
+        import builtins
+
+        log = HealLog(str(tmp_path), segment_max_bytes=300)
+        for i in range(12):
+            log.append(self._event(i))
+        opened = []
+        real_open = builtins.open
+        monkeypatch.setattr(builtins, "open", lambda p, *a, **kw: opened.append(os.path.basename(p)) or real_open(p, *a, **kw))
+        log.tail(1)
+        # Only the active segment: once for the unindexed-tail check, once for the event.
+        assert {n for n in opened if n.endswith(".jsonl")} == {"HEAL_LOG.jsonl"}
+
+    def test_indexes_log_written_without_index(self, tmp_path):
+        # A pre-index HEAL_LOG.jsonl (or a crash between the two appends) is indexed on open.
+        (tmp_path / "HEAL_LOG.jsonl").write_text("".join(json.dumps(self._event(i)) + "\n" for i in range(3)))
+        log = HealLog(str(tmp_path))
+        assert [e["event_id"] for e in log.tail(5)] == ["e0000000", "e0000001", "e0000002"]
+        log.append(self._event(3))
+        assert len(HealLog(str(tmp_path))) == 4
+        assert HealLog(str(tmp_path)).tail(1)[0]["event_id"] == "e0000003"
+
+    def test_readers_never_write_the_index(self, tmp_path):
+        # A reader between the writer's log append and index append must not index e1 itself.
+        writer = HealLog(str(tmp_path))
+        writer.append(self._event(0))
+        with open(tmp_path / "HEAL_LOG.jsonl", "ab") as f:
+            offset = f.tell()
+            f.write((json.dumps(self._event(1)) + "\n").encode())
+        index_before = (tmp_path / "HEAL_LOG.idx").read_bytes()
+        reader = HealLog(str(tmp_path))
+        assert [e["event_id"] for e in reader.tail(10)] == ["e0000000", "e0000001"]
+        assert [e["event_id"] for e in reader.since("2026-03-01T00:00:01Z")] == ["e0000001"]
+        assert (tmp_path / "HEAL_LOG.idx").read_bytes() == index_before
+        with open(tmp_path / "HEAL_LOG.idx", "ab") as f:  # the writer finishes its append
+            f.write(IndexEntry(1, self._event(1)["utc"], 0, offset, "e0000001").encode())
+        writer.append(self._event(2))
+        assert len(reader) == 3
+        assert [e["event_id"] for e in reader.tail(10)] == ["e0000000", "e0000001", "e0000002"]
+
+    def test_engine_writes_through_heal_log(self, tmp_path):
+        eng = _make_test_engine(tmp_path)
+        eng.load_baseline()
+        (tmp_path / "engine" / "drift.txt").write_text("drift")
+        eng.run_cycle()
+        (event,) = eng.heal_log.tail(10)
+        assert event["drifts"][0]["name"] == "AXL_ENGINE"
+
+    def test_cli_history(self, tmp_path):
+        state = tmp_path / "qa8_state"
+        state.mkdir()
+        (state / "QA8_STATUS.json").write_text(json.dumps({"mode": "ALERT", "grade": QA8_GRADE}))
+        log = HealLog(str(state), segment_max_bytes=300)
+        for i in range(5):
+            log.append(self._event(i))
+        r = subprocess.run(
+            [sys.executable, "-m", "udgs_core.cli", "qa8-status", "--root", str(tmp_path), "--history", "2"],
+            capture_output=True, text=True, cwd=ROOT,
+        )
+        assert r.returncode == 0, r.stderr
+        data = json.loads(r.stdout)
+        assert data["status"]["mode"] == "ALERT"
+        assert [e["event_id"] for e in data["history"]] == ["e0000003", "e0000004"]
+
+    def test_cli_history_rejects_non_integer(self, tmp_path):
+        r = subprocess.run(
+            [sys.executable, "-m", "udgs_core.cli", "qa8-status", "--root", str(tmp_path), "--history", "many"],
+            capture_output=True, text=True, cwd=ROOT,
+        )
+        assert r.returncode == 2
+        assert "invalid int value" in r.stderr and "Traceback" not in r.stderr
+
+
+from udgs_core.telemetry import CycleMetrics, Histogram, Qa8Telemetry
+
+
+class TestQa8Telemetry:
+    def test_histogram_buckets_are_cumulative(self):
+        h = Histogram((0.1, 1.0))
+        for v in (0.05, 0.5, 5.0):
+            h.observe(v)
+        assert h.as_dict()["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 3}
+        lines = h.prometheus("x_seconds", {"root": 'a"b'})
+        assert lines[0] == 'x_seconds_bucket{root="a\\"b",le="0.1"} 1'
+        assert lines[2] == 'x_seconds_bucket{root="a\\"b",le="+Inf"} 3'
+        assert lines[-1] == 'x_seconds_count{root="a\\"b"} 3'
+
+    def test_cycle_metrics_hit_ratio(self):
+        assert CycleMetrics().cache_hit_ratio is None
+        m = CycleMetrics(files_visited=4, files_hashed=1)
+        assert (m.cache_hits, m.cache_hit_ratio) == (3, 0.75)
+        t = Qa8Telemetry("/r")
+        t.record(m)
+        t.record(CycleMetrics(files_visited=4, component_seconds={"C": 0.002}))
+        assert t.as_dict()["totals"] == {
+            "cycles": 2, "files_visited": 8, "files_hashed": 1, "bytes_hashed": 0, "cache_hits": 7,
+        }
+        text = t.prometheus()
+        assert 'qa8_cache_hit_ratio{root="/r"} 1.0' in text
+        assert 'qa8_component_hash_seconds_count{root="/r",component="C"} 1' in text
+
+    def test_engine_cycles_record_metrics(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("udgs_core.anchors.RACY_WINDOW_NS", 0)
+        eng = _make_test_engine(tmp_path)
+        first = eng.run_cycle().telemetry
+        assert first["last_cycle"]["files_visited"] == 1
+        assert first["last_cycle"]["files_hashed"] == 1
+        assert first["last_cycle"]["bytes_hashed"] == len("# stub")
+        assert "AXL_ENGINE" in first["last_cycle"]["component_seconds"]
+        assert first["histograms"]["cycle_seconds"]["count"] == 1
+
+        second = eng.run_cycle().telemetry
+        assert second["last_cycle"]["files_hashed"] == 0
+        assert second["last_cycle"]["cache_hit_ratio"] == 1.0
+        assert second["totals"]["cycles"] == 2
+
+        third = eng.run_cycle(dirty_paths=["engine/stub.py"]).telemetry
+        assert third["last_cycle"]["incremental"] is True
+        assert third["last_cycle"]["files_visited"] == 1
+
+        prom = (tmp_path / "qa8_state" / "metrics.prom").read_text()
+        assert "# TYPE qa8_cycle_duration_seconds histogram" in prom
+        assert f'qa8_cycle_duration_seconds_count{{root="{tmp_path}"}} 3' in prom
+        status = json.loads((tmp_path / "qa8_state" / "QA8_STATUS.json").read_text())
+        assert status["telemetry"]["totals"]["cycles"] == 3
+
+
 class TestScoreSystem:
     def test_perfect_score(self):
         baseline = {"components": {"A": {"hash": "aaa"}, "B": {"hash": "bbb"}}}
@@ -509,6 +1055,92 @@ class TestScoreSystem:
         assert all(s == 1.0 for s in results)
 
 
+from udgs_core.fswatch import InotifyWatcher, PollingWatcher, inotify_available, open_watcher
+
+_BACKENDS = [
+    "poll",
+    pytest.param("inotify", marks=pytest.mark.skipif(not inotify_available(), reason="inotify unavailable")),
+]
+
+
+class TestFsWatch:
+    def test_base_watcher_is_abstract(self, tmp_path):
+        from udgs_core.fswatch import _Watcher
+
+        with pytest.raises(TypeError, match="_poll"):
+            _Watcher(str(tmp_path), ("",), None, 0.1)
+
+    @staticmethod
+    def _open(backend, root, include=None):
+        if backend == "poll":
+            return PollingWatcher(str(root), include=include, debounce_sec=0.05, poll_interval=0.01)
+        return InotifyWatcher(str(root), include=include, debounce_sec=0.05)
+
+    @pytest.mark.parametrize("backend", _BACKENDS)
+    def test_reports_changed_paths_after_quiet(self, tmp_path, backend):
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "skip").mkdir()
+        with self._open(backend, tmp_path, include=lambda rel: not rel.startswith("skip")) as w:
+            assert w.wait(timeout=0.05) is None
+            (tmp_path / "a.txt").write_text("changed")
+            (tmp_path / "skip" / "x").write_text("ignored")
+            (tmp_path / "b.txt").write_text("b")
+            assert w.wait(timeout=2.0) == {"a.txt", "b.txt"}
+            assert w.wait(timeout=0.05) is None
+
+    @pytest.mark.parametrize("backend", _BACKENDS)
+    def test_new_directories_are_watched(self, tmp_path, backend):
+        with self._open(backend, tmp_path) as w:
+            (tmp_path / "pkg").mkdir()
+            w.wait(timeout=0.5)
+            (tmp_path / "pkg" / "new.py").write_text("# new")
+            assert "pkg/new.py" in w.wait(timeout=2.0)
+
+    def test_unknown_backend_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="E_WATCH_BACKEND"):
+            open_watcher(str(tmp_path), backend="kqueue")
+
+
+class TestEventDrivenWatch:
+    def test_dirty_paths_rehash_only_their_components(self, tmp_path, monkeypatch):
+        import udgs_core.anchors as anchors_mod
+
+        eng = _make_test_engine(tmp_path)
+        eng.load_baseline()
+        eng.run_cycle()
+        (tmp_path / "engine" / "stub.py").write_text("# edited")
+        (tmp_path / "engine" / "pkg").mkdir()
+        (tmp_path / "engine" / "pkg" / "new.py").write_text("# new")
+
+        hashed = []
+        real_sha = anchors_mod.sha256_file
+        monkeypatch.setattr(anchors_mod, "sha256_file", lambda p, **kw: hashed.append(p) or real_sha(p, **kw))
+        live = eng._compute_live_hashes(["engine/stub.py", "engine/pkg"])
+        assert sorted(hashed) == [str(tmp_path / "engine" / "pkg" / "new.py"), str(tmp_path / "engine" / "stub.py")]
+        assert live == AutonomousAuditEngine._compute_live_hashes(eng)  # same as a full scan
+        (drift,) = eng.detect_drift(live)
+        assert drift.changed_paths == ["engine/stub.py", "engine/pkg/"]
+
+    @pytest.mark.parametrize("backend", _BACKENDS)
+    def test_watch_events_runs_a_cycle_per_burst(self, tmp_path, backend):
+        eng = _make_test_engine(tmp_path)
+        eng.load_baseline()
+
+        def tamper():
+            import time
+            time.sleep(0.3)
+            (tmp_path / "engine" / "injected.py").write_text("# drift")
+            (tmp_path / "qa8_state" / "noise.json").write_text("{}")  # not watched
+
+        t = threading.Thread(target=tamper)
+        t.start()
+        eng.watch(interval_sec=0.02, max_cycles=2, events=True, debounce_sec=0.05, backend=backend)
+        t.join()
+        status = json.loads((tmp_path / "qa8_state" / "QA8_STATUS.json").read_text())
+        assert status["scan_count"] == 2
+        assert status["mode"] in (Qa8Mode.ALERT, Qa8Mode.HEALED)
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # CLI
 # ═══════════════════════════════════════════════════════════════════════
@@ -532,6 +1164,18 @@ class TestCLI:
         assert r.returncode == 0
         assert len(r.stdout.strip()) == 64
 
+    def test_anchor_merkle_dirty_update(self, tmp_path):
+        d = tmp_path / "tree"
+        (d / "sub").mkdir(parents=True)
+        (d / "sub" / "a.txt").write_text("a")
+        state = str(tmp_path / "merkle.json")
+        first = self._run("anchor", str(d), "--merkle", state)
+        assert first.stdout == self._run("anchor", str(d)).stdout
+        (d / "sub" / "a.txt").write_text("changed")
+        updated = self._run("anchor", str(d), "--merkle", state, "--dirty", "sub/a.txt")
+        assert updated.returncode == 0
+        assert updated.stdout == self._run("anchor", str(d)).stdout != first.stdout
+
     def test_validate_packet_valid(self):
         r = self._run("validate-packet", "system/examples/packet.example.json")
         assert r.returncode == 0
@@ -545,6 +1189,15 @@ class TestCLI:
         r = self._run("validate-packet", "system/examples/packet.invalid.extra_key.json")
         assert r.returncode != 0
 
+    def test_validate_packets_directory(self):
+        r = self._run("validate-packets", "system/examples", "--failures-only")
+        assert r.returncode == 1
+        failed = [json.loads(line) for line in r.stdout.splitlines()]
+        assert sorted(os.path.basename(f["source"]) for f in failed) == [
+            "packet.invalid.anchor_mismatch.json", "packet.invalid.extra_key.json", "packet.invalid.missing_signals.json",
+        ]
+        assert r.stderr.strip() == "1/4 packets valid"
+
     def test_build_system_object(self, tmp_path):
         out = tmp_path / "SO.json"
         r = self._run("build-system-object", "--root", ROOT,
@@ -567,6 +1220,22 @@ class TestCLI:
                        "--out", str(out2))
         assert r1.stdout.strip() == r2.stdout.strip()
 
+    def test_build_system_object_component_hashes_match_per_tree_walks(self):
+        from udgs_core.system_object import build_system_object
+
+        config_path = os.path.join(ROOT, "system/udgs.config.json")
+        with open(config_path, encoding="utf-8") as f:
+            config = json.load(f)
+        obj = build_system_object(ROOT, config_path)
+        for comp in obj.components.values():
+            excludes = {}
+            if comp.path == ".":
+                excludes = {
+                    "exclude_rel_paths": set(config["audit_exclude_rel_paths"]),
+                    "exclude_rel_prefixes": set(config["audit_exclude_rel_prefixes"]),
+                }
+            assert comp.hash == sha256_tree(os.path.join(ROOT, comp.path), **excludes)[0], comp.name
+
     def test_qa8_heal_nominal(self):
         # rebuild system object first so it's consistent
         self._run("build-system-object", "--root", ROOT,